@@ -1,76 +1,99 @@
 import string
-import pyttsx3
-import enchant
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox, simpledialog, font
 import random
-import time
-import threading
+import argparse
+import queue
+from collections import Counter
+from scrabble_lexicon import load_lexicon
+from scrabble_engine import ScrabbleEngine, PlacementError, BOARD_SIZE, CENTER_SQUARE
+from scrabble_scoring import PREMIUM_LAYOUT, PREMIUM_NAMES, tile_value
+from scrabble_ai import BackgroundSearch, MonteCarloPlayer
+from scrabble_words import WordValidator
+from scrabble_anagrams import AnagramIndex
+from speech import SpeechService, PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_URGENT
+from speech_cache import AudioCache
+
+AI_TIME_LIMIT = 0.05  # seconds of move generation per AI turn
+AI_DIFFICULTIES = ('normal', 'hard')  # hard simulates the best moves a few turns ahead
+AI_THINK_TIME = 3.0  # seconds the hard AI may spend simulating
+AI_POLL_INTERVAL = 100  # milliseconds between checks on a running AI search
+HINT_POLL_INTERVAL = 50  # milliseconds between checks on a hint being looked up
+STARTUP_POLL_INTERVAL = 50  # milliseconds between checks on the background dictionary load
+BOARD_CELL_SIZE = 40  # pixels per board square until the window is resized
+BOARD_LETTER_SCALE = 0.45  # letter height as a share of the square
+BLANK_CHOICES_SHOWN = 12  # words listed when a blank tile could make several
+HINT_WORDS = 3  # candidate words a hint names
+
+RULES_TEXT = """Accessible Scrabble Game Rules:
+1. Create words on the board using letters from your rack and letters already on the board.
+2. The first word must cover the center star square.
+3. Subsequent words must connect to existing words on the board.
+4. All formed words must be valid dictionary words.
+5. Score points based on letter values and bonus squares.
+6. To play a word: Enter the word in the box, click 'Prepare Placement', then click the cell on the board where the word starts, and finally enter 'H' or 'V' for direction.
+7. The game ends when all tiles are drawn and one player uses their last tile, or players pass consecutively."""
 
-BOARD_SIZE = 15
-CENTER_SQUARE = (7, 7)
+# Announcements repeated in every game; with an audio cache they are rendered to disk while the voice is idle
+FIXED_ANNOUNCEMENTS = [line.strip() for line in RULES_TEXT.split('\n') if line.strip()] + [
+    "Let me explain the game rules to you. I'll be your AI assistant throughout this Scrabble game.",
+    "It's my turn now. I'm thinking about my move.",
+    "It's your turn now.",
+    "It's not your turn.",
+]
 
 CELL_COLORS = {
     'normal': 'white',
     'center': 'lightblue',
     'placed_player': 'yellow',
     'placed_ai': 'lightgreen',
-    'selected': 'cyan'
+    'selected': 'cyan',
+    'triple_word': 'orangered',
+    'double_word': 'lightpink',
+    'triple_letter': 'royalblue1',
+    'double_letter': 'paleturquoise'
 }
 
 
 class ScrabbleGame:
-    def __init__(self):
-        # Initialize text-to-speech engine
-        self.engine = pyttsx3.init()
-
-        # Configure voice settings - try to find a female voice if available
-        voices = self.engine.getProperty('voices')
-        selected_voice_id = None
-        for voice in voices:
-            if any(keyword in voice.name.lower() for keyword in
-                   ['female', 'zira', 'david', 'mark', 'helen', 'samantha']):
-                selected_voice_id = voice.id
-                break
-        if selected_voice_id:
-            self.engine.setProperty('voice', selected_voice_id)
-
-        # Set speech rate
-        self.engine.setProperty('rate', 170)
-
-        # Initialize speech thread
-        self.speech_thread = threading.Thread(target=self.engine.runAndWait)
-        self.speech_thread.daemon = True
-        self.speech_thread.start()
-
-        # Initialize dictionary
-        try:
-            self.dictionary = enchant.Dict("en_US")
-        except enchant.errors.DictNotFoundError:
-            messagebox.showerror("Dictionary Error", "US English dictionary not found.")
-            self.dictionary = None
-
-        # Initialize game board
-        self.board = [['' for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
-
-        # Initialize letter data and tile bag
-        self.load_letter_data()
-        self.tile_bag = self.initialize_tile_bag()
+    def __init__(self, difficulty='normal', startup_report=False):
+        # Startup is staged so the window comes up at once: the voice search and the
+        # dictionary load run in the background, and play starts when they are ready
+        self.startup_clock = time.perf_counter()
+        self.startup_times = {}  # stage -> seconds since startup began
+        self.startup_report = startup_report
+
+        # Initialize text-to-speech on its own worker thread - try to find a female voice if available
+        # Repeated announcements are played from an on-disk audio cache when simpleaudio is installed
+        self.speech = SpeechService(rate=170, voice_keywords=['female', 'zira', 'david', 'mark', 'helen', 'samantha'],
+                                    cache=AudioCache())
+        self.speech.start()
+        self.speech.prerender(FIXED_ANNOUNCEMENTS)
+
+        # The dictionary, the shared word list (used by the AI and for checking words) and the
+        # headless engine holding the board, tile bag, racks, scores and turn order are loaded
+        # by load_resources() on a background thread; they stay None until poll_startup() gets them
+        self.dictionary = None
+        self.lexicon = None
+        self.validator = None
+        self.anagrams = None  # built in the background after the lexicon; hints fall back to general advice until then
+        self.core = None
+        self.startup_results = queue.Queue()
+        self.playing = False
+
+        # The AI searches on a background thread; the hard AI also simulates on a process pool
+        self.difficulty = difficulty
+        self.simulator = MonteCarloPlayer(time_budget=AI_THINK_TIME) if difficulty == 'hard' else None
+        self.ai_search = None
+        self.hint_results = None  # queue for the hint being looked up on a background thread
 
         # Initialize player data
         self.player_name = ""
-        self.player_score = 0
-        self.ai_score = 0
         self.player_reached_50 = False  # Flag to track if player has reached 50 points
         self.ai_reached_50 = False  # Flag to track if AI has reached 50 points
 
-        # Initialize racks
-        self.player_rack = []
-        self.ai_rack = []
-        self.first_move = True
-        self.game_over = False
-        self.current_turn = "player"
-
         # Initialize placement state
         self.placement_state = 'idle'
         self.current_word_to_place = ""
@@ -86,53 +109,105 @@ class ScrabbleGame:
         self.root.protocol("WM_DELETE_WINDOW", self.quit_game)
 
         self.setup_gui()
+        self.mark_startup('window')
+
+        threading.Thread(target=self.load_resources, daemon=True).start()
 
-    def speak(self, text):
+    def mark_startup(self, stage):
+        """Record how long after launch a startup stage finished"""
+        self.startup_times[stage] = time.perf_counter() - self.startup_clock
+
+    def load_resources(self):
+        """Load the dictionary, the word list and the engine (runs on a background thread)"""
+        # The Tk thread picks the result up in poll_startup(); Tk must not be touched from here
+        try:
+            dictionary = dictionary_error = None
+            try:
+                import enchant
+                dictionary = enchant.Dict("en_US")
+            except ImportError as e:
+                print(f"Warning: enchant is not available ({e}).")
+            except enchant.errors.DictNotFoundError:
+                dictionary_error = "US English dictionary not found."
+            lexicon = load_lexicon()
+            self.startup_results.put((dictionary, dictionary_error, lexicon, ScrabbleEngine(lexicon)))
+        except Exception as e:
+            self.startup_results.put(e)
+            return
+        # Play can start without the anagram index, so it comes last; the Tk thread only reads it
+        try:
+            self.anagrams = AnagramIndex.from_lexicon(lexicon)
+        except Exception as e:
+            print(f"Warning: could not build the anagram index ({e}); hints give general advice.")
+
+    def poll_startup(self):
+        """Pick up the background startup work as it finishes: the voice, and the dictionary and engine"""
+        if 'voice' not in self.startup_times and self.speech.ready.is_set():
+            self.mark_startup('voice')
+            self.report_startup()
+
+        if self.core is None:
+            try:
+                result = self.startup_results.get_nowait()
+            except queue.Empty:
+                result = None
+            if isinstance(result, Exception):
+                messagebox.showerror("Startup Error", f"Could not load the word list: {result}")
+                self.quit_game()
+                return
+            if result is not None:
+                self.dictionary, dictionary_error, self.lexicon, self.core = result
+                self.mark_startup('dictionary')
+                if dictionary_error:
+                    messagebox.showerror("Dictionary Error", dictionary_error)
+                self.validator = WordValidator(self.lexicon, self.dictionary)
+                self.start_play()
+
+        if self.core is None or 'voice' not in self.startup_times:
+            self.root.after(STARTUP_POLL_INTERVAL, self.poll_startup)
+
+    def is_ready(self):
+        """Whether the game can be played yet; tells the player to wait if not"""
+        if self.playing:
+            return True
+        self.speak("I'm still getting the dictionary ready. One moment please.", key='loading')
+        return False
+
+    def start_play(self):
+        """Deal the racks and hand the player the first turn, once the engine and the player's name are ready"""
+        if self.playing or self.core is None or not self.player_name:
+            return
+        self.playing = True
+        self.core.fill_racks()
+        self.update_rack_display()
+        self.update_score_display()
+        self.core.current_turn = "player"
+        if self.simulator is not None:
+            self.simulator.open()  # the workers start up while the player makes the first move
+
+        self.speak(f"Alright {self.player_name}, I've set up the board and your tiles. You'll go first! Try to create meaningful words and score as many points as possible. Good luck!",
+                   PRIORITY_LOW)
+        self.status_label.config(text="Your turn. Enter word and click 'Prepare Placement'")
+        self.mark_startup('playable')
+        self.report_startup()
+
+    def report_startup(self):
+        """Print how long each startup stage took, once all have finished, when asked for on the command line"""
+        if not self.startup_report or not all(stage in self.startup_times for stage in ('voice', 'playable')):
+            return
+        stages = ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in self.startup_times.items())
+        print(f"Startup: {stages}")
+
+    def speak(self, text, priority=PRIORITY_NORMAL, key=None):
         """Function to make the AI speak text"""
-        if text:
-            self.engine.say(text)
-            # This is non-blocking since engine.runAndWait() is in a separate thread
+        # Only queues the text; the speech worker plays it without blocking the UI
+        self.speech.say(text, priority, key)
 
     def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode"""
         is_fullscreen = self.root.attributes('-fullscreen')
         self.root.attributes('-fullscreen', not is_fullscreen)
 
-    def load_letter_data(self):
-        """Load letter distribution and point values"""
-        self.letter_distribution_initial = {
-            'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
-            'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
-            'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1,
-            'Y': 2, 'Z': 1, '*': 2
-        }
-        self.letter_points = {
-            'A': 1, 'B': 3, 'C': 3, 'D': 2, 'E': 1, 'F': 4, 'G': 2, 'H': 4,
-            'I': 1, 'J': 8, 'K': 5, 'L': 1, 'M': 3, 'N': 1, 'O': 1, 'P': 3,
-            'Q': 10, 'R': 1, 'S': 1, 'T': 1, 'U': 1, 'V': 4, 'W': 4, 'X': 8,
-            'Y': 4, 'Z': 10, '*': 0
-        }
-        self.letter_distribution = self.letter_distribution_initial.copy()
-
-    def initialize_tile_bag(self):
-        """Create and shuffle the tile bag"""
-        bag = []
-        for letter, count in self.letter_distribution.items():
-            bag.extend([letter] * count)
-        random.shuffle(bag)
-        return bag
-
-    def draw_tiles(self, count):
-        """Draw tiles from the bag"""
-        drawn_tiles = []
-        for _ in range(count):
-            if self.tile_bag:
-                tile = self.tile_bag.pop()
-                drawn_tiles.append(tile)
-            else:
-                break
-        return drawn_tiles
-
     def setup_gui(self):
         """Set up the game GUI"""
         self.root.grid_rowconfigure(0, weight=1)
@@ -154,28 +229,52 @@ class ScrabbleGame:
 
         board_frame = tk.Frame(game_frame, bg='white')
         board_frame.grid(row=0, column=0, sticky='nsew')
-
-        for i in range(BOARD_SIZE):
-            board_frame.grid_rowconfigure(i, weight=1)
-            board_frame.grid_columnconfigure(i, weight=1)
-
-        self.board_buttons = []
-        board_font = font.Font(family='Arial', size=10, weight='bold')
-
+        board_frame.grid_rowconfigure(0, weight=1)
+        board_frame.grid_columnconfigure(0, weight=1)
+
+        # The board is one canvas with a square and a letter item per cell, so a move
+        # reconfigures only the items of the cells it covers and a resize is one scale call
+        board_pixels = BOARD_SIZE * BOARD_CELL_SIZE
+        self.board_canvas = tk.Canvas(board_frame, width=board_pixels, height=board_pixels, bg='white',
+                                      highlightthickness=2, takefocus=1)
+        self.board_canvas.grid(row=0, column=0, sticky='nsew')
+        self.board_cell_size = BOARD_CELL_SIZE
+        self.board_font = font.Font(family='Arial', size=-int(BOARD_CELL_SIZE * BOARD_LETTER_SCALE), weight='bold')
+
+        self.board_squares = []
+        self.board_letters = []
         for row in range(BOARD_SIZE):
-            row_buttons = []
+            row_squares = []
+            row_letters = []
             for col in range(BOARD_SIZE):
                 bg_color = CELL_COLORS['normal']
                 if (row, col) == CENTER_SQUARE:
                     bg_color = CELL_COLORS['center']
-
-                btn = tk.Button(board_frame, text='',
-                                command=lambda r=row, c=col: self.cell_clicked(r, c),
-                                bg=bg_color, relief=tk.RAISED, borderwidth=1,
-                                font=board_font, width=2, height=1)
-                btn.grid(row=row, column=col, sticky='nsew', padx=0, pady=0)
-                row_buttons.append(btn)
-            self.board_buttons.append(row_buttons)
+                elif PREMIUM_LAYOUT[row][col]:
+                    bg_color = CELL_COLORS[PREMIUM_LAYOUT[row][col]]
+
+                x = col * BOARD_CELL_SIZE
+                y = row * BOARD_CELL_SIZE
+                row_squares.append(self.board_canvas.create_rectangle(
+                    x, y, x + BOARD_CELL_SIZE, y + BOARD_CELL_SIZE, fill=bg_color, outline='gray', tags=('square',)))
+                row_letters.append(self.board_canvas.create_text(
+                    x + BOARD_CELL_SIZE / 2, y + BOARD_CELL_SIZE / 2, text='', font=self.board_font, tags=('letter',)))
+            self.board_squares.append(row_squares)
+            self.board_letters.append(row_letters)
+
+        # Keyboard cursor: Tab to the board, arrow keys move and announce, Enter or Space acts like a click
+        self.board_cursor = CENTER_SQUARE
+        self.board_cursor_item = self.board_canvas.create_rectangle(0, 0, 0, 0, outline='black', width=3,
+                                                                    state=tk.HIDDEN)
+        self.board_canvas.bind('<Button-1>', self.board_clicked)
+        self.board_canvas.bind('<Configure>', self.resize_board)
+        self.board_canvas.bind('<FocusIn>', lambda event: self.move_board_cursor(0, 0))
+        self.board_canvas.bind('<FocusOut>', lambda event: self.board_canvas.itemconfig(self.board_cursor_item,
+                                                                                        state=tk.HIDDEN))
+        for key, (d_row, d_col) in (('<Up>', (-1, 0)), ('<Down>', (1, 0)), ('<Left>', (0, -1)), ('<Right>', (0, 1))):
+            self.board_canvas.bind(key, lambda event, dr=d_row, dc=d_col: self.move_board_cursor(dr, dc))
+        for key in ('<Return>', '<space>'):
+            self.board_canvas.bind(key, lambda event: self.cell_clicked(*self.board_cursor))
 
         control_frame = tk.Frame(game_frame, bg='lightgray')
         control_frame.grid(row=1, column=0, sticky='ew', pady=10, padx=10)
@@ -218,7 +317,7 @@ class ScrabbleGame:
                                      bg='lightgray', font=('Arial', 10))
         self.status_label.grid(row=0, column=0, sticky='w')
 
-        self.score_label = tk.Label(info_frame, text=f"Player Score: {self.player_score} | AI Score: {self.ai_score}",
+        self.score_label = tk.Label(info_frame, text="Player Score: 0 | AI Score: 0",
                                     bg='lightgray', font=('Arial', 12, 'bold'))
         self.score_label.grid(row=1, column=0, sticky='w', pady=(5, 0))
 
@@ -232,27 +331,87 @@ class ScrabbleGame:
                                 padx=15, pady=5)
         quit_button.grid(row=0, column=1, sticky='e', padx=10, pady=5)
 
+    def board_clicked(self, event):
+        """Turn a click on the board canvas into a cell click"""
+        row = int(event.y // self.board_cell_size)
+        col = int(event.x // self.board_cell_size)
+        if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
+            self.board_cursor = (row, col)
+            self.cell_clicked(row, col)
+
+    def resize_board(self, event):
+        """Fit the board to the canvas: one scale of every item and one font change"""
+        cell_size = min(event.width, event.height) / BOARD_SIZE
+        if cell_size <= 0 or cell_size == self.board_cell_size:
+            return
+        factor = cell_size / self.board_cell_size
+        self.board_canvas.scale('all', 0, 0, factor, factor)
+        self.board_font.configure(size=-max(6, int(cell_size * BOARD_LETTER_SCALE)))
+        self.board_cell_size = cell_size
+
+    def move_board_cursor(self, d_row, d_col):
+        """Move the keyboard cursor on the board and announce the cell it lands on"""
+        row = min(max(self.board_cursor[0] + d_row, 0), BOARD_SIZE - 1)
+        col = min(max(self.board_cursor[1] + d_col, 0), BOARD_SIZE - 1)
+        self.board_cursor = (row, col)
+        size = self.board_cell_size
+        self.board_canvas.coords(self.board_cursor_item, col * size, row * size, (col + 1) * size, (row + 1) * size)
+        self.board_canvas.itemconfig(self.board_cursor_item, state=tk.NORMAL)
+        self.board_canvas.tag_raise(self.board_cursor_item)
+        self.speak(self.describe_cell(row, col), key='board_cursor')
+
+    def paint_cell(self, row, col, color, letter=None):
+        """Recolour one board square, and show a letter on it if one is given"""
+        self.board_canvas.itemconfig(self.board_squares[row][col], fill=color)
+        if letter is not None:
+            self.board_canvas.itemconfig(self.board_letters[row][col], text=letter)
+
+    def cell_color(self, row, col):
+        return self.board_canvas.itemcget(self.board_squares[row][col], 'fill')
+
+    def describe_cell(self, row, col):
+        """Spoken description of a board cell"""
+        if self.core is not None and self.core.board.letter(row, col) != '':
+            return f"Cell at row {row + 1}, column {col + 1} contains the letter {self.core.board.letter(row, col)}."
+        premium = PREMIUM_LAYOUT[row][col]
+        if premium:
+            return f"Cell at row {row + 1}, column {col + 1} is empty, {PREMIUM_NAMES[premium]}."
+        return f"Cell at row {row + 1}, column {col + 1} is empty."
+
     def quit_game(self):
         """Handle game quit functionality"""
-        self.game_over = True
+        if self.core is not None:
+            self.core.game_over = True
+            player_score = self.core.scores['player']
+            ai_score = self.core.scores['ai']
+        else:
+            player_score = ai_score = 0  # quit before the dictionary finished loading
 
-        if self.player_score > self.ai_score:
+        if player_score > ai_score:
             winner_message = f"Congratulations, {self.player_name}! You win!"
-        elif self.ai_score > self.player_score:
+        elif ai_score > player_score:
             winner_message = "The AI wins! Better luck next time, human."
         else:
             winner_message = "It's a tie!"
 
-        self.speak(winner_message)
+        # Nothing queued earlier matters any more
+        self.speech.interrupt()
+        self.speak(winner_message, PRIORITY_URGENT)
 
-        final_score_message = f"Final Scores:\n{self.player_name}: {self.player_score}\nAI: {self.ai_score}"
-        self.speak(final_score_message)
+        final_score_message = f"Final Scores:\n{self.player_name}: {player_score}\nAI: {ai_score}"
+        self.speak(final_score_message, PRIORITY_URGENT)
 
-        time.sleep(2)
+        # Abandon an AI search still running so quitting never waits for it
+        if self.ai_search is not None:
+            self.ai_search.cancel()
+            self.ai_search = None
+        if self.simulator is not None:
+            self.simulator.close()
 
         messagebox.showinfo("Game Over", f"{winner_message}\n\n{final_score_message}")
 
         self.root.destroy()
+        self.speech.stop()
 
     def get_player_name(self):
         """Get the player's name"""
@@ -265,15 +424,66 @@ class ScrabbleGame:
 
         # Welcome player with AI voice
         welcome_message = f"Hello, {self.player_name}! Welcome to Accessible Scrabble! I'll be your AI assistant throughout the game."
-        self.speak(welcome_message)
+        self.speak(welcome_message, PRIORITY_LOW)
 
     def get_hint(self):
         """Provide a hint to the player"""
-        if self.current_turn != "player":
+        if not self.is_ready():
+            return
+        if self.core.current_turn != "player":
             self.speak("It's not your turn right now.")
             messagebox.showwarning("Not Your Turn", "It's not your turn to get a hint.")
             return
 
+        if self.anagrams is None:
+            self.give_general_hint()
+            return
+        if self.hint_results is not None:
+            return  # the last hint is still being looked up
+
+        # Anagram lookups with blanks can take a noticeable time, so they run off the Tk thread
+        # and poll_hint() checks back from the Tk loop; the thread is handed the letters it needs
+        through = ''
+        if not self.core.first_move:
+            through = ''.join({self.core.board.letter(r, c).upper()
+                               for r in range(BOARD_SIZE) for c in range(BOARD_SIZE)} - {''})
+        self.hint_results = queue.Queue(maxsize=1)
+        rack_text = ''.join(self.core.racks['player'])
+        threading.Thread(target=self.find_hint_words, args=(rack_text, through, self.hint_results), daemon=True).start()
+        self.root.after(HINT_POLL_INTERVAL, self.poll_hint)
+
+    def find_hint_words(self, rack_text, through, results):
+        """Look up the words a hint names (runs on a background thread)"""
+        try:
+            results.put(self.candidate_words(rack_text, through))
+        except Exception as e:
+            results.put(e)
+
+    def poll_hint(self):
+        """Give the hint once its background lookup has finished"""
+        try:
+            words = self.hint_results.get_nowait()
+        except queue.Empty:
+            self.root.after(HINT_POLL_INTERVAL, self.poll_hint)
+            return
+        self.hint_results = None
+        if isinstance(words, Exception):
+            print(f"Warning: hint lookup failed: {words}")
+            words = []
+        if self.core.game_over or self.core.current_turn != "player":
+            return  # the turn is over, so the hint would be about tiles the player no longer holds
+
+        if words:
+            best = words[:HINT_WORDS]
+            hint = f"Your tiles could make {', '.join(best[:-1])} or {best[-1]}." if len(best) > 1 else \
+                f"Your tiles could make {best[0]}."
+            self.speak(f"Here's a hint: {hint}")
+            messagebox.showinfo("Game Hint", hint)
+        else:
+            self.give_general_hint()
+
+    def give_general_hint(self):
+        """Give one of the general tips, for when no word can be named"""
         hints = [
             "Try to use high-scoring letters like Q, Z, or X.",
             "Look for opportunities to connect to existing words on the board.",
@@ -281,91 +491,95 @@ class ScrabbleGame:
             "Use the special squares like double or triple letter/word scores.",
             "Check if you can form multiple words in one turn by connecting letters in two directions.",
             "Don't be afraid to exchange tiles if you have a bad rack.",
-            f"You have {len(self.tile_bag)} tiles left in the bag."
+            f"You have {len(self.core.tile_bag)} tiles left in the bag."
         ]
         hint = random.choice(hints)
 
         self.speak(f"Here's a hint: {hint}")
         messagebox.showinfo("Game Hint", hint)
 
+    def candidate_words(self, rack_text, through=''):
+        """Words a rack can make alone or through one of the `through` letters on the board, highest face value first"""
+        words = self.anagrams.find(rack_text, through=through)
+
+        # Letters a blank stands in for score nothing, so only the tiles really held count
+        held = Counter(rack_text.upper() + through)
+
+        def face_value(word):
+            return sum(tile_value(letter) * min(word.count(letter), held[letter]) for letter in set(word))
+
+        return sorted(words, key=lambda word: (-face_value(word), word))
+
     def ai_move(self):
         """Handle AI's turn"""
-        if self.game_over or self.current_turn != "ai":
+        if self.core.game_over or self.core.current_turn != "ai":
             return
 
         self.speak("It's my turn now. I'm thinking about my move.")
 
-        possible_words = ["CAT", "DOG", "PLAY", "GAME", "WORD", "HOUSE", "CAR", "BOOK", "FUN", "SCRABBLE", "TILE",
-                          "BOARD", "SCORE", "HINT"]
-        random.shuffle(possible_words)
-
-        placed_word = None
-        placed_row = -1
-        placed_col = -1
-        placed_direction = ''
-        ai_word_score = 0
+        # Search off the Tk thread and check back from the Tk loop until the move arrives
+        self.ai_search = BackgroundSearch(self.core, AI_TIME_LIMIT, self.simulator).start()
+        self.root.after(AI_POLL_INTERVAL, self.poll_ai_search)
 
-        potential_starts = []
-        if self.first_move:
-            potential_starts = [(CENTER_SQUARE[0], CENTER_SQUARE[1])]
-        else:
-            occupied_cells = [(r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE) if self.board[r][c] != '']
-            for er, ec in occupied_cells:
-                potential_starts.append((er, ec))
-                if er > 0 and self.board[er - 1][ec] == '': potential_starts.append((er - 1, ec))
-                if er < BOARD_SIZE - 1 and self.board[er + 1][ec] == '': potential_starts.append((er + 1, ec))
-                if ec > 0 and self.board[er][ec - 1] == '': potential_starts.append((er, ec - 1))
-                if ec < BOARD_SIZE - 1 and self.board[er][ec + 1] == '': potential_starts.append((er, ec + 1))
-
-            potential_starts = list(set(potential_starts))
-            random.shuffle(potential_starts)
-
-        for word in possible_words:
-            for start_row, start_col in potential_starts:
-                if self.is_valid_placement(word, start_row, start_col, 'H', is_player=False):
-                    placed_word = word
-                    placed_row = start_row
-                    placed_col = start_col
-                    placed_direction = 'H'
-                    break
-                if self.is_valid_placement(word, start_row, start_col, 'V', is_player=False):
-                    placed_word = word
-                    placed_row = start_row
-                    placed_col = start_col
-                    placed_direction = 'V'
-                    break
-            if placed_word:
-                break
-
-        if placed_word:
-            self.update_board_with_word(placed_word, placed_row, placed_col, placed_direction, is_player=False)
-
-            ai_word_score = sum(self.letter_points.get(letter, 0) for letter in placed_word)
-            self.ai_score += ai_word_score
+    def poll_ai_search(self):
+        """Play the AI's move once its background search has finished"""
+        if self.ai_search is None or self.core.game_over:
+            return
+        try:
+            best_move = self.ai_search.results.get_nowait()
+        except queue.Empty:
+            self.root.after(AI_POLL_INTERVAL, self.poll_ai_search)
+            return
+        self.ai_search = None
+        if isinstance(best_move, Exception):
+            print(f"Warning: AI move search failed: {best_move}")
+            best_move = None
+        self.finish_ai_move(best_move)
+
+    def finish_ai_move(self, best_move):
+        """Play the AI's chosen move, or pass when it has none"""
+        if best_move is not None:
+            turn = self.core.apply(best_move)
+            placed_word = best_move.word
+            ai_word_score = turn.score
+            ai_score = self.core.scores['ai']
+
+            self.update_board_with_word(placed_word, best_move.row, best_move.col, best_move.direction,
+                                        is_player=False)
 
             # Check if AI has reached 50 points milestone
-            if not self.ai_reached_50 and self.ai_score >= 50:
+            if not self.ai_reached_50 and ai_score >= 50:
                 self.ai_reached_50 = True
                 self.root.after(1000, lambda: self.speak(
                     f"I've reached 50 points! I'm doing well, but the game is still on!"))
 
-            self.score_label.config(text=f"{self.player_name} Score: {self.player_score} | AI Score: {self.ai_score}")
+            self.update_score_display()
 
             self.root.after(500, lambda: self.speak(f"I placed the word {placed_word} for {ai_word_score} points."))
-            self.root.after(1500, lambda: self.speak(f"My score is now {self.ai_score}."))
+            self.root.after(1500, lambda: self.speak(f"My score is now {ai_score}.", key='ai_score'))
 
-            self.first_move = False
+            if self.core.game_over:
+                self.root.after(2500, lambda: self.speak("I used all my tiles! The game is over."))
+                self.root.after(4000, self.quit_game)
+                return
 
         else:
+            self.core.pass_turn()
             self.root.after(1000, lambda: self.speak("Hmm, I couldn't find a good word this turn."))
 
-        self.current_turn = "player"
         self.status_label.config(text="Your turn. Enter word and click 'Prepare Placement'")
         self.speak("It's your turn now.")
 
+    def update_score_display(self):
+        """Show both scores in the score label"""
+        self.score_label.config(
+            text=f"{self.player_name} Score: {self.core.scores['player']} | AI Score: {self.core.scores['ai']}")
+
     def prepare_word_placement(self):
         """Prepare to place a word on the board"""
-        if self.current_turn != "player":
+        if not self.is_ready():
+            return
+        if self.core.current_turn != "player":
             self.speak("It's not your turn right now.")
             messagebox.showwarning("Not Your Turn", "It's not your turn.")
             return
@@ -382,30 +596,70 @@ class ScrabbleGame:
             messagebox.showerror("Invalid Characters", "Words can only contain letters A-Z or a blank tile (*).")
             return
 
-        if self.dictionary:
-            word_for_dict_check = word.replace('*', 'A').lower()
-            if not self.dictionary.check(word_for_dict_check):
-                self.speak("Oops! That word is not in the dictionary.")
-                messagebox.showerror("Invalid Word", f"'{word}' is not in the dictionary")
+        if '*' in word:
+            word = self.choose_blank_letters(word)
+            if word is None:
                 return
+        elif not self.validator.is_word(word):
+            self.speak("Oops! That word is not in the dictionary.")
+            messagebox.showerror("Invalid Word", f"'{word}' is not in the dictionary")
+            return
 
         self.current_word_to_place = word
         self.placement_state = 'selecting_start'
         self.status_label.config(text=f"Click the board cell where '{word}' should start.")
         self.speak(f"Okay, you want to play '{word}'. Now click on the board where the word should start.")
 
+    def choose_blank_letters(self, pattern):
+        """Settle which letter each blank (*) in a typed word stands for; None if there is no such word"""
+        matches = self.validator.expand(pattern)
+        if not matches:
+            self.speak("Oops! No word in the dictionary fits those letters and blanks.")
+            messagebox.showerror("Invalid Word", f"No word in the dictionary fits '{pattern}'")
+            return None
+
+        if len(matches) == 1:
+            choice = matches[0]
+        else:
+            shown = ", ".join(matches[:BLANK_CHOICES_SHOWN])
+            more = " ..." if len(matches) > BLANK_CHOICES_SHOWN else ""
+            self.speak(f"Your blank tile could make {len(matches)} words, such as {shown}. Type the word you mean.")
+            answer = simpledialog.askstring("Blank Tile", f"'{pattern}' could be: {shown}{more}\nType the word you mean:",
+                                            parent=self.root)
+            if answer is None:
+                self.speak("Placement cancelled.")
+                return None
+            choice = answer.strip().upper()
+            if choice not in matches:
+                self.speak(f"{choice} does not fit {pattern}. Please try again.")
+                messagebox.showerror("Invalid Word", f"'{choice}' does not fit '{pattern}'")
+                return None
+
+        # Blanks are lower-case letters from here on, as the engine and the board show them
+        return ''.join(letter.lower() if typed == '*' else letter for typed, letter in zip(pattern, choice))
+
     def cell_clicked(self, row, col):
         """Handle board cell click"""
-        if self.current_turn != "player":
+        if not self.is_ready():
+            return
+        if self.core.current_turn != "player":
             self.speak("It's not your turn.")
             return
 
         if self.placement_state == 'selecting_start':
-            if self.board[row][col] != '':
+            if self.core.board.letter(row, col) != '':
                 first_letter_needed = self.current_word_to_place[0]
-                existing_letter = self.board[row][col].upper()
+                existing_letter = self.core.board.letter(row, col).upper()
 
-                if existing_letter != first_letter_needed and first_letter_needed != '*':
+                if first_letter_needed.islower():
+                    # A lower-case letter is a blank, which is a new tile and needs an empty square
+                    self.speak(
+                        f"Your word starts with a blank tile, and a blank can't go on row {row + 1}, column {col + 1} because a tile is already there. Please choose an empty starting cell.")
+                    messagebox.showwarning("Placement Error",
+                                           f"A blank tile can't be placed on the occupied square at ({row + 1},{col + 1}).")
+                    self.reset_placement_state()
+                    return
+                if existing_letter != first_letter_needed:
                     self.speak(
                         f"The first letter of your word, '{first_letter_needed}', does not match the letter already on the board at row {row + 1}, column {col + 1}, which is '{existing_letter}'. Please choose a different starting cell or word.")
                     messagebox.showwarning("Placement Error",
@@ -417,8 +671,8 @@ class ScrabbleGame:
             self.current_start_col = col
             self.placement_state = 'awaiting_direction'
 
-            self._original_cell_color = self.board_buttons[row][col].cget('bg')
-            self.board_buttons[row][col].config(bg=CELL_COLORS['selected'])
+            self._original_cell_color = self.cell_color(row, col)
+            self.paint_cell(row, col, CELL_COLORS['selected'])
 
             self.status_label.config(
                 text=f"Starting at ({row + 1},{col + 1}). Is '{self.current_word_to_place}' horizontal (H) or vertical (V)?")
@@ -431,10 +685,7 @@ class ScrabbleGame:
             self.speak("Please specify horizontal or vertical placement first.")
 
         elif self.placement_state == 'idle':
-            if self.board[row][col] != '':
-                self.speak(f"Cell at row {row + 1}, column {col + 1} contains the letter {self.board[row][col]}.")
-            else:
-                self.speak(f"Cell at row {row + 1}, column {col + 1} is empty.")
+            self.speak(self.describe_cell(row, col))
 
     def ask_direction(self):
         """Ask for word placement direction"""
@@ -444,7 +695,7 @@ class ScrabbleGame:
 
         if self.current_start_row is not None and self.current_start_col is not None and hasattr(self,
                                                                                                  '_original_cell_color') and self._original_cell_color is not None:
-            self.board_buttons[self.current_start_row][self.current_start_col].config(bg=self._original_cell_color)
+            self.paint_cell(self.current_start_row, self.current_start_col, self._original_cell_color)
 
         if direction is None:
             self.speak("Placement cancelled.")
@@ -468,196 +719,83 @@ class ScrabbleGame:
         """Try to place a player's word on the board"""
         if self.current_start_row is not None and self.current_start_col is not None and hasattr(self,
                                                                                                  '_original_cell_color') and self._original_cell_color is not None:
-            self.board_buttons[self.current_start_row][self.current_start_col].config(bg=self._original_cell_color)
+            self.paint_cell(self.current_start_row, self.current_start_col, self._original_cell_color)
 
         self.speak(
             f"Attempting to place '{word}' at row {start_row + 1}, column {start_col + 1}, direction {direction}.")
 
-        word_length = len(word)
-        placed_letters_info = []
-
-        has_new_tile = False
-        lands_on_existing_letter_correctly = False
-
-        for i in range(word_length):
-            r = start_row + (i if direction == 'V' else 0)
-            c = start_col + (i if direction == 'H' else 0)
-
-            if r < 0 or r >= BOARD_SIZE or c < 0 or c >= BOARD_SIZE:
-                self.speak("Word goes off the board.")
-                messagebox.showerror("Placement Error", "Word goes off the board.")
-                self.reset_placement_state()
-                return False
-
-            letter_needed = word[i]
-            existing_letter = self.board[r][c].upper()
-
-            if existing_letter != '':
-                if letter_needed == '*' or existing_letter != letter_needed:
-                    self.speak(
-                        f"Cannot place '{letter_needed}' at row {r + 1}, column {c + 1} because cell is occupied with '{existing_letter}' and letters must match or the cell must be empty for a blank tile.")
-                    messagebox.showerror("Placement Error",
-                                         f"Cannot place '{letter_needed}' at ({r + 1},{c + 1}). Cell is occupied with '{existing_letter}'.")
-                    self.reset_placement_state()
-                    return False
-                placed_letters_info.append({'letter': existing_letter, 'row': r, 'col': c, 'is_new': False})
-                lands_on_existing_letter_correctly = True
-            else:
-                placed_letters_info.append({'letter': letter_needed, 'row': r, 'col': c, 'is_new': True})
-                has_new_tile = True
-
-        if word_length < 2:
-            self.speak("Word must be at least two letters long.")
-            messagebox.showerror("Placement Error", "Word must be at least two letters long.")
-            self.reset_placement_state()
-            return False
-
-        if self.first_move:
-            uses_center = any((l['row'], l['col']) == CENTER_SQUARE for l in placed_letters_info)
-            if not uses_center:
-                self.speak("The first word must cover the center star square.")
-                messagebox.showerror("Placement Error", "First word must cover the center square.")
-                self.reset_placement_state()
-                return False
-        else:
-            connected_by_adjacency = False
-            for l in placed_letters_info:
-                r, c = l['row'], l['col']
-
-                if l['is_new']:
-                    if direction == 'H':
-                        if (r > 0 and self.board[r - 1][c] != '') or \
-                                (r < BOARD_SIZE - 1 and self.board[r + 1][c] != ''):
-                            connected_by_adjacency = True
-                    elif direction == 'V':
-                        if (c > 0 and self.board[r][c - 1] != '') or \
-                                (c < BOARD_SIZE - 1 and self.board[r][c + 1] != ''):
-                            connected_by_adjacency = True
-                if connected_by_adjacency:
-                    break
-
-            if not lands_on_existing_letter_correctly and not connected_by_adjacency:
-                self.speak("The word must connect to an existing word on the board.")
-                messagebox.showerror("Placement Error", "Word must connect to an existing word.")
-                self.reset_placement_state()
-                return False
-
-        temp_rack = list(self.player_rack)
-        letters_from_rack_needed = [l['letter'] for l in placed_letters_info if l['is_new']]
-        letters_actually_removed_from_rack = []
-
-        can_supply_letters = True
-        for letter_needed in letters_from_rack_needed:
-            if letter_needed != '*' and letter_needed in temp_rack:
-                temp_rack.remove(letter_needed)
-                letters_actually_removed_from_rack.append(letter_needed)
-            elif '*' in temp_rack:
-                temp_rack.remove('*')
-                letters_actually_removed_from_rack.append('*')
-            else:
-                can_supply_letters = False
-                break
-
-        if not can_supply_letters:
-            self.speak(f"You do not have the required letters in your rack to play '{word}'.")
-            messagebox.showerror("Placement Error",
-                                 f"You do not have the required letters in your rack or a blank tile to play '{word}'.")
+        try:
+            move = self.core.build_move(word, start_row, start_col, direction)
+        except PlacementError as e:
+            self.speak(e.spoken)
+            messagebox.showerror("Placement Error", str(e))
             self.reset_placement_state()
             return False
 
-        if not has_new_tile:
-            self.speak("Your word must use at least one new tile from your rack.")
-            messagebox.showerror("Placement Error", "Your word must use at least one new tile from your rack.")
+        # The main word may run on into tiles already on the board, and every new tile may form a cross word
+        invalid_words = self.validator.invalid_words(self.core.words_formed(move))
+        if invalid_words:
+            listed = ", ".join(invalid_words)
+            self.speak(f"Oops! That play would make {listed}, which is not in the dictionary.")
+            messagebox.showerror("Invalid Word", f"This play forms words not in the dictionary: {listed}")
             self.reset_placement_state()
             return False
 
-        for letter_info in placed_letters_info:
-            r, c, letter, is_new = letter_info['row'], letter_info['col'], letter_info['letter'], letter_info['is_new']
-            if is_new:
-                self.board[r][c] = letter.upper()
-                self.board_buttons[r][c].config(
-                    text=self.board[r][c],
-                    bg=CELL_COLORS['placed_player'],
-                    disabledforeground='black',
-                    state=tk.DISABLED
-                )
-
-        word_score = 0
-        for letter in word:
-            word_score += self.letter_points.get(letter, 0)
+        turn = self.core.apply(move)
+        word_score = turn.score
+        player_score = self.core.scores['player']
 
-        self.player_score += word_score
+        for r, c, _, _ in move.tiles:
+            self.paint_cell(r, c, CELL_COLORS['placed_player'], self.core.board.letter(r, c))
 
         # Check if player has reached 50 points milestone
-        if not self.player_reached_50 and self.player_score >= 50:
+        if not self.player_reached_50 and player_score >= 50:
             self.player_reached_50 = True
             congratulation_message = f"Wow, {self.player_name}! You've reached 50 points! Excellent playing!"
             self.speak(congratulation_message)
             messagebox.showinfo("Achievement", congratulation_message)
 
-        self.score_label.config(text=f"{self.player_name} Score: {self.player_score} | AI Score: {self.ai_score}")
+        self.update_score_display()
 
-        for letter_removed in letters_actually_removed_from_rack:
-            try:
-                self.player_rack.remove(letter_removed)
-            except ValueError:
-                print(f"Error removing letter {letter_removed} from rack. Rack: {self.player_rack}")
-
-        tiles_to_draw_count = len(letters_actually_removed_from_rack)
-        if tiles_to_draw_count > 0:
-            new_tiles = self.draw_tiles(tiles_to_draw_count)
-            self.player_rack.extend(new_tiles)
-            self.speak(f"You drew {len(new_tiles)} new tiles.")
-
-        if not self.player_rack and not self.tile_bag:
-            self.game_over = True
+        if turn.drawn:
+            self.speak(f"You drew {len(turn.drawn)} new tiles.")
+
+        if self.core.game_over:
             self.speak("You used all your tiles! The game is over.")
             self.root.after(2000, self.quit_game)
 
         self.update_rack_display()
 
         self.speak(f"You played '{word}' for {word_score} points.")
-        self.speak(f"Your score is now {self.player_score}.")
+        self.speak(f"Your score is now {player_score}.", key='player_score')
 
         self.word_entry.delete(0, tk.END)
 
-        self.first_move = False
-
         self.reset_placement_state()
         self.status_label.config(text="Your turn ended. Waiting for AI...")
 
-        if not self.game_over:
-            self.current_turn = "ai"
+        if not self.core.game_over:
             self.root.after(2000, self.ai_move)
 
         return True
 
     def update_board_with_word(self, word, start_row, start_col, direction, is_player=True):
-        """Update the board with a placed word"""
+        """Show a placed word's squares from the engine board"""
         place_color = CELL_COLORS['placed_player'] if is_player else CELL_COLORS['placed_ai']
 
         for i in range(len(word)):
             r = start_row + (i if direction == 'V' else 0)
             c = start_col + (i if direction == 'H' else 0)
-            letter = word[i]
 
-            if self.board[r][c] == '':
-                self.board[r][c] = letter.upper()
-
-            self.board_buttons[r][c].config(
-                text=self.board[r][c],
-                bg=place_color,
-                disabledforeground='black',
-                state=tk.DISABLED
-            )
+            self.paint_cell(r, c, place_color, self.core.board.letter(r, c))
 
     def reset_placement_state(self):
         """Reset the word placement state"""
         if self.placement_state == 'awaiting_direction' and self.current_start_row is not None and self.current_start_col is not None and hasattr(
                 self, '_original_cell_color') and self._original_cell_color is not None:
             r, c = self.current_start_row, self.current_start_col
-            if self.board[r][c] == '':
-                self.board_buttons[r][c].config(bg=self._original_cell_color)
+            if self.core.board.letter(r, c) == '':
+                self.paint_cell(r, c, self._original_cell_color)
 
         if hasattr(self, '_original_cell_color'):
             self._original_cell_color = None
@@ -667,141 +805,60 @@ class ScrabbleGame:
         self.current_start_row = None
         self.current_start_col = None
 
-    def is_valid_placement(self, word, start_row, start_col, direction, is_player):
-        """Check if word placement is valid"""
-        word_length = len(word)
-        if word_length < 2:
-            return False
-
-        has_new_tile = False
-        lands_on_existing_letter_correctly = False
-
-        for i in range(word_length):
-            r = start_row + (i if direction == 'V' else 0)
-            c = start_col + (i if direction == 'H' else 0)
-
-            if r < 0 or r >= BOARD_SIZE or c < 0 or c >= BOARD_SIZE:
-                return False
-
-            letter_needed = word[i]
-            existing_letter = self.board[r][c].upper()
-
-            if existing_letter != '':
-                if letter_needed == '*' or existing_letter != letter_needed:
-                    return False
-                lands_on_existing_letter_correctly = True
-            else:
-                has_new_tile = True
-
-        if self.first_move:
-            uses_center = False
-            for i in range(word_length):
-                r = start_row + (i if direction == 'V' else 0)
-                c = start_col + (i if direction == 'H' else 0)
-                if (r, c) == CENTER_SQUARE:
-                    uses_center = True
-                    break
-            if not uses_center:
-                return False
-        else:
-            connected_by_adjacency = False
-            for i in range(word_length):
-                r = start_row + (i if direction == 'V' else 0)
-                c = start_col + (i if direction == 'H' else 0)
-
-                if self.board[r][c] == '':
-                    if direction == 'H':
-                        if (r > 0 and self.board[r - 1][c] != '') or \
-                                (r < BOARD_SIZE - 1 and self.board[r + 1][c] != ''):
-                            connected_by_adjacency = True
-                    elif direction == 'V':
-                        if (c > 0 and self.board[r][c - 1] != '') or \
-                                (c < BOARD_SIZE - 1 and self.board[r][c + 1] != ''):
-                            connected_by_adjacency = True
-                if connected_by_adjacency:
-                    break
-
-            if not lands_on_existing_letter_correctly and not connected_by_adjacency:
-                return False
-
-        if not has_new_tile:
-            return False
-
-        return True
-
     def run(self):
         """Run the game"""
+        # The dictionary keeps loading while the player types their name and reads the rules
+        self.status_label.config(text="Loading the dictionary...")
+        self.root.after(STARTUP_POLL_INTERVAL, self.poll_startup)
         self.get_player_name()
 
-        # Add a short delay, then display rules with AI voice
-        self.root.after(1000, self.display_rules)
-
-        self.fill_racks()
-        self.update_rack_display()
-
-        self.current_turn = "player"
-        rule_line_count = 7
-        speak_delay_estimate = 2000 + rule_line_count * 2000 + 1000
-
-        # Enhanced starting message with AI personality
-        self.root.after(speak_delay_estimate, lambda: self.speak(
-            f"Alright {self.player_name}, I've set up the board and your tiles. You'll go first! Try to create meaningful words and score as many points as possible. Good luck!"))
-        self.root.after(speak_delay_estimate + 500,
-                        lambda: self.status_label.config(text="Your turn. Enter word and click 'Prepare Placement'"))
+        # The speech worker speaks queued announcements in order, so the rules are queued
+        # before play starts, and play starts as soon as everything is loaded without
+        # waiting for them to be spoken or for the rules window to be closed
+        self.display_rules()
+        self.start_play()
 
         self.root.mainloop()
 
-    def fill_racks(self):
-        """Fill player and AI racks with tiles"""
-        tiles_to_draw_player = 7 - len(self.player_rack)
-        if tiles_to_draw_player > 0:
-            new_tiles = self.draw_tiles(tiles_to_draw_player)
-            self.player_rack.extend(new_tiles)
-
-        tiles_to_draw_ai = 7 - len(self.ai_rack)
-        if tiles_to_draw_ai > 0:
-            new_tiles_ai = self.draw_tiles(tiles_to_draw_ai)
-            self.ai_rack.extend(new_tiles_ai)
-
     def update_rack_display(self):
         """Update the display of player's rack"""
         for btn in self.rack_buttons:
             btn.config(state=tk.NORMAL, text='')
 
         for i, btn in enumerate(self.rack_buttons):
-            if i < len(self.player_rack):
-                btn.config(text=self.player_rack[i])
+            if i < len(self.core.racks['player']):
+                btn.config(text=self.core.racks['player'][i])
             else:
                 btn.config(text=' ')
 
     def display_rules(self):
         """Display and speak the game rules"""
-        rules_text = """Accessible Scrabble Game Rules:
-1. Create words on the board using letters from your rack and letters already on the board.
-2. The first word must cover the center star square.
-3. Subsequent words must connect to existing words on the board.
-4. All formed words must be valid dictionary words.
-5. Score points based on letter values and bonus squares.
-6. To play a word: Enter the word in the box, click 'Prepare Placement', then click the cell on the board where the word starts, and finally enter 'H' or 'V' for direction.
-7. The game ends when all tiles are drawn and one player uses their last tile, or players pass consecutively."""
+        rules_text = RULES_TEXT
 
-        self.speak("Let me explain the game rules to you. I'll be your AI assistant throughout this Scrabble game.")
+        # The introduction is spoken at low priority, so moves and scores announced
+        # while it is still queued are spoken first and are never the ones dropped
+        self.speak("Let me explain the game rules to you. I'll be your AI assistant throughout this Scrabble game.", PRIORITY_LOW)
         rule_lines = rules_text.strip().split('\n')
-        delay = 2000
         for line in rule_lines:
             if line.strip():
-                self.root.after(delay, lambda l=line.strip(): self.speak(l))
-                delay += 2000
+                self.speak(line.strip(), PRIORITY_LOW)
 
         # Add an encouraging message after the rules
-        self.root.after(delay, lambda: self.speak(
-            f"Don't worry if you forget any rules - I'm here to help! When you reach 50 points, I'll give you a special congratulation. If you need to end the game early, just click the Quit button. Enjoy playing, {self.player_name}!"))
+        self.speak(f"Don't worry if you forget any rules - I'm here to help! When you reach 50 points, I'll give you a special congratulation. If you need to end the game early, just click the Quit button. Enjoy playing, {self.player_name}!",
+                   PRIORITY_LOW)
 
-        messagebox.showinfo("Game Rules", rules_text)
+        self.root.after_idle(lambda: messagebox.showinfo("Game Rules", rules_text))
 
 
 def main():
-    game = ScrabbleGame()
+    parser = argparse.ArgumentParser(description="Accessible Scrabble against a speaking AI.")
+    parser.add_argument('--difficulty', choices=AI_DIFFICULTIES, default='normal',
+                        help="how hard the AI plays")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="print how long each startup stage took")
+    args = parser.parse_args()
+
+    game = ScrabbleGame(args.difficulty, args.startup_report)
     game.run()
 
 
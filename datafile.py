@@ -0,0 +1,31 @@
+"""Reading and writing the binary data files (lexicon, leave table, puzzle bank)"""
+import mmap
+import os
+
+
+def write_atomically(path, chunks):
+    """Write byte strings to `path` through a temporary file and a rename,
+    so a process loading the file never sees half of it"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(temp_path, path)
+
+
+def map_file(path, header, magic, version, description, data_size):
+    """Memory-map a data file whose struct `header` starts with a magic string and a version.
+
+    `data_size(*fields)` gives how many bytes the rest of the header says
+    follow it. Returns (mapped, fields) with the fields after the magic and
+    version; a file that is too short or of another kind raises ValueError
+    naming `description`, and is not left mapped.
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    fields = header.unpack_from(mapped, 0) if len(mapped) >= header.size else None
+    if (fields is None or fields[0] != magic or fields[1] != version
+            or len(mapped) < header.size + data_size(*fields[2:])):
+        mapped.close()
+        raise ValueError(f"{path} is not {description}")
+    return mapped, fields[2:]
@@ -0,0 +1,10 @@
+"""Nearest-rank percentiles for the timing reports of the benchmark CLIs"""
+import math
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
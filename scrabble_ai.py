@@ -0,0 +1,278 @@
+import heapq
+import multiprocessing
+import queue
+import random
+import threading
+import time
+
+from scrabble_movegen import BLANK
+from scrabble_leaves import default_leave_table
+
+SIM_TIME_BUDGET = 3.0  # wall-clock seconds of simulation per turn
+SIM_CANDIDATES = 8  # moves with the best score plus leave that get simulated
+SIM_PLIES = 2  # turns simulated after the candidate: the opponent's reply, then ours
+SIM_PLY_TIME_LIMIT = 0.05  # move generation budget of each simulated turn
+SIM_GRACE = 0.5  # extra seconds allowed for the pool to hand back its results
+CANCEL_CHECK_INTERVAL = 0.05  # seconds between cancellation checks while waiting on the pool
+# Simulation workers start as fresh interpreters: forking a GUI whose speech, loading and
+# search threads may be holding locks can leave a worker stuck on a lock nobody will release
+SIM_START_METHOD = 'spawn'
+
+
+def rack_leave(rack, move):
+    """Tiles left on the rack after playing a move"""
+    leave = list(rack)
+    for _, _, letter, is_blank in move.tiles:
+        leave.remove(BLANK if is_blank else letter)
+    return leave
+
+
+def choose_highest_score(engine, moves):
+    """Greedy policy: the move worth the most points right now"""
+    return max(moves, key=engine.score_move) if moves else None
+
+
+def choose_with_leave(engine, moves, leaves=None):
+    """Score plus the value of the tiles kept, looked up in the rack-leave table.
+
+    While the bag is empty the leave has no future, so only the score counts.
+    """
+    if not moves:
+        return None
+    if not engine.tile_bag:
+        return choose_highest_score(engine, moves)
+
+    return max(moves, key=_equity(engine, leaves or default_leave_table()))
+
+
+def _equity(engine, leaves):
+    """Score plus leave value of a move for the current player"""
+    rack = engine.racks[engine.current_turn]
+    leave_values = {}  # tiles used -> leave value; a rack only has a few distinct leaves
+
+    def equity(move):
+        used = ''.join(sorted(BLANK if is_blank else letter for _, _, letter, is_blank in move.tiles))
+        value = leave_values.get(used)
+        if value is None:
+            value = leave_values[used] = leaves.value(rack_leave(rack, move))
+        return engine.score_move(move) + value
+
+    return equity
+
+
+def top_candidates(engine, moves, count=SIM_CANDIDATES, leaves=None):
+    """The `count` moves with the best score plus leave, best first"""
+    if not engine.tile_bag:
+        return heapq.nlargest(count, moves, key=engine.score_move)
+    return heapq.nlargest(count, moves, key=_equity(engine, leaves or default_leave_table()))
+
+
+def simulate_move(engine, move, rng, plies=SIM_PLIES, ply_time_limit=SIM_PLY_TIME_LIMIT, leaves=None):
+    """Play `move` and then `plies` more turns against one guess at the hidden tiles.
+
+    The opponent's rack is redrawn at random from the tiles the mover cannot
+    see (the bag plus that rack), and the following turns are chosen by
+    choose_with_leave. Returns the mover's points minus the opponent's over
+    those turns, plus the value of the tiles the mover keeps at the end.
+    """
+    leaves = leaves or default_leave_table()
+    sim = engine.copy()
+    me = sim.current_turn
+    opponent = sim.other_player(me)
+    unseen = sim.tile_bag + sim.racks[opponent]
+    rng.shuffle(unseen)
+    hand = len(sim.racks[opponent])
+    sim.racks[opponent] = unseen[:hand]
+    sim.tile_bag = unseen[hand:]
+
+    spread = 0
+    leave_value = 0.0
+    for ply in range(plies + 1):
+        if sim.game_over:
+            break
+        player = sim.current_turn
+        choice = move if ply == 0 else choose_with_leave(sim, sim.legal_moves(time_limit=ply_time_limit), leaves)
+        if choice is None:
+            sim.pass_turn()
+            continue
+        turn = sim.apply(choice)
+        if player == me:
+            spread += turn.score
+            leave_value = leaves.value(rack_leave(turn.rack_before, choice)) if sim.tile_bag else 0.0
+        else:
+            spread -= turn.score
+    return spread + leave_value
+
+
+def _simulate_batch(task):
+    """Simulate every candidate in turn until the budget runs out; returns (totals, counts)"""
+    engine, candidates, plies, ply_time_limit, budget, seed = task
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + budget
+    totals = [0.0] * len(candidates)
+    counts = [0] * len(candidates)
+    while time.perf_counter() < deadline:
+        for i, move in enumerate(candidates):
+            if time.perf_counter() >= deadline:
+                break
+            totals[i] += simulate_move(engine, move, rng, plies, ply_time_limit)
+            counts[i] += 1
+    return totals, counts
+
+
+class SimulationSearch:
+    """A running MonteCarloPlayer search; poll ready() and then call result()"""
+
+    def __init__(self, candidates, batches=None, pending=None, deadline=None):
+        self.candidates = candidates
+        self._batches = batches
+        self._pending = pending
+        self._deadline = deadline
+
+    def ready(self):
+        if self._pending is None:
+            return True
+        return self._pending.ready() or time.perf_counter() >= self._deadline
+
+    def result(self):
+        """The candidate with the best mean simulated value, waiting for the pool if needed"""
+        if not self.candidates:
+            return None
+        if self._batches is None and self._pending is not None:
+            try:
+                self._batches = self._pending.get(max(0.0, self._deadline - time.perf_counter()))
+            except multiprocessing.TimeoutError:
+                self._batches = []  # the workers overran the budget; fall back to the static ranking
+            self._pending = None
+
+        totals = [0.0] * len(self.candidates)
+        counts = [0] * len(self.candidates)
+        for batch_totals, batch_counts in self._batches or ():
+            for i in range(len(self.candidates)):
+                totals[i] += batch_totals[i]
+                counts[i] += batch_counts[i]
+        sampled = [i for i in range(len(self.candidates)) if counts[i]]
+        if not sampled:
+            return self.candidates[0]
+        return self.candidates[max(sampled, key=lambda i: totals[i] / counts[i])]
+
+
+class MonteCarloPlayer:
+    """Stronger move choice: simulate the most promising moves a couple of turns ahead.
+
+    The top candidates by score plus leave are each played out many times
+    against random guesses at the opponent's rack, and the move with the
+    best average outcome wins. Every search stops after `time_budget`
+    seconds. With workers > 0 the simulations run on a process pool started
+    on first use, so start() returns at once and a GUI can poll the search;
+    workers=0 simulates in the calling process. The workers take a moment to
+    start, so a GUI should open() the pool well before the first search.
+    """
+
+    def __init__(self, time_budget=SIM_TIME_BUDGET, candidates=SIM_CANDIDATES, plies=SIM_PLIES,
+                 workers=None, seed=None):
+        self.time_budget = time_budget
+        self.candidates = candidates
+        self.plies = plies
+        self.workers = multiprocessing.cpu_count() if workers is None else workers
+        self.rng = random.Random(seed)
+        self._pool = None
+
+    def start(self, engine, moves):
+        """Begin a search over `moves` for the current player and return its SimulationSearch"""
+        candidates = top_candidates(engine, moves, self.candidates)
+        if len(candidates) < 2:
+            return SimulationSearch(candidates)
+
+        # Leave the last simulated turns time to finish inside the budget
+        budget = max(0.0, self.time_budget - self.plies * SIM_PLY_TIME_LIMIT)
+        position = engine.copy()
+        tasks = [(position, candidates, self.plies, SIM_PLY_TIME_LIMIT, budget, self.rng.getrandbits(32))
+                 for _ in range(max(1, self.workers))]
+        if self.workers == 0:
+            return SimulationSearch(candidates, batches=[_simulate_batch(tasks[0])])
+
+        self.open()
+        pending = self._pool.map_async(_simulate_batch, tasks, chunksize=1)
+        return SimulationSearch(candidates, pending=pending, deadline=time.perf_counter() + self.time_budget + SIM_GRACE)
+
+    def open(self):
+        """Start the worker processes now rather than on the first search; returns while they start up"""
+        if self._pool is None and self.workers > 0:
+            self._pool = multiprocessing.get_context(SIM_START_METHOD).Pool(self.workers)
+
+    def choose(self, engine, moves, cancelled=None):
+        """Search and wait for the answer; returns None early if the `cancelled` event is set"""
+        search = self.start(engine, moves)
+        while not search.ready():
+            if cancelled is None:
+                time.sleep(CANCEL_CHECK_INTERVAL)
+            elif cancelled.wait(CANCEL_CHECK_INTERVAL):
+                return None
+        return search.result()
+
+    def close(self):
+        """Stop the worker processes, abandoning any search still running"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+
+class BackgroundSearch:
+    """One AI turn searched on a daemon thread, so a GUI's event loop keeps running.
+
+    The search works on a copy of the engine taken in the constructor. When
+    it finishes the chosen move (None for a pass) is put on `results`, or
+    the exception if the search failed; a GUI polls the queue from its own
+    loop. cancel() makes the thread stop at its next check and post nothing.
+    """
+
+    def __init__(self, engine, time_limit=None, simulator=None):
+        self.results = queue.Queue(maxsize=1)
+        self.cancelled = threading.Event()
+        self.time_limit = time_limit
+        self.simulator = simulator
+        self._engine = engine.copy()
+        if simulator is not None:
+            simulator.open()  # start the pool from the calling thread, not from the search thread
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def _run(self):
+        try:
+            moves = self._engine.legal_moves(time_limit=self.time_limit)
+            if self.cancelled.is_set():
+                return
+            if self.simulator is not None and moves:
+                move = self.simulator.choose(self._engine, moves, self.cancelled)
+            else:
+                move = choose_with_leave(self._engine, moves)
+        except Exception as e:
+            move = e
+        if not self.cancelled.is_set():
+            self.results.put(move)
+
+
+_inline_player = None
+
+
+def choose_with_simulation(engine, moves):
+    """Policy form of MonteCarloPlayer that simulates in the calling process"""
+    global _inline_player
+    if _inline_player is None:
+        _inline_player = MonteCarloPlayer(workers=0)
+    return _inline_player.choose(engine, moves)
+
+
+POLICIES = {
+    'score': choose_highest_score,
+    'leave': choose_with_leave,
+    'simulate': choose_with_simulation,
+}
+DEFAULT_POLICY = 'leave'
@@ -0,0 +1,98 @@
+from bisect import bisect_left
+from collections import Counter
+
+from scrabble_lexicon import LETTERS, WILDCARD
+
+MAX_BLANKS = 2  # blanks a query may use; a full tile bag has two
+
+
+def signature(word):
+    """A word's letters in alphabetical order; anagrams share one"""
+    return ''.join(sorted(word.upper()))
+
+
+class AnagramIndex:
+    """The lexicon's words grouped by signature, for "what can I make from these tiles" queries.
+
+    Signatures are kept in one sorted list with the words of each alongside,
+    so an exact anagram lookup is a binary search. find() builds signatures
+    letter by letter in alphabetical order from the tiles it is given, and
+    stops extending one as soon as a binary search shows no signature
+    starts with it. Only tile combinations that lead to real words are
+    visited, and a blank costs at most 26 probes at each step.
+    """
+
+    def __init__(self, words):
+        groups = {}
+        for word in words:
+            groups.setdefault(signature(word), []).append(word.upper())
+        self.signatures = sorted(groups)
+        self.words = [groups[key] for key in self.signatures]
+
+    @classmethod
+    def from_lexicon(cls, lexicon):
+        return cls(lexicon.words())
+
+    def anagrams(self, letters):
+        """Words using exactly these letters"""
+        key = signature(letters)
+        i = bisect_left(self.signatures, key)
+        if i < len(self.signatures) and self.signatures[i] == key:
+            return list(self.words[i])
+        return []
+
+    def find(self, rack, board_letters='', through='', min_length=2):
+        """Every word that can be made from a rack plus some board letters, longest first.
+
+        A '*' in the rack is a blank (at most MAX_BLANKS are used). All of
+        board_letters may be used, while at most one letter of `through` may
+        be, as when playing through a single tile already on the board.
+        Each word uses at least one rack tile.
+        """
+        counts = [0] * len(LETTERS)
+        for letter in rack.upper() + board_letters.upper():
+            if letter != WILDCARD:
+                counts[ord(letter) - 65] += 1
+        through = {ord(letter) - 65 for letter in through.upper()}
+        signatures = self.signatures
+        found = set()
+
+        def extend(prefix, start, blanks, through_free, low):
+            for i in range(start, len(LETTERS)):
+                # A rack or board tile first; a blank or the through letter only stand in once
+                # that letter has run out, and either may then lead to different words
+                if counts[i]:
+                    options = ((0, 0),)
+                    counts[i] -= 1
+                else:
+                    options = []
+                    if through_free and i in through:
+                        options.append((0, 1))
+                    if blanks:
+                        options.append((1, 0))
+                    if not options:
+                        continue
+                key = prefix + LETTERS[i]
+                position = bisect_left(signatures, key, low)
+                if position < len(signatures) and signatures[position].startswith(key):
+                    if signatures[position] == key and len(key) >= min_length:
+                        found.add(position)
+                    for used_blank, used_through in options:
+                        extend(key, i, blanks - used_blank, through_free - used_through, position)
+                if options == ((0, 0),):
+                    counts[i] += 1
+
+        extend('', 0, min(rack.count(WILDCARD), MAX_BLANKS), 1 if through else 0, 0)
+
+        # The board letters and the through letter can make a word without the rack
+        board = Counter(board_letters.upper())
+        rack_counts = Counter(rack.upper())
+
+        def uses_rack_tile(key):
+            needed = Counter(key) - board
+            return sum(needed.values()) > 1 or any(rack_counts[letter] or rack_counts[WILDCARD] for letter in needed)
+
+        words = [word for position in found if uses_rack_tile(signatures[position])
+                 for word in self.words[position]]
+        words.sort(key=lambda word: (-len(word), word))
+        return words
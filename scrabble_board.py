@@ -0,0 +1,166 @@
+BOARD_SIZE = 15
+CENTER_SQUARE = (7, 7)
+
+ALL_LETTERS_MASK = (1 << 26) - 1
+FULL_LINE_MASK = (1 << BOARD_SIZE) - 1
+EMPTY = 0  # square value for an empty square; otherwise the letter's character code
+UPPER_CASE = 0xDF  # code & UPPER_CASE turns a blank's lower-case letter into the upper-case one
+
+
+def neighbour_mask(line_bits, before_bits=0, after_bits=0):
+    """Empty squares of a line next to a tile, from occupancy bitmasks.
+
+    line_bits is the line itself, before_bits and after_bits the parallel
+    lines on either side (0 at the board edge).
+    """
+    return (before_bits | after_bits | (line_bits << 1) | (line_bits >> 1)) & ~line_bits & FULL_LINE_MASK
+
+
+class Board:
+    """The 15x15 board as a flat 225-byte array plus the move generator's caches.
+
+    squares[row * 15 + col] holds 0 for an empty square or the character code
+    of the letter on it (lower case for a blank). row_bits[r] and col_bits[c]
+    are occupancy bitmasks (bit c of row r, bit r of column c), so occupancy,
+    adjacency and anchor tests are bit operations and copy() is a handful of
+    flat list copies.
+
+    The cross-check mask of every square is cached for both directions. When
+    tiles are placed or removed only the rows and columns they touch are
+    recomputed: a horizontal play's cross-check on a square depends only on
+    that square's column, a vertical play's only on its row. Change squares
+    through place() and remove() so the caches stay in step.
+    """
+
+    def __init__(self, lexicon=None):
+        self.lexicon = lexicon
+        self.squares = bytearray(BOARD_SIZE * BOARD_SIZE)
+        self.row_bits = [0] * BOARD_SIZE
+        self.col_bits = [0] * BOARD_SIZE
+        self.tile_count = 0
+        self.cross_checks = {
+            'H': [ALL_LETTERS_MASK] * (BOARD_SIZE * BOARD_SIZE),
+            'V': [ALL_LETTERS_MASK] * (BOARD_SIZE * BOARD_SIZE),
+        }
+
+    def copy(self):
+        """Independent copy sharing only the lexicon"""
+        board = Board.__new__(Board)
+        board.lexicon = self.lexicon
+        board.squares = self.squares[:]
+        board.row_bits = self.row_bits[:]
+        board.col_bits = self.col_bits[:]
+        board.tile_count = self.tile_count
+        board.cross_checks = {'H': self.cross_checks['H'][:], 'V': self.cross_checks['V'][:]}
+        return board
+
+    def letter(self, row, col):
+        """The letter on a square, '' if it is empty"""
+        code = self.squares[row * BOARD_SIZE + col]
+        return chr(code) if code else ''
+
+    def is_occupied(self, row, col):
+        return self.row_bits[row] >> col & 1 == 1
+
+    def is_empty(self):
+        return self.tile_count == 0
+
+    def anchor_mask(self, direction, index):
+        """Bitmask of the anchor squares along row `index` ('H') or column `index` ('V').
+
+        Anchors are empty squares next to a tile, or just the centre square on
+        an empty board.
+        """
+        if self.tile_count == 0:
+            return 1 << CENTER_SQUARE[1] if index == CENTER_SQUARE[0] else 0
+        lines = self.row_bits if direction == 'H' else self.col_bits
+        before = lines[index - 1] if index > 0 else 0
+        after = lines[index + 1] if index < BOARD_SIZE - 1 else 0
+        return neighbour_mask(lines[index], before, after)
+
+    def is_anchor(self, row, col):
+        return self.anchor_mask('H', row) >> col & 1 == 1
+
+    def place(self, tiles):
+        """Put letters on empty squares; tiles are (row, col, letter, ...) tuples"""
+        rows, cols = set(), set()
+        for tile in tiles:
+            r, c = tile[0], tile[1]
+            self.squares[r * BOARD_SIZE + c] = ord(tile[2])
+            self.row_bits[r] |= 1 << c
+            self.col_bits[c] |= 1 << r
+            self.tile_count += 1
+            rows.add(r)
+            cols.add(c)
+        self._refresh(rows, cols)
+
+    def remove(self, squares):
+        """Clear squares; squares are (row, col, ...) tuples"""
+        rows, cols = set(), set()
+        for square in squares:
+            r, c = square[0], square[1]
+            if self.squares[r * BOARD_SIZE + c] != EMPTY:
+                self.squares[r * BOARD_SIZE + c] = EMPTY
+                self.row_bits[r] &= ~(1 << c)
+                self.col_bits[c] &= ~(1 << r)
+                self.tile_count -= 1
+            rows.add(r)
+            cols.add(c)
+        self._refresh(rows, cols)
+
+    def refresh_all(self):
+        """Recompute every cross-check from scratch"""
+        self._refresh(range(BOARD_SIZE), range(BOARD_SIZE))
+
+    def _refresh(self, rows, cols):
+        # A horizontal play's cross-check on a square only depends on that square's column
+        checks = self.cross_checks['H']
+        for c in cols:
+            bits = self.col_bits[c]
+            constrained = neighbour_mask(bits)
+            for r in range(BOARD_SIZE):
+                if bits >> r & 1:
+                    checks[r * BOARD_SIZE + c] = 0
+                elif constrained >> r & 1 and self.lexicon is not None:
+                    checks[r * BOARD_SIZE + c] = self.cross_check_mask(r, c, 'H')
+                else:
+                    checks[r * BOARD_SIZE + c] = ALL_LETTERS_MASK
+
+        # ... and a vertical play's only on the square's row
+        checks = self.cross_checks['V']
+        for r in rows:
+            bits = self.row_bits[r]
+            constrained = neighbour_mask(bits)
+            for c in range(BOARD_SIZE):
+                if bits >> c & 1:
+                    checks[r * BOARD_SIZE + c] = 0
+                elif constrained >> c & 1 and self.lexicon is not None:
+                    checks[r * BOARD_SIZE + c] = self.cross_check_mask(r, c, 'V')
+                else:
+                    checks[r * BOARD_SIZE + c] = ALL_LETTERS_MASK
+
+    def cross_check_mask(self, row, col, direction):
+        """Bitmask of letters that may go on an empty square for a play in `direction`.
+
+        A horizontal play is constrained by the vertical word it would form
+        through the square and vice versa. Squares with no perpendicular
+        neighbours accept every letter.
+        """
+        squares = self.squares
+        step = BOARD_SIZE if direction == 'H' else 1
+        index = row * BOARD_SIZE + col
+        lo, hi = (col, BOARD_SIZE * BOARD_SIZE - BOARD_SIZE + col) if direction == 'H' \
+            else (row * BOARD_SIZE, row * BOARD_SIZE + BOARD_SIZE - 1)
+
+        start = index
+        while start - step >= lo and squares[start - step]:
+            start -= step
+        end = index
+        while end + step <= hi and squares[end + step]:
+            end += step
+        if start == index and end == index:
+            return ALL_LETTERS_MASK
+
+        before = [chr(squares[i] & UPPER_CASE) for i in range(start, index, step)]
+        after = [chr(squares[i] & UPPER_CASE) for i in range(index + step, end + step, step)]
+        return self.lexicon.hooks(before, after)
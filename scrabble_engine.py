@@ -0,0 +1,266 @@
+import random
+from collections import namedtuple
+
+from scrabble_board import Board, BOARD_SIZE, CENTER_SQUARE
+from scrabble_movegen import BLANK, Move, MoveGenerator
+from scrabble_scoring import LETTER_POINTS, score_move
+
+PLAYERS = ('player', 'ai')
+RACK_SIZE = 7
+# Rule 7: the game also ends when both players pass in a row
+MAX_CONSECUTIVE_PASSES = 2
+
+LETTER_DISTRIBUTION = {
+    'A': 9, 'B': 2, 'C': 2, 'D': 4, 'E': 12, 'F': 2, 'G': 3, 'H': 2,
+    'I': 9, 'J': 1, 'K': 1, 'L': 4, 'M': 2, 'N': 6, 'O': 8, 'P': 2,
+    'Q': 1, 'R': 6, 'S': 4, 'T': 6, 'U': 4, 'V': 2, 'W': 2, 'X': 1,
+    'Y': 2, 'Z': 1, '*': 2
+}
+# One entry of ScrabbleEngine.history; move is None for a pass
+Turn = namedtuple('Turn', ['player', 'move', 'score', 'rack_before', 'drawn',
+                           'first_move', 'consecutive_passes', 'game_over'])
+
+
+class PlacementError(Exception):
+    """A word placement that breaks the rules.
+
+    str(error) is the short message for dialogs, `spoken` the longer version
+    read out to the player.
+    """
+
+    def __init__(self, message, spoken=None):
+        super().__init__(message)
+        self.spoken = spoken or message
+
+
+class ScrabbleEngine:
+    """Board, tile bag, racks, scores and rules of a two-player game.
+
+    Has no GUI or speech dependencies so it can be driven by the Tk client,
+    by tests or by headless simulations. Every change goes through apply()
+    or pass_turn() and can be reverted with undo().
+    """
+
+    def __init__(self, lexicon=None, seed=None):
+        self.lexicon = lexicon
+        self.move_generator = MoveGenerator(lexicon) if lexicon is not None else None
+        self.rng = random.Random(seed)
+
+        self.board = Board(lexicon)
+        self.letter_points = LETTER_POINTS
+        self.tile_bag = self.initialize_tile_bag()
+        self.racks = {player: [] for player in PLAYERS}
+        self.scores = {player: 0 for player in PLAYERS}
+
+        self.current_turn = 'player'
+        self.first_move = True
+        self.game_over = False
+        self.consecutive_passes = 0
+        self.history = []
+
+    def copy(self, seed=None):
+        """Independent copy of the current position, without the move history"""
+        engine = ScrabbleEngine.__new__(ScrabbleEngine)
+        engine.lexicon = self.lexicon
+        engine.move_generator = self.move_generator
+        engine.rng = random.Random(seed)
+        engine.board = self.board.copy()
+        engine.letter_points = self.letter_points
+        engine.tile_bag = list(self.tile_bag)
+        engine.racks = {player: list(rack) for player, rack in self.racks.items()}
+        engine.scores = dict(self.scores)
+        engine.current_turn = self.current_turn
+        engine.first_move = self.first_move
+        engine.game_over = self.game_over
+        engine.consecutive_passes = self.consecutive_passes
+        engine.history = []
+        return engine
+
+    def initialize_tile_bag(self):
+        """Create and shuffle the tile bag"""
+        bag = []
+        for letter, count in LETTER_DISTRIBUTION.items():
+            bag.extend([letter] * count)
+        self.rng.shuffle(bag)
+        return bag
+
+    def draw_tiles(self, count):
+        """Draw tiles from the bag"""
+        drawn_tiles = []
+        for _ in range(count):
+            if self.tile_bag:
+                drawn_tiles.append(self.tile_bag.pop())
+            else:
+                break
+        return drawn_tiles
+
+    def fill_racks(self):
+        """Top every rack up to seven tiles"""
+        for player in PLAYERS:
+            rack = self.racks[player]
+            if len(rack) < RACK_SIZE:
+                rack.extend(self.draw_tiles(RACK_SIZE - len(rack)))
+
+    def other_player(self, player=None):
+        player = player or self.current_turn
+        return PLAYERS[1] if player == PLAYERS[0] else PLAYERS[0]
+
+    def legal_moves(self, player=None, time_limit=None):
+        """Every legal play for a player's rack (the current player by default)"""
+        if self.move_generator is None or self.game_over:
+            return []
+        rack = self.racks[player or self.current_turn]
+        return self.move_generator.generate(self.board, rack, time_limit=time_limit)
+
+    def score_move(self, move):
+        """Points for a move, including cross words, premium squares and the bingo bonus"""
+        return score_move(self.board, move, self.letter_points)
+
+    def build_move(self, word, start_row, start_col, direction, player=None):
+        """Turn a typed word and position into a Move, raising PlacementError if it breaks the rules.
+
+        A lower-case letter in the word is a blank tile standing for that
+        letter, as on the board. A letter the rack does not hold is covered by
+        a blank when one is available. A bare '*' is refused: the blank's
+        letter has to be known (see WordValidator.expand).
+        """
+        player = player or self.current_turn
+        if BLANK in word:
+            raise PlacementError("Choose the letter the blank tile stands for.",
+                                 "Please say which letter the blank tile stands for.")
+        tiles = []
+        lands_on_existing_letter = False
+
+        for i in range(len(word)):
+            r = start_row + (i if direction == 'V' else 0)
+            c = start_col + (i if direction == 'H' else 0)
+
+            if r < 0 or r >= BOARD_SIZE or c < 0 or c >= BOARD_SIZE:
+                raise PlacementError("Word goes off the board.")
+
+            is_blank = word[i].islower()
+            letter_needed = word[i].upper()
+            existing_letter = self.board.letter(r, c).upper()
+
+            if existing_letter != '':
+                if is_blank or existing_letter != letter_needed:
+                    raise PlacementError(
+                        f"Cannot place '{word[i]}' at ({r + 1},{c + 1}). Cell is occupied with '{existing_letter}'.",
+                        f"Cannot place '{word[i]}' at row {r + 1}, column {c + 1} because cell is occupied with '{existing_letter}' and letters must match or the cell must be empty for a blank tile.")
+                lands_on_existing_letter = True
+            else:
+                tiles.append((r, c, letter_needed, is_blank))
+
+        if len(word) < 2:
+            raise PlacementError("Word must be at least two letters long.")
+
+        if self.first_move:
+            if not any((r, c) == CENTER_SQUARE for r, c, _, _ in tiles):
+                raise PlacementError("First word must cover the center square.",
+                                     "The first word must cover the center star square.")
+        elif not lands_on_existing_letter and not any(self.board.is_anchor(r, c) for r, c, _, _ in tiles):
+            raise PlacementError("Word must connect to an existing word.",
+                                 "The word must connect to an existing word on the board.")
+
+        temp_rack = list(self.racks[player])
+        move_tiles = []
+        for r, c, letter_needed, is_blank in tiles:
+            if not is_blank and letter_needed in temp_rack:
+                temp_rack.remove(letter_needed)
+                move_tiles.append((r, c, letter_needed, False))
+            elif BLANK in temp_rack:
+                temp_rack.remove(BLANK)
+                move_tiles.append((r, c, letter_needed, True))
+            else:
+                raise PlacementError(
+                    f"You do not have the required letters in your rack or a blank tile to play '{word}'.",
+                    f"You do not have the required letters in your rack to play '{word}'.")
+
+        if not move_tiles:
+            raise PlacementError("Your word must use at least one new tile from your rack.")
+
+        return Move(word.upper(), start_row, start_col, direction, tuple(move_tiles))
+
+    def words_formed(self, move):
+        """Every word a move would make, main word first, as upper-case strings.
+
+        The main word runs on past the typed letters to any tiles touching its
+        ends, and each new tile adds the cross word through it, if any.
+        """
+        new_tiles = {(r, c): letter.upper() for r, c, letter, _ in move.tiles}
+        board = self.board
+        dr, dc = (0, 1) if move.direction == 'H' else (1, 0)
+
+        def run(r, c, dr, dc):
+            while 0 <= r - dr and 0 <= c - dc and ((r - dr, c - dc) in new_tiles or board.is_occupied(r - dr, c - dc)):
+                r, c = r - dr, c - dc
+            letters = []
+            while r < BOARD_SIZE and c < BOARD_SIZE and ((r, c) in new_tiles or board.is_occupied(r, c)):
+                letters.append(new_tiles.get((r, c)) or board.letter(r, c).upper())
+                r, c = r + dr, c + dc
+            return ''.join(letters)
+
+        words = [run(move.row, move.col, dr, dc)]
+        for r, c in new_tiles:
+            cross = run(r, c, dc, dr)
+            if len(cross) > 1:
+                words.append(cross)
+        return words
+
+    def apply(self, move):
+        """Play a move for the current player and return its Turn record"""
+        player = self.current_turn
+        rack = self.racks[player]
+        rack_before = list(rack)
+        score = self.score_move(move)
+
+        # Blanks go on the board as lower-case letters so they keep scoring nothing
+        self.board.place([(r, c, letter.lower() if is_blank else letter.upper())
+                          for r, c, letter, is_blank in move.tiles])
+        for _, _, letter, is_blank in move.tiles:
+            rack.remove(BLANK if is_blank else letter)
+        drawn = self.draw_tiles(len(move.tiles))
+        rack.extend(drawn)
+
+        turn = Turn(player, move, score, rack_before, drawn, self.first_move, self.consecutive_passes, self.game_over)
+        self.history.append(turn)
+
+        self.scores[player] += score
+        self.first_move = False
+        self.consecutive_passes = 0
+        if not rack and not self.tile_bag:
+            self.game_over = True
+        self.current_turn = self.other_player(player)
+        return turn
+
+    def pass_turn(self):
+        """Pass without playing and return the Turn record"""
+        player = self.current_turn
+        turn = Turn(player, None, 0, list(self.racks[player]), [], self.first_move,
+                    self.consecutive_passes, self.game_over)
+        self.history.append(turn)
+
+        self.consecutive_passes += 1
+        if self.consecutive_passes >= MAX_CONSECUTIVE_PASSES:
+            self.game_over = True
+        self.current_turn = self.other_player(player)
+        return turn
+
+    def undo(self):
+        """Take back the last move or pass; returns its Turn record, or None if there is nothing to undo"""
+        if not self.history:
+            return None
+        turn = self.history.pop()
+
+        if turn.move is not None:
+            self.board.remove(turn.move.tiles)
+        # Tiles were popped off the end of the bag, so push them back in reverse order
+        self.tile_bag.extend(reversed(turn.drawn))
+        self.racks[turn.player] = list(turn.rack_before)
+        self.scores[turn.player] -= turn.score
+
+        self.first_move = turn.first_move
+        self.consecutive_passes = turn.consecutive_passes
+        self.game_over = turn.game_over
+        self.current_turn = turn.player
+        return turn
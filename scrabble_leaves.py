@@ -0,0 +1,165 @@
+import os
+import sys
+import struct
+from array import array
+from bisect import bisect_left
+
+from scrabble_engine import LETTER_DISTRIBUTION, RACK_SIZE
+from datafile import map_file, write_atomically
+
+# Prebuilt rack-leave table; build it once when installing the game, with: python scrabble_leaves.py
+LEAVES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'leaves.bin')
+
+# File layout: header, then `count` sorted uint32 keys, then `count` int16 values in tenths of a point
+FILE_MAGIC = b'LEAV'
+FILE_VERSION = 1
+HEADER = struct.Struct('<4sII')  # magic, version, count
+
+TILES = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ*'
+TILE_CODE = {tile: i + 1 for i, tile in enumerate(TILES)}  # 5 bits per tile, 0 means "no tile"
+VOWELS = set('AEIOU')
+
+# Rough worth in points of keeping a single tile for the next turn
+TILE_LEAVE_VALUES = {
+    'A': 1.0, 'B': -2.0, 'C': 0.5, 'D': 0.5, 'E': 1.5, 'F': -2.0, 'G': -2.0, 'H': 1.0,
+    'I': -0.5, 'J': -2.5, 'K': -1.5, 'L': -0.5, 'M': 0.5, 'N': 0.5, 'O': -1.0, 'P': -0.5,
+    'Q': -7.0, 'R': 1.5, 'S': 7.5, 'T': 0.0, 'U': -3.0, 'V': -5.5, 'W': -3.5, 'X': 3.5,
+    'Y': -0.5, 'Z': 3.0, '*': 24.0,
+}
+DUPLICATE_PENALTY = 3.0  # per extra copy of a letter
+BALANCE_PENALTY = 1.5  # per step the vowel/consonant split is off by more than one
+QU_BONUS = 6.0  # a U makes a kept Q much less of a burden
+
+
+def leave_key(tiles):
+    """Pack a leave (any order, at most six tiles) into the table's uint32 key"""
+    key = 0
+    for tile in sorted(tiles):
+        key = key << 5 | TILE_CODE[tile]
+    return key
+
+
+def heuristic_leave_value(tiles):
+    """Estimated worth in points of keeping these tiles"""
+    value = sum(TILE_LEAVE_VALUES[tile] for tile in tiles)
+
+    counts = {}
+    for tile in tiles:
+        counts[tile] = counts.get(tile, 0) + 1
+    for tile, count in counts.items():
+        if count > 1 and tile != '*':
+            value -= DUPLICATE_PENALTY * (count - 1)
+
+    vowels = sum(1 for tile in tiles if tile in VOWELS)
+    consonants = sum(1 for tile in tiles if tile not in VOWELS and tile != '*')
+    imbalance = abs(vowels - consonants)
+    if imbalance > 1:
+        value -= BALANCE_PENALTY * (imbalance - 1)
+
+    if 'Q' in counts and 'U' in counts:
+        value += QU_BONUS
+    return value
+
+
+def _all_leaves(max_size=RACK_SIZE - 1):
+    """Every multiset of at most max_size tiles the tile distribution allows"""
+    tiles = list(TILES)
+
+    def extend(start, leave):
+        yield leave
+        if len(leave) == max_size:
+            return
+        for i in range(start, len(tiles)):
+            tile = tiles[i]
+            if leave.count(tile) < LETTER_DISTRIBUTION[tile]:
+                yield from extend(i, leave + tile)
+
+    yield from extend(0, '')
+
+
+def build_leave_table(value_function=heuristic_leave_value, path=LEAVES_PATH):
+    """Evaluate every possible leave once and write the table file"""
+    entries = sorted((leave_key(leave), int(round(value_function(leave) * 10))) for leave in _all_leaves())
+    keys = array('I', (key for key, _ in entries))
+    values = array('h', (max(-32768, min(32767, value)) for _, value in entries))
+    if sys.byteorder != 'little':
+        keys.byteswap()
+        values.byteswap()
+    write_atomically(path, (HEADER.pack(FILE_MAGIC, FILE_VERSION, len(entries)), keys.tobytes(), values.tobytes()))
+    return len(entries)
+
+
+class LeaveTable:
+    """Rack-leave values indexed by the sorted leave, memory-mapped from LEAVES_PATH.
+
+    Building the file takes seconds, so only prepare() does it, for tools
+    such as scrabble_sim; the game never builds it. Without the file value()
+    falls back to heuristic_leave_value(), which the table is made from. The
+    file is memory-mapped, so it costs nothing until the first lookup and is
+    shared between processes. value() memoises per leave, so the handful of
+    distinct leaves a rack can produce each cost one binary search (or one
+    heuristic evaluation) and after that every candidate move is a single
+    dict lookup.
+    """
+
+    def __init__(self, path=LEAVES_PATH):
+        self.path = path
+        self._keys = None
+        self._values = None
+        self._mmap = None
+        self._cache = {}
+
+    def prepare(self):
+        """Build the file if it is missing and load it; meant for command-line tools, not the game"""
+        if self._keys is None:
+            if not os.path.exists(self.path):
+                build_leave_table(path=self.path)
+            self._load()
+        return self
+
+    def _load(self):
+        mapped, (count,) = map_file(self.path, HEADER, FILE_MAGIC, FILE_VERSION, "a leave table",
+                                    lambda count: 6 * count)
+        keys_end = HEADER.size + 4 * count
+        if sys.byteorder == 'little':
+            self._keys = memoryview(mapped)[HEADER.size:keys_end].cast('I')
+            self._values = memoryview(mapped)[keys_end:keys_end + 2 * count].cast('h')
+        else:
+            self._keys = array('I', mapped[HEADER.size:keys_end])
+            self._values = array('h', mapped[keys_end:keys_end + 2 * count])
+            self._keys.byteswap()
+            self._values.byteswap()
+        self._mmap = mapped
+        self._cache.clear()  # values memoised from the heuristic before the table was there
+
+    def value(self, leave):
+        """Worth in points of keeping `leave` (a string or list of tiles, '*' for a blank)"""
+        key = leave_key(leave)
+        value = self._cache.get(key)
+        if value is None:
+            if self._keys is None and os.path.exists(self.path):
+                self._load()
+            index = bisect_left(self._keys, key) if self._keys is not None else None
+            if index is not None and index < len(self._keys) and self._keys[index] == key:
+                value = self._values[index] / 10
+            else:
+                value = heuristic_leave_value(leave)  # no table file, or more tiles than any real leave
+            self._cache[key] = value
+        return value
+
+
+_default_table = None
+
+
+def default_leave_table():
+    """The shared table for LEAVES_PATH, created lazily"""
+    global _default_table
+    if _default_table is None:
+        _default_table = LeaveTable()
+    return _default_table
+
+
+if __name__ == "__main__":
+    # python scrabble_leaves.py [leaves.bin]
+    target = sys.argv[1] if len(sys.argv) > 1 else LEAVES_PATH
+    print(f"Wrote {build_leave_table(path=target)} leave values to {target}")
@@ -0,0 +1,350 @@
+import os
+import sys
+import struct
+import string
+from array import array
+
+from datafile import map_file, write_atomically
+
+# Plain word list, one word per line (e.g. ENABLE or TWL). Put it next to the game.
+WORD_LIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'words.txt')
+# Prebuilt DAWG made from the word list, rebuilt automatically when the word list is newer
+LEXICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'words.dawg')
+
+# Used when no word list is installed so the AI still has something to play
+FALLBACK_WORDS = ["CAT", "DOG", "PLAY", "GAME", "WORD", "HOUSE", "CAR", "BOOK", "FUN", "SCRABBLE", "TILE",
+                  "BOARD", "SCORE", "HINT"]
+
+LETTERS = string.ascii_uppercase
+WILDCARD = '*'  # stands for any letter in matches() patterns, as a blank tile does
+
+# File layout: header, one little-endian uint32 per edge, then the word count.
+# Edge bits: 0-4 letter, 5 end of word, 6 last edge of its node, 7-31 index of the child's first edge.
+FILE_MAGIC = b'DAWG'
+FILE_VERSION = 1
+HEADER = struct.Struct('<4sIII')  # magic, version, root edge index, edge count
+EDGE_LETTER_MASK = 0x1F
+EDGE_END_OF_WORD = 0x20
+EDGE_LAST = 0x40
+EDGE_CHILD_SHIFT = 7
+
+
+class _BuildNode:
+    """Mutable node used only while building the DAWG"""
+    __slots__ = ('children', 'final')
+
+    def __init__(self):
+        self.children = {}
+        self.final = False
+
+
+def _normalise(word):
+    word = word.strip().upper()
+    if 2 <= len(word) <= 15 and word.isascii() and word.isalpha():
+        return word
+    return None
+
+
+def build_edges(words):
+    """Build a minimal DAWG from words and flatten it into an edge array.
+
+    Uses the incremental construction for sorted input (Daciuk et al.), so
+    only the path of the previous word is ever held unminimised.
+    Returns (edges, root_index, word_count).
+    """
+    words = sorted({w for w in (_normalise(word) for word in words) if w})
+    register = {}
+    root = _BuildNode()
+    unchecked = []  # (parent, letter, child) along the previous word
+    previous = ''
+
+    def minimise(down_to):
+        while len(unchecked) > down_to:
+            parent, letter, child = unchecked.pop()
+            signature = (child.final, tuple((l, id(c)) for l, c in sorted(child.children.items())))
+            existing = register.get(signature)
+            if existing is not None:
+                parent.children[letter] = existing
+            else:
+                register[signature] = child
+
+    for word in words:
+        common = 0
+        for a, b in zip(word, previous):
+            if a != b:
+                break
+            common += 1
+        minimise(common)
+        node = unchecked[-1][2] if unchecked else root
+        for letter in word[common:]:
+            child = _BuildNode()
+            node.children[letter] = child
+            unchecked.append((node, letter, child))
+            node = child
+        node.final = True
+        previous = word
+    minimise(0)
+
+    # Give every node with children a contiguous run of edges; index 0 means "no children"
+    first_edge = {}
+    ordered = []
+    pending = [root]
+    next_index = 1
+    while pending:
+        node = pending.pop()
+        if id(node) in first_edge or not node.children:
+            continue
+        first_edge[id(node)] = next_index
+        next_index += len(node.children)
+        ordered.append(node)
+        pending.extend(node.children.values())
+
+    edges = array('I', [0]) * next_index
+    for node in ordered:
+        index = first_edge[id(node)]
+        items = sorted(node.children.items())
+        for offset, (letter, child) in enumerate(items):
+            edge = LETTERS.index(letter) | first_edge.get(id(child), 0) << EDGE_CHILD_SHIFT
+            if child.final:
+                edge |= EDGE_END_OF_WORD
+            if offset == len(items) - 1:
+                edge |= EDGE_LAST
+            edges[index + offset] = edge
+
+    return edges, first_edge.get(id(root), 0), len(words)
+
+
+class Lexicon:
+    """Minimal DAWG held in one flat array of 32-bit edges.
+
+    The array is normally a memory map of a prebuilt file, so loading is
+    instant and processes reading the same file share its pages. Lookups walk
+    at most 26 edges per letter, so word, prefix and hook queries all run in
+    O(word length).
+
+    Nodes are plain ints: the index of the node's first edge shifted left by
+    one, with the low bit set when the path to the node spells a whole word.
+    """
+
+    def __init__(self, edges, root_index, word_count):
+        self.edges = edges
+        self.root = root_index << 1
+        self.word_count = word_count
+        self.is_fallback = False
+        self.path = None  # set when the edges are a memory map of a file
+        self._file = None
+        self._mmap = None
+
+    def __reduce__(self):
+        # A mapped lexicon pickles as its path, so handing one to a worker process costs a few bytes
+        if self.path is not None:
+            return _shared_lexicon, (self.path,)
+        return _lexicon_from_edges, (array('I', self.edges), self.root >> 1, self.word_count, self.is_fallback)
+
+    @classmethod
+    def from_words(cls, words):
+        """Build a lexicon in memory from an iterable of words"""
+        return cls(*build_edges(words))
+
+    @classmethod
+    def from_word_list(cls, path=WORD_LIST_PATH):
+        """Build a lexicon in memory from a word list file"""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_words(f)
+
+    @classmethod
+    def load(cls, path=LEXICON_PATH):
+        """Memory-map a lexicon file written by save()"""
+        # The edges are followed by a uint32 word count
+        mapped, (root_index, edge_count) = map_file(path, HEADER, FILE_MAGIC, FILE_VERSION, "a lexicon file",
+                                                    lambda root_index, edge_count: 4 * edge_count + 4)
+        end = HEADER.size + 4 * edge_count
+        word_count, = struct.unpack_from('<I', mapped, end)
+
+        if sys.byteorder == 'little':
+            edges = memoryview(mapped)[HEADER.size:end].cast('I')
+        else:
+            # The file is little-endian; big-endian machines pay for a private copy
+            edges = array('I', mapped[HEADER.size:end])
+            edges.byteswap()
+
+        lexicon = cls(edges, root_index, word_count)
+        lexicon.path = path
+        lexicon._mmap = mapped
+        return lexicon
+
+    def save(self, path=LEXICON_PATH):
+        """Write the edge array to disk in the format load() expects"""
+        edges = array('I', self.edges)
+        if sys.byteorder != 'little':
+            edges.byteswap()
+        write_atomically(path, (HEADER.pack(FILE_MAGIC, FILE_VERSION, self.root >> 1, len(edges)),
+                                edges.tobytes(), struct.pack('<I', self.word_count)))
+
+    def close(self):
+        """Release the memory map, if any"""
+        if self._mmap is not None:
+            if isinstance(self.edges, memoryview):
+                self.edges.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def child(self, node, letter):
+        """Follow one letter from a node, None if no word continues that way"""
+        index = node >> 1
+        if not index:
+            return None
+        target = ord(letter) - 65
+        edges = self.edges
+        while True:
+            edge = edges[index]
+            if edge & EDGE_LETTER_MASK == target:
+                return (edge >> EDGE_CHILD_SHIFT) << 1 | (edge >> 5 & 1)
+            if edge & EDGE_LAST:
+                return None
+            index += 1
+
+    def children(self, node):
+        """(letter, child) pairs leaving a node"""
+        index = node >> 1
+        result = []
+        if not index:
+            return result
+        edges = self.edges
+        while True:
+            edge = edges[index]
+            result.append((LETTERS[edge & EDGE_LETTER_MASK], (edge >> EDGE_CHILD_SHIFT) << 1 | (edge >> 5 & 1)))
+            if edge & EDGE_LAST:
+                return result
+            index += 1
+
+    def is_word_end(self, node):
+        return node & 1 == 1
+
+    def walk(self, letters, node=None):
+        """Follow a whole string of letters, None if it is not a prefix of any word"""
+        if node is None:
+            node = self.root
+        for letter in letters:
+            node = self.child(node, letter)
+            if node is None:
+                return None
+        return node
+
+    def contains(self, word):
+        node = self.walk(word.upper())
+        return node is not None and node & 1 == 1
+
+    def is_prefix(self, letters):
+        """True if some word starts with these letters"""
+        return self.walk(letters.upper()) is not None
+
+    def words(self):
+        """Every word in the lexicon, in alphabetical order"""
+        stack = [(self.root, '')]
+        while stack:
+            node, prefix = stack.pop()
+            if node & 1 and prefix:
+                yield prefix
+            stack.extend((child, prefix + letter) for letter, child in reversed(self.children(node)))
+
+    def matches(self, pattern):
+        """Every word fitting a pattern in which '*' stands for any one letter, in alphabetical order.
+
+        The walk follows every edge at a wildcard and only the matching edge
+        elsewhere, so it visits just the DAWG paths the pattern allows.
+        """
+        pattern = pattern.upper()
+        found = []
+
+        def extend(node, i, prefix):
+            if i == len(pattern):
+                if node & 1:
+                    found.append(prefix)
+                return
+            if pattern[i] == WILDCARD:
+                for letter, child in self.children(node):
+                    extend(child, i + 1, prefix + letter)
+            else:
+                child = self.child(node, pattern[i])
+                if child is not None:
+                    extend(child, i + 1, prefix + pattern[i])
+
+        extend(self.root, 0, '')
+        return found
+
+    def hooks(self, before, after=''):
+        """Bitmask of letters L (bit 0 = A) for which before + L + after is a word"""
+        node = self.walk(before)
+        if node is None:
+            return 0
+        mask = 0
+        for letter, child in self.children(node):
+            end = self.walk(after, child)
+            if end is not None and end & 1:
+                mask |= 1 << (ord(letter) - 65)
+        return mask
+
+    def front_hooks(self, word):
+        """Letters that can be put in front of a word"""
+        mask = self.hooks('', word.upper())
+        return ''.join(letter for i, letter in enumerate(LETTERS) if mask >> i & 1)
+
+    def back_hooks(self, word):
+        """Letters that can be added to the end of a word"""
+        mask = self.hooks(word.upper())
+        return ''.join(letter for i, letter in enumerate(LETTERS) if mask >> i & 1)
+
+    def __contains__(self, word):
+        return self.contains(word)
+
+    def __len__(self):
+        return self.word_count
+
+
+# Lexicons unpickled in this process, by path, so every task sent to a worker reuses one memory map
+_shared_lexicons = {}
+
+
+def _shared_lexicon(path):
+    lexicon = _shared_lexicons.get(path)
+    if lexicon is None:
+        lexicon = _shared_lexicons[path] = Lexicon.load(path)
+    return lexicon
+
+
+def _lexicon_from_edges(edges, root_index, word_count, is_fallback):
+    lexicon = Lexicon(edges, root_index, word_count)
+    lexicon.is_fallback = is_fallback
+    return lexicon
+
+
+def load_lexicon(path=LEXICON_PATH, word_list_path=WORD_LIST_PATH):
+    """Load the game lexicon.
+
+    Memory-maps the prebuilt DAWG, (re)building it from the word list first if
+    it is missing or older. Falls back to a tiny built-in list if there is no
+    word list at all; validators should not trust that one.
+    """
+    try:
+        if os.path.exists(word_list_path) and \
+                (not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(word_list_path)):
+            Lexicon.from_word_list(word_list_path).save(path)
+        return Lexicon.load(path)
+    except (OSError, ValueError) as e:
+        if os.path.exists(word_list_path):
+            print(f"Warning: could not use lexicon file {path} ({e}), building it in memory.")
+            return Lexicon.from_word_list(word_list_path)
+        print(f"Warning: word list not found at {word_list_path}, using the built-in fallback words.")
+        lexicon = Lexicon.from_words(FALLBACK_WORDS)
+        lexicon.is_fallback = True
+        return lexicon
+
+
+if __name__ == "__main__":
+    # python scrabble_lexicon.py [words.txt] [words.dawg]
+    source = sys.argv[1] if len(sys.argv) > 1 else WORD_LIST_PATH
+    target = sys.argv[2] if len(sys.argv) > 2 else LEXICON_PATH
+    lexicon = Lexicon.from_word_list(source)
+    lexicon.save(target)
+    print(f"Wrote {lexicon.word_count} words in {len(lexicon.edges)} edges to {target}")
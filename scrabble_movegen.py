@@ -0,0 +1,170 @@
+import string
+import time
+from collections import namedtuple
+
+from scrabble_board import BOARD_SIZE, UPPER_CASE
+
+LETTERS = string.ascii_uppercase
+BLANK = '*'
+LETTER_INDEX = {letter: i for i, letter in enumerate(LETTERS)}
+
+# tiles holds only the newly placed tiles as (row, col, letter, is_blank)
+Move = namedtuple('Move', ['word', 'row', 'col', 'direction', 'tiles'])
+
+# Lines are searched from the edges in, a row then a column, so a search cut short by its
+# time limit has looked at both directions and at the triple-word squares along the edges
+SEARCH_ORDER = [(direction, line_index)
+                for line_index in sorted(range(BOARD_SIZE), key=lambda i: -abs(i - BOARD_SIZE // 2))
+                for direction in ('H', 'V')]
+
+
+def rack_counts(rack):
+    """Tile counts indexed 0-25 for A-Z and 26 for blanks"""
+    counts = [0] * 27
+    for tile in rack:
+        if tile == BLANK:
+            counts[26] += 1
+        else:
+            counts[ord(tile.upper()) - 65] += 1
+    return counts
+
+
+class MoveGenerator:
+    """Lists every legal play for a rack using anchor squares and cross-checks
+    (Appel & Jacobson). Each board line is scanned once per direction, words are
+    walked through the lexicon trie, and a play is only emitted when the trie
+    reaches the end of a word, so every move returned forms valid words only.
+    """
+
+    def __init__(self, lexicon):
+        self.lexicon = lexicon
+
+    def generate(self, board, rack, time_limit=None):
+        """Return all legal moves for `rack` on a scrabble_board.Board.
+
+        Anchors and cross-checks come from the board's bitmasks and caches.
+        `time_limit` is in seconds; when it runs out the moves found so far are
+        returned so an AI turn never stalls. Lines are searched in SEARCH_ORDER.
+        """
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        counts = rack_counts(rack)
+        squares = board.squares
+        moves = []
+
+        for direction, line_index in SEARCH_ORDER:
+            anchors = board.anchor_mask(direction, line_index)
+            if not anchors:
+                continue
+            if direction == 'H':
+                start, step = line_index * BOARD_SIZE, 1
+            else:
+                start, step = line_index, BOARD_SIZE
+            stop = start + step * BOARD_SIZE
+            # Character codes folded to upper case, 0 for empty squares
+            line = bytes(code & UPPER_CASE for code in squares[start:stop:step])
+            line_checks = board.cross_checks[direction][start:stop:step]
+
+            for anchor in range(BOARD_SIZE):
+                if not anchors >> anchor & 1:
+                    continue
+                if deadline is not None and time.perf_counter() > deadline:
+                    return moves
+                self._generate_at_anchor(line, line_checks, anchors, anchor, counts,
+                                         line_index, direction, moves, board.row_bits)
+
+        return moves
+
+    def _generate_at_anchor(self, line, checks, anchors, anchor, counts, line_index, direction, moves, row_bits):
+        lexicon = self.lexicon
+        placed = []  # (position, letter, is_blank) for tiles taken from the rack
+        beside = (0b101 << line_index) >> 1  # the columns either side of this one, for a 'V' line
+
+        def record(length, end):
+            if length < 2:
+                return
+            if direction == 'V' and len(placed) == 1 and row_bits[placed[0][0]] & beside:
+                # A lone tile next to a tile in its row also forms a horizontal word, so it is listed as an 'H' play
+                return
+            start = end - length
+            letters = [chr(code) for code in line[start:end]]
+            tiles = []
+            for offset, (pos, letter, is_blank) in enumerate(placed):
+                if pos is None:
+                    pos = start + offset  # left part tiles fill the squares just before the anchor
+                letters[pos - start] = letter
+                if direction == 'H':
+                    tiles.append((line_index, pos, letter, is_blank))
+                else:
+                    tiles.append((pos, line_index, letter, is_blank))
+            word = ''.join(letters)
+            if direction == 'H':
+                moves.append(Move(word, line_index, start, 'H', tuple(tiles)))
+            else:
+                moves.append(Move(word, start, line_index, 'V', tuple(tiles)))
+
+        def extend_right(length, node, square):
+            if square < BOARD_SIZE and line[square]:
+                child = lexicon.child(node, chr(line[square]))
+                if child is not None:
+                    extend_right(length + 1, child, square + 1)
+                return
+
+            if square > anchor and lexicon.is_word_end(node):
+                record(length, square)
+            if square >= BOARD_SIZE:
+                return
+
+            allowed = checks[square]
+            for letter, child in lexicon.children(node):
+                index = LETTER_INDEX[letter]
+                if not allowed >> index & 1:
+                    continue
+                if counts[index]:
+                    counts[index] -= 1
+                    placed.append((square, letter, False))
+                    extend_right(length + 1, child, square + 1)
+                    placed.pop()
+                    counts[index] += 1
+                if counts[26]:
+                    counts[26] -= 1
+                    placed.append((square, letter, True))
+                    extend_right(length + 1, child, square + 1)
+                    placed.pop()
+                    counts[26] += 1
+
+        def left_part(length, node, limit):
+            extend_right(length, node, anchor)
+            if limit <= 0:
+                return
+            for letter, child in lexicon.children(node):
+                index = LETTER_INDEX[letter]
+                if counts[index]:
+                    counts[index] -= 1
+                    placed.append((None, letter, False))
+                    left_part(length + 1, child, limit - 1)
+                    placed.pop()
+                    counts[index] += 1
+                if counts[26]:
+                    counts[26] -= 1
+                    placed.append((None, letter, True))
+                    left_part(length + 1, child, limit - 1)
+                    placed.pop()
+                    counts[26] += 1
+
+        if anchor > 0 and line[anchor - 1]:
+            # The left part is fixed: the tiles already on the board
+            start = anchor - 1
+            while start > 0 and line[start - 1]:
+                start -= 1
+            node = lexicon.walk(line[start:anchor].decode('ascii'))
+            if node is not None:
+                extend_right(anchor - start, node, anchor)
+            return
+
+        # The left part may only use empty squares that are not anchors themselves
+        limit = 0
+        square = anchor - 1
+        while square >= 0 and not anchors >> square & 1:
+            limit += 1
+            square -= 1
+        left_part(0, lexicon.root, limit)
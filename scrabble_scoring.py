@@ -0,0 +1,97 @@
+from scrabble_board import BOARD_SIZE
+
+LETTER_POINTS = {
+    'A': 1, 'B': 3, 'C': 3, 'D': 2, 'E': 1, 'F': 4, 'G': 2, 'H': 4,
+    'I': 1, 'J': 8, 'K': 5, 'L': 1, 'M': 3, 'N': 1, 'O': 1, 'P': 3,
+    'Q': 10, 'R': 1, 'S': 1, 'T': 1, 'U': 1, 'V': 4, 'W': 4, 'X': 8,
+    'Y': 4, 'Z': 10, '*': 0
+}
+
+BINGO_BONUS = 50  # for using all seven tiles in one move
+BINGO_TILES = 7
+
+# Premium squares of the top-left quarter (rows and columns 0-7); the board is symmetric
+_QUARTER_PREMIUMS = {
+    'triple_word': [(0, 0), (0, 7), (7, 0)],
+    'double_word': [(1, 1), (2, 2), (3, 3), (4, 4), (7, 7)],
+    'triple_letter': [(1, 5), (5, 1), (5, 5)],
+    'double_letter': [(0, 3), (2, 6), (3, 0), (3, 7), (6, 2), (6, 6), (7, 3)],
+}
+PREMIUM_NAMES = {
+    'triple_word': "triple word score",
+    'double_word': "double word score",
+    'triple_letter': "triple letter score",
+    'double_letter': "double letter score",
+}
+_MULTIPLIERS = {
+    'triple_word': (1, 3),
+    'double_word': (1, 2),
+    'triple_letter': (3, 1),
+    'double_letter': (2, 1),
+}
+
+
+def _build_premium_layout():
+    layout = [[None] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+    last = BOARD_SIZE - 1
+    for premium, squares in _QUARTER_PREMIUMS.items():
+        for r, c in squares:
+            for rr, cc in ((r, c), (r, last - c), (last - r, c), (last - r, last - c),
+                           (c, r), (c, last - r), (last - c, r), (last - c, last - r)):
+                layout[rr][cc] = premium
+    return layout
+
+
+# PREMIUM_LAYOUT[r][c] is a key of PREMIUM_NAMES or None; the multiplier tables are derived from it once
+PREMIUM_LAYOUT = _build_premium_layout()
+LETTER_MULTIPLIER = [[_MULTIPLIERS[p][0] if p else 1 for p in row] for row in PREMIUM_LAYOUT]
+WORD_MULTIPLIER = [[_MULTIPLIERS[p][1] if p else 1 for p in row] for row in PREMIUM_LAYOUT]
+
+
+def tile_value(letter, letter_points=LETTER_POINTS):
+    """Face value of a tile on the board; blanks are stored as lower-case letters and score nothing"""
+    if letter.islower():
+        return 0
+    return letter_points.get(letter, 0)
+
+
+def score_move(board, move, letter_points=LETTER_POINTS):
+    """Score a move against the board as it was before the move.
+
+    Covers the main word and every cross word the new tiles form. Premium
+    squares only count under newly placed tiles, blanks are worth nothing,
+    and using seven tiles earns the bingo bonus. Only the new tiles and the
+    words running through them are looked at.
+    """
+    new_tiles = {(r, c): (0 if is_blank else letter_points.get(letter, 0))
+                 for r, c, letter, is_blank in move.tiles}
+    if not new_tiles:
+        return 0
+    dr, dc = (0, 1) if move.direction == 'H' else (1, 0)
+
+    def word_score(r, c, dr, dc):
+        """Score of the whole run of tiles through (r, c) along (dr, dc); 0 for a lone tile"""
+        while 0 <= r - dr and 0 <= c - dc and ((r - dr, c - dc) in new_tiles or board.is_occupied(r - dr, c - dc)):
+            r, c = r - dr, c - dc
+        total = 0
+        multiplier = 1
+        length = 0
+        while r < BOARD_SIZE and c < BOARD_SIZE:
+            if (r, c) in new_tiles:
+                total += new_tiles[(r, c)] * LETTER_MULTIPLIER[r][c]
+                multiplier *= WORD_MULTIPLIER[r][c]
+            elif board.is_occupied(r, c):
+                total += tile_value(board.letter(r, c), letter_points)
+            else:
+                break
+            length += 1
+            r, c = r + dr, c + dc
+        return total * multiplier if length > 1 else 0
+
+    first_r, first_c = min(new_tiles)
+    score = word_score(first_r, first_c, dr, dc)
+    for r, c in new_tiles:
+        score += word_score(r, c, dc, dr)
+    if len(new_tiles) == BINGO_TILES:
+        score += BINGO_BONUS
+    return score
@@ -0,0 +1,130 @@
+import argparse
+import multiprocessing
+import statistics
+import time
+
+from scrabble_lexicon import load_lexicon, LEXICON_PATH, WORD_LIST_PATH
+from scrabble_engine import ScrabbleEngine, PLAYERS
+from scrabble_ai import POLICIES, DEFAULT_POLICY
+from scrabble_leaves import default_leave_table
+from percentiles import percentile
+
+# Set in each worker process by _init_worker; the lexicon file is memory-mapped, so workers share its pages
+_lexicon = None
+
+
+def _init_worker(lexicon_path, word_list_path):
+    global _lexicon
+    _lexicon = load_lexicon(lexicon_path, word_list_path)
+
+
+def play_game(seed, time_limit=None, lexicon=None, policies=(DEFAULT_POLICY, DEFAULT_POLICY)):
+    """Play one AI-vs-AI game with a seeded tile bag.
+
+    `policies` names the move choice (a key of scrabble_ai.POLICIES) of each
+    player in PLAYERS order. Returns a dict with the seed, both scores, the
+    number of turns and the move generation time of every turn in seconds.
+    """
+    choosers = dict(zip(PLAYERS, (POLICIES[name] for name in policies)))
+    engine = ScrabbleEngine(lexicon or _lexicon, seed=seed)
+    engine.fill_racks()
+    movegen_times = []
+
+    while not engine.game_over:
+        start = time.perf_counter()
+        moves = engine.legal_moves(time_limit=time_limit)
+        movegen_times.append(time.perf_counter() - start)
+        if moves:
+            engine.apply(choosers[engine.current_turn](engine, moves))
+        else:
+            engine.pass_turn()
+
+    return {
+        'seed': seed,
+        'scores': dict(engine.scores),
+        'turns': len(engine.history),
+        'movegen_times': movegen_times,
+    }
+
+
+def _play_game_task(task):
+    seed, time_limit, policies = task
+    return play_game(seed, time_limit, policies=policies)
+
+
+def run_simulation(games, workers=None, seed=0, time_limit=None,
+                   lexicon_path=LEXICON_PATH, word_list_path=WORD_LIST_PATH,
+                   policies=(DEFAULT_POLICY, DEFAULT_POLICY)):
+    """Play `games` games across a process pool; game i uses tile bag seed `seed + i`.
+
+    Returns (results, elapsed_seconds) with results ordered by seed.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    # Build the lexicon and leave files once up front so workers only ever memory-map them
+    load_lexicon(lexicon_path, word_list_path).close()
+    if any(name != 'score' for name in policies):
+        default_leave_table().prepare()
+
+    tasks = [(seed + i, time_limit, tuple(policies)) for i in range(games)]
+    chunksize = max(1, games // (workers * 4))
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_init_worker,
+                              initargs=(lexicon_path, word_list_path)) as pool:
+        results = list(pool.imap_unordered(_play_game_task, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+
+    results.sort(key=lambda result: result['seed'])
+    return results, elapsed
+
+
+def format_report(results, elapsed, workers):
+    """Human-readable summary of a simulation run"""
+    lines = [f"Games: {len(results)} on {workers} worker(s) in {elapsed:.2f}s "
+             f"({len(results) / elapsed if elapsed else 0:.2f} games/s)"]
+
+    for player in PLAYERS:
+        scores = sorted(result['scores'][player] for result in results)
+        lines.append(f"{player:>6} score: mean {statistics.mean(scores):.1f}, "
+                     f"stdev {statistics.pstdev(scores):.1f}, min {scores[0]}, "
+                     f"p50 {percentile(scores, 50)}, p90 {percentile(scores, 90)}, max {scores[-1]}")
+
+    wins = {player: 0 for player in PLAYERS}
+    ties = 0
+    for result in results:
+        first, second = (result['scores'][player] for player in PLAYERS)
+        if first == second:
+            ties += 1
+        else:
+            wins[PLAYERS[0] if first > second else PLAYERS[1]] += 1
+    lines.append("Wins: " + ", ".join(f"{player} {count}" for player, count in wins.items()) + f", ties {ties}")
+
+    times = sorted(t * 1000 for result in results for t in result['movegen_times'])
+    lines.append(f"Move generation ({len(times)} turns): p50 {percentile(times, 50):.1f}ms, "
+                 f"p90 {percentile(times, 90):.1f}ms, p99 {percentile(times, 99):.1f}ms, "
+                 f"max {times[-1] if times else 0:.1f}ms")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play headless AI-vs-AI Scrabble games and report statistics.")
+    parser.add_argument('-n', '--games', type=int, default=100, help="number of games to play")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('-s', '--seed', type=int, default=0, help="tile bag seed of the first game")
+    parser.add_argument('-t', '--time-limit', type=float, default=None,
+                        help="move generation budget per turn in seconds (default: unlimited)")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default=DEFAULT_POLICY,
+                        help="move choice of the first player")
+    parser.add_argument('--opponent', choices=sorted(POLICIES), default=DEFAULT_POLICY,
+                        help="move choice of the second player")
+    parser.add_argument('--lexicon', default=LEXICON_PATH, help="prebuilt lexicon file")
+    parser.add_argument('--word-list', default=WORD_LIST_PATH, help="word list to build the lexicon from")
+    args = parser.parse_args()
+
+    workers = args.workers or multiprocessing.cpu_count()
+    results, elapsed = run_simulation(args.games, workers, args.seed, args.time_limit,
+                                      args.lexicon, args.word_list, (args.policy, args.opponent))
+    print(format_report(results, elapsed, workers))
+
+
+if __name__ == "__main__":
+    main()
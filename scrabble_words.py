@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from itertools import product
+
+from scrabble_lexicon import LETTERS, WILDCARD
+
+VALIDATION_CACHE_SIZE = 4096  # answers kept; the least recently used are dropped beyond this
+
+
+class WordValidator:
+    """Dictionary checks for played words, memoised in a bounded LRU cache.
+
+    Words are looked up in the lexicon, or in the enchant dictionary when
+    the lexicon is only the built-in fallback list (with neither, every
+    word is accepted, as before). Answers are cached in an OrderedDict, so a
+    word typed, retried and then checked again as part of the move costs
+    one lookup.
+
+    A '*' in a word is a blank tile. expand() lists the words it can make by
+    walking the lexicon's DAWG, instead of guessing one letter for it.
+    """
+
+    def __init__(self, lexicon, dictionary=None, max_entries=VALIDATION_CACHE_SIZE):
+        self.lexicon = lexicon
+        self.dictionary = dictionary
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, key, compute):
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+        self.misses += 1
+        value = self._cache[key] = compute(key[1])
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return value
+
+    def _lookup(self, word):
+        if not self.lexicon.is_fallback:
+            return self.lexicon.contains(word)
+        if self.dictionary:
+            return self.dictionary.check(word.lower())
+        return True
+
+    def _expand(self, pattern):
+        if not self.lexicon.is_fallback or not self.dictionary:
+            return tuple(self.lexicon.matches(pattern))
+        # The fallback list is too small to trust, so try each letter for the blanks against the dictionary
+        slots = pattern.count(WILDCARD)
+        template = pattern.replace(WILDCARD, '{}')
+        return tuple(word for word in (template.format(*letters) for letters in product(LETTERS, repeat=slots))
+                     if self._lookup(word))
+
+    def is_word(self, word):
+        """Whether a word (no blanks) is in the dictionary"""
+        return self._cached(('word', word.upper()), self._lookup)
+
+    def expand(self, pattern):
+        """Every word a pattern can be with each '*' (a blank tile) standing for some letter"""
+        return self._cached(('pattern', pattern.upper()), self._expand)
+
+    def invalid_words(self, words):
+        """The words a move forms that are not in the dictionary, checked in one call"""
+        return [word for word in words if not self.is_word(word)]
@@ -0,0 +1,170 @@
+import bisect
+import itertools
+import threading
+
+# Lower numbers are spoken first
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+MAX_QUEUED = 16  # utterances waiting to be spoken; the oldest of the least important are dropped beyond this
+
+
+class SpeechService:
+    """Text-to-speech on one worker thread that owns the pyttsx3 engine.
+
+    say() only queues the text and returns at once, so it is safe to call
+    from a Tk callback or a pygame event loop. The queue is ordered by
+    priority, then age, and holds at most `max_queued` utterances; past
+    that the oldest one of the lowest priority queued, the likeliest to be
+    out of date, is dropped. Queuing an utterance drops any older queued one
+    with the same key (by default the text itself), so repeated prompts such
+    as "It's your turn now." or a score that changed twice are only spoken
+    once, with the latest value.
+
+    With an AudioCache (see speech_cache), texts that are already rendered
+    are played from disk, and texts worth caching are rendered while the
+    queue is empty.
+
+    The engine (and the voice search) starts on the worker thread, so
+    start() returns at once; `ready` is set once the engine is up or has
+    failed. If pyttsx3 is missing or fails to start, a warning is printed
+    and every call does nothing.
+    """
+
+    def __init__(self, rate=None, voice_keywords=(), max_queued=MAX_QUEUED, cache=None):
+        self.rate = rate
+        self.voice_keywords = voice_keywords
+        self.max_queued = max_queued
+        self.cache = cache if cache is not None and cache.enabled else None
+        self._queue = []  # sorted (priority, sequence, key, text) entries
+        self._to_render = []  # texts the cache should render when there is nothing to say
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._interrupted = False
+        self._rendering = False
+        self._stopped = False
+        self._engine = None
+        self.ready = threading.Event()  # set once the engine has started, or failed to
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def say(self, text, priority=PRIORITY_NORMAL, key=None):
+        """Queue text to be spoken; an older queued utterance with the same key is replaced"""
+        if not text:
+            return
+        key = text if key is None else key
+        with self._condition:
+            if self._stopped:
+                return
+            self._queue = [entry for entry in self._queue if entry[2] != key]
+            bisect.insort(self._queue, (priority, next(self._sequence), key, text))
+            if len(self._queue) > self.max_queued:
+                lowest = self._queue[-1][0]
+                del self._queue[bisect.bisect_left(self._queue, (lowest,))]
+            self._condition.notify()
+
+    def prerender(self, texts):
+        """Have the cache render fixed announcements ahead of time, while the worker is idle"""
+        if self.cache is None:
+            return
+        with self._condition:
+            self._to_render.extend(text for text in texts if text)
+            self._condition.notify()
+
+    def flush(self):
+        """Forget everything still queued"""
+        with self._condition:
+            self._queue.clear()
+
+    def interrupt(self):
+        """Cut off the utterance being spoken and forget everything queued"""
+        with self._condition:
+            self._queue.clear()
+            self._interrupted = True
+
+    def stop(self):
+        """Stop speaking and shut the worker down"""
+        with self._condition:
+            self._queue.clear()
+            self._interrupted = True
+            self._stopped = True
+            self._condition.notify()
+
+    def pending(self):
+        """Number of utterances waiting to be spoken"""
+        with self._condition:
+            return len(self._queue)
+
+    def _start_engine(self):
+        # The engine is created on the worker thread, which is the only thread that ever touches it
+        try:
+            import pyttsx3
+            engine = pyttsx3.init()
+        except Exception as e:
+            print(f"Warning: pyttsx3 initialization failed: {e}")
+            return None
+
+        if self.voice_keywords:
+            for voice in engine.getProperty('voices'):
+                if any(keyword in voice.name.lower() for keyword in self.voice_keywords):
+                    engine.setProperty('voice', voice.id)
+                    break
+        if self.rate is not None:
+            engine.setProperty('rate', self.rate)
+        # interrupt() only sets a flag; the engine is stopped from its own callback on this thread
+        engine.connect('started-word', self._on_word)
+        return engine
+
+    def _on_word(self, name, location, length):
+        if self._interrupted and not self._rendering:
+            self._engine.stop()
+
+    def _run(self):
+        self._engine = self._start_engine()
+        if self._engine is None:
+            self.cache = None
+        else:
+            voice_key = (self._engine.getProperty('voice'), self._engine.getProperty('rate'))
+        self.ready.set()
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopped and not (self._to_render and self.cache):
+                    self._condition.wait()
+                if self._stopped:
+                    break
+                rendering = not self._queue
+                if rendering:
+                    text = self._to_render.pop(0)
+                else:
+                    _, _, _, text = self._queue.pop(0)
+                    self._interrupted = False
+            if self._engine is None:
+                continue
+
+            if rendering:
+                # Idle: render one clip for the cache, then look at the queue again
+                self._rendering = True
+                self.cache.render(self._engine, text, *voice_key)
+                self._rendering = False
+                continue
+
+            if self.cache is not None:
+                path = self.cache.lookup(text, *voice_key)
+                if path is not None:
+                    try:
+                        self.cache.play(path, lambda: self._interrupted)
+                        continue
+                    except Exception as e:
+                        print(f"Warning: could not play cached speech: {e}")
+            try:
+                self._engine.say(text)
+                self._engine.runAndWait()
+            except Exception as e:
+                print(f"Warning: speech failed: {e}")
+            if self.cache is not None and self.cache.wants(text, *voice_key):
+                with self._condition:
+                    self._to_render.append(text)
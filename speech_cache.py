@@ -0,0 +1,123 @@
+import os
+import hashlib
+import time
+
+try:
+    import simpleaudio  # optional: plays cached clips; without it every utterance is synthesised live
+except ImportError:
+    simpleaudio = None
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'speech_cache')
+CACHE_MAX_BYTES = 64 * 1024 * 1024  # least recently played clips are deleted beyond this
+RENDER_AFTER = 2  # a text is rendered to disk the second time it is spoken
+PLAYBACK_POLL = 0.02  # seconds between interrupt checks while a clip plays
+
+
+class AudioCache:
+    """Synthesised utterances saved as WAV files, keyed by text, voice and rate.
+
+    Clips are rendered with pyttsx3's save_to_file() and played back with
+    simpleaudio, so a repeated announcement starts at once and costs no
+    synthesis. Files are named by a hash of the key; a file's modification
+    time is bumped whenever it is played, and the least recently played
+    clips are deleted once the directory grows past `max_bytes`.
+
+    The cache is only enabled when simpleaudio is installed. All methods
+    are called from the speech worker thread.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES, render_after=RENDER_AFTER):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.render_after = render_after
+        self.enabled = simpleaudio is not None
+        self._requests = {}  # key -> times spoken while not cached
+        self._index = None  # file name -> (last played, size), read from the directory on first use
+
+    def _load_index(self):
+        self._index = {}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.wav'):
+                    stat = entry.stat()
+                    self._index[entry.name] = (stat.st_mtime, stat.st_size)
+        except OSError as e:
+            print(f"Warning: speech cache unavailable: {e}")
+            self.enabled = False
+
+    def _file_name(self, text, voice, rate):
+        key = f"{voice}\0{rate}\0{text}".encode('utf-8')
+        return hashlib.sha1(key).hexdigest() + '.wav'
+
+    def lookup(self, text, voice, rate):
+        """Path of the cached clip, or None; counts the request towards rendering it"""
+        if not self.enabled:
+            return None
+        if self._index is None:
+            self._load_index()
+        name = self._file_name(text, voice, rate)
+        if name in self._index:
+            path = os.path.join(self.directory, name)
+            now = time.time()
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                del self._index[name]  # deleted behind our back
+                return None
+            self._index[name] = (now, self._index[name][1])
+            return path
+        self._requests[name] = self._requests.get(name, 0) + 1
+        return None
+
+    def wants(self, text, voice, rate):
+        """Whether a text spoken live has now been requested often enough to render"""
+        if not self.enabled or self._index is None:
+            return False
+        name = self._file_name(text, voice, rate)
+        return name not in self._index and self._requests.get(name, 0) >= self.render_after
+
+    def render(self, engine, text, voice, rate):
+        """Synthesise a text to the cache with the worker's engine; returns the path or None"""
+        if not self.enabled:
+            return None
+        if self._index is None:
+            self._load_index()
+        name = self._file_name(text, voice, rate)
+        if name in self._index:
+            return os.path.join(self.directory, name)
+        path = os.path.join(self.directory, name)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            engine.save_to_file(text, temp_path)
+            engine.runAndWait()
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+        except (OSError, RuntimeError) as e:
+            print(f"Warning: could not cache speech: {e}")
+            return None
+        self._index[name] = (time.time(), size)
+        self._requests.pop(name, None)
+        self._evict()
+        return path
+
+    def _evict(self):
+        total = sum(size for _, size in self._index.values())
+        for name, (_, size) in sorted(self._index.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            del self._index[name]
+            total -= size
+
+    def play(self, path, interrupted):
+        """Play a clip to the end, or until the `interrupted` callable returns True"""
+        playing = simpleaudio.WaveObject.from_wave_file(path).play()
+        while playing.is_playing():
+            if interrupted():
+                playing.stop()
+                break
+            time.sleep(PLAYBACK_POLL)
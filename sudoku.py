@@ -1,7 +1,15 @@
 import pygame
 import sys
-import pyttsx3
-import random # Used here just to pick a random puzzle
+import os
+import random
+from speech import SpeechService
+from speech_cache import AudioCache
+from sudoku_board import SudokuBoard
+from sudoku_rules import is_valid_move, is_board_complete, is_game_won
+from sudoku_generator import generate_puzzle
+from sudoku_solver import solve, parse_grid
+from sudoku_bank import PuzzleBank
+from sudoku_starter_puzzles import STARTER_PUZZLES
 
 # --- Configuration ---
 SCREEN_WIDTH = 700
@@ -20,6 +28,9 @@ BLUE = (0, 0, 255)
 RED = (255, 0, 0)
 LIGHT_BLUE = (173, 216, 230) # For selected cell
 
+# Rendered text is cached; the cache is emptied when it grows past this many entries
+TEXT_CACHE_SIZE = 256
+
 # Font sizes
 FONT_SIZE_LARGE = 40
 FONT_SIZE_MEDIUM = 24
@@ -31,113 +42,88 @@ STATE_RULES = 1 # New state to show rules
 STATE_GAME = 2
 STATE_WIN = 3
 
-# --- Pre-defined Puzzles ---
-# You can add more puzzles here. 0 represents an empty cell.
-PUZZLES = [
-    [ # Easy Puzzle 1
-        [5, 3, 0, 0, 7, 0, 0, 0, 0],
-        [6, 0, 0, 1, 9, 5, 0, 0, 0],
-        [0, 9, 8, 0, 0, 0, 0, 6, 0],
-        [8, 0, 0, 0, 6, 0, 0, 0, 3],
-        [4, 0, 0, 8, 0, 3, 0, 0, 1],
-        [7, 0, 0, 0, 2, 0, 0, 0, 6],
-        [0, 6, 0, 0, 0, 0, 2, 8, 0],
-        [0, 0, 0, 4, 1, 9, 0, 0, 5],
-        [0, 0, 0, 0, 8, 0, 0, 7, 9]
-    ],
-    [ # Medium Puzzle 2
-        [0, 0, 0, 2, 6, 0, 7, 0, 1],
-        [6, 8, 0, 0, 7, 0, 0, 9, 0],
-        [1, 9, 0, 0, 0, 4, 5, 0, 0],
-        [8, 2, 0, 1, 0, 0, 0, 4, 0],
-        [0, 0, 4, 6, 0, 2, 9, 0, 0],
-        [0, 5, 0, 0, 0, 3, 0, 2, 8],
-        [0, 0, 9, 3, 0, 0, 0, 7, 4],
-        [0, 4, 0, 0, 5, 0, 0, 3, 6],
-        [7, 0, 3, 0, 1, 8, 0, 0, 0]
-    ]
-]
-
+# --- Puzzles ---
+# Puzzles come from the puzzle bank (build it with: python sudoku_bank.py);
+# without one they come from the starter puzzles shipped with the game
+PUZZLE_DIFFICULTY = 'medium' # 'easy', 'medium', 'hard' or 'expert', as rated by the solving techniques needed
+puzzle_bank = PuzzleBank()
 
 # --- Initialization ---
-pygame.init()
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Accessible Sudoku")
-
-# Font setup
-font_large = pygame.font.SysFont('Arial', FONT_SIZE_LARGE)
-font_medium = pygame.font.SysFont('Arial', FONT_SIZE_MEDIUM)
-font_small = pygame.font.SysFont('Arial', FONT_SIZE_SMALL)
-
-# Text-to-Speech Engine
-try:
-    tts_engine = pyttsx3.init()
-    # Adjust rate/volume if needed
-    # tts_engine.setProperty('rate', 150)
-    # tts_engine.setProperty('volume', 0.9)
-except Exception as e:
-    print(f"Warning: pyttsx3 initialization failed: {e}")
-    tts_engine = None # Disable TTS if it fails
+# The window and fonts are opened by main() and speech starts with the first
+# announcement, so importing this module opens no window and starts no TTS.
+# Tools that only need the rules should import sudoku_rules, which loads no pygame.
+screen = None
+font_large = None
+font_medium = None
+font_small = None
+speech = None
+
+# Surfaces drawn once by init_display(); frames are then copied from them instead of redrawn
+rules_background = None # The rules screen
+grid_background = None # The empty grid on a white window
+highlight_background = None # The empty grid with every cell highlighted, to copy the selected cell from
+text_cache = {} # (text, font, color) -> rendered surface
+
+def init_display():
+    """Open the game window and load the fonts."""
+    global screen, font_large, font_medium, font_small
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Accessible Sudoku")
+
+    # Font setup
+    font_large = pygame.font.SysFont('Arial', FONT_SIZE_LARGE)
+    font_medium = pygame.font.SysFont('Arial', FONT_SIZE_MEDIUM)
+    font_small = pygame.font.SysFont('Arial', FONT_SIZE_SMALL)
+    init_backgrounds()
+
+def init_backgrounds():
+    """Draw the parts of the screen that never change onto their own surfaces."""
+    global rules_background, grid_background, highlight_background
+    rules_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    rules_background.fill(WHITE)
+    draw_rules(rules_background)
+
+    grid_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    grid_background.fill(WHITE)
+    draw_grid_lines(grid_background)
+
+    highlight_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    highlight_background.fill(LIGHT_BLUE)
+    draw_grid_lines(highlight_background)
+
+def init_speech():
+    """Start Text-to-Speech on its own worker thread (it prints a warning and stays silent if pyttsx3 fails)."""
+    global speech
+    # Adjust rate if needed, e.g. SpeechService(rate=150)
+    # Repeated announcements are played from an on-disk audio cache when simpleaudio is installed
+    speech = SpeechService(cache=AudioCache()).start()
+    speech.prerender(["Please enter your name.", "Game starting. Good luck!"])
 
 def say(text):
     """Helper function to speak text using the TTS engine."""
-    if tts_engine:
-        tts_engine.say(text)
-        # Using runAndWait() blocks the main loop. For non-blocking speech,
-        # you'd run this in a separate thread, but for simple announcements it's okay.
-        tts_engine.runAndWait()
-
-# --- Sudoku Logic Functions ---
-
-def is_valid_move(board, num, row, col):
-    """Checks if placing 'num' at (row, col) is valid according to Sudoku rules."""
-    # Check row
-    for c in range(GRID_SIZE):
-        if board[row][c] == num and c != col: # Check other cells in the row
-            return False
-
-    # Check column
-    for r in range(GRID_SIZE):
-        if board[r][col] == num and r != row: # Check other cells in the column
-            return False
-
-    # Check 3x3 box
-    start_row = row - row % 3
-    start_col = col - col % 3
-    for r in range(3):
-        for c in range(3):
-            if board[r + start_row][c + start_col] == num and (r + start_row != row or c + start_col != col):
-                 return False
-
-    return True # It's valid!
-
-def is_board_complete(board):
-    """Checks if there are any empty cells (0s) left on the board."""
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            if board[r][c] == 0:
-                return False
-    return True
-
-def is_game_won(board):
-    """Checks if the board is complete AND all numbers are valid."""
-    if not is_board_complete(board):
-        return False # Not complete yet
-
-    # Check validity of every cell
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            num = board[r][c]
-            if num != 0 and not is_valid_move(board, num, r, c):
-                return False # Found an invalid number placement
-
-    return True # Complete and all placements are valid!
+    # Only queues the text, so the event loop and rendering never wait for speech
+    if speech is None:
+        init_speech()
+    speech.say(text)
 
 # --- Drawing Functions ---
 
-def draw_text(surface, text, x, y, color=BLACK, font=font_medium, center=False):
+def render_text(text, color, font):
+    """Rendered text, from the cache when the same text was drawn before in the same font and colour."""
+    key = (text, font, color)
+    txt_surface = text_cache.get(key)
+    if txt_surface is None:
+        if len(text_cache) >= TEXT_CACHE_SIZE:
+            text_cache.clear() # Typed names leave one entry per keystroke; the rest comes back on first use
+        txt_surface = text_cache[key] = font.render(text, True, color)
+    return txt_surface
+
+def draw_text(surface, text, x, y, color=BLACK, font=None, center=False):
     """Helper to draw text."""
-    txt_surface = font.render(text, True, color)
+    if font is None:
+        font = font_medium
+    txt_surface = render_text(text, color, font)
     if center:
         txt_rect = txt_surface.get_rect(center=(x, y))
         surface.blit(txt_surface, txt_rect)
@@ -145,9 +131,13 @@ def draw_text(surface, text, x, y, color=BLACK, font=font_medium, center=False):
         surface.blit(txt_surface, (x, y))
 
 
-def draw_grid(surface, board, original_board, selected_cell):
-    """Draw the Sudoku grid, numbers, and highlight the selected cell."""
-    # Draw grid lines
+def cell_rect(row, col):
+    """Screen rectangle of a cell."""
+    return pygame.Rect(GRID_POS_X + col * CELL_SIZE, GRID_POS_Y + row * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+
+
+def draw_grid_lines(surface):
+    """Draw the grid lines, thicker around the 3x3 boxes."""
     for i in range(GRID_SIZE + 1):
         thickness = 3 if i % 3 == 0 else 1 # Thicker lines for 3x3 boxes
         # Vertical lines
@@ -161,39 +151,56 @@ def draw_grid(surface, board, original_board, selected_cell):
                          (GRID_POS_X + GRID_SIZE * CELL_SIZE, GRID_POS_Y + i * CELL_SIZE),
                          thickness)
 
+
+def draw_number(surface, board, original_board, r, c):
+    """Draw the number in one cell, if it has one."""
+    num = board[r][c]
+    if num != 0:
+        num_text = str(num)
+
+        # Determine color based on original board and validity
+        if original_board[r][c] != 0:
+            color = BLACK # Original numbers are black
+            font_to_use = font_large
+        else:
+            # Player-entered numbers
+            # Check validity of THIS number at THIS position against the current board state
+            if is_valid_move(board, num, r, c):
+                 color = BLUE # Valid moves in blue
+            else:
+                 color = RED # Invalid moves in red
+
+            font_to_use = font_large # Use large font for entered numbers too
+
+
+        # Center the number in the cell
+        text_x = GRID_POS_X + c * CELL_SIZE + CELL_SIZE // 2
+        text_y = GRID_POS_Y + r * CELL_SIZE + CELL_SIZE // 2
+        draw_text(surface, num_text, text_x, text_y, color, font_to_use, center=True)
+
+
+def draw_grid(surface, board, original_board, selected_cell):
+    """Draw the Sudoku grid, numbers, and highlight the selected cell."""
+    surface.blit(grid_background, (0, 0)) # Grid lines on a white window
+
     # Highlight selected cell
     if selected_cell:
-        r, c = selected_cell
-        pygame.draw.rect(surface, LIGHT_BLUE,
-                         (GRID_POS_X + c * CELL_SIZE, GRID_POS_Y + r * CELL_SIZE, CELL_SIZE, CELL_SIZE), 0)
-
+        rect = cell_rect(*selected_cell)
+        surface.blit(highlight_background, rect, rect)
 
     # Draw numbers
     for r in range(GRID_SIZE):
         for c in range(GRID_SIZE):
-            num = board[r][c]
-            if num != 0:
-                num_text = str(num)
-
-                # Determine color based on original board and validity
-                if original_board[r][c] != 0:
-                    color = BLACK # Original numbers are black
-                    font_to_use = font_large
-                else:
-                    # Player-entered numbers
-                    # Check validity of THIS number at THIS position against the current board state
-                    if is_valid_move(board, num, r, c):
-                         color = BLUE # Valid moves in blue
-                    else:
-                         color = RED # Invalid moves in red
+            draw_number(surface, board, original_board, r, c)
 
-                    font_to_use = font_large # Use large font for entered numbers too
 
-
-                # Center the number in the cell
-                text_x = GRID_POS_X + c * CELL_SIZE + CELL_SIZE // 2
-                text_y = GRID_POS_Y + r * CELL_SIZE + CELL_SIZE // 2
-                draw_text(surface, num_text, text_x, text_y, color, font_to_use, center=True)
+def draw_cell(surface, board, original_board, r, c, selected):
+    """Redraw a single cell on its own; returns the rectangle to update on screen."""
+    rect = cell_rect(r, c)
+    # Copying the cell from a background restores its fill and its piece of the grid lines
+    surface.blit(highlight_background if selected else grid_background, rect, rect)
+    draw_number(surface, board, original_board, r, c)
+    return rect
 
 
 def draw_rules(surface):
@@ -209,6 +216,7 @@ def draw_rules(surface):
         "Click on a cell to select it.",
         "Use numbers 1-9 on your keyboard to enter a digit.",
         "Use Backspace or Delete to clear a cell.",
+        "Press H for a hint.",
         "",
         "Press ENTER to start the game!"
     ]
@@ -217,137 +225,231 @@ def draw_rules(surface):
         draw_text(surface, line, SCREEN_WIDTH // 2, y_offset, BLACK, font_small, center=True)
         y_offset += 25 # Spacing between lines
 
-# --- Game Variables ---
-game_state = STATE_NAME_ENTRY
-player_name = ""
-selected_cell = None # (row, col) of the currently selected cell
-
-original_board = None # To store the initial puzzle state
-player_board = None # To store the player's current state (including their inputs)
-
-# --- Helper to load a puzzle ---
-def load_puzzle():
-    global original_board, player_board
-    chosen_puzzle = random.choice(PUZZLES)
-    original_board = [row[:] for row in chosen_puzzle] # Deep copy
-    player_board = [row[:] for row in chosen_puzzle]   # Start player board with original numbers
-
-# --- Main Game Loop ---
-running = True
-while running:
-    # --- Event Handling ---
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-
-        # --- Name Entry State ---
-        if game_state == STATE_NAME_ENTRY:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    if player_name.strip(): # Proceed only if name is not empty
-                        print(f"Player name entered: {player_name}")
-                        say(f"Welcome {player_name}")
-                        game_state = STATE_RULES # Go to rules state after name
-                    else:
-                        say("Please enter your name.")
-                elif event.key == pygame.K_BACKSPACE:
-                    player_name = player_name[:-1]
-                elif event.unicode: # Handle regular characters
-                    # Only add characters that are printable and not control chars
-                    if event.unicode.isalnum() or event.unicode.isspace():
-                         player_name += event.unicode
-
-        # --- Rules State ---
-        elif game_state == STATE_RULES:
-             if event.type == pygame.KEYDOWN:
-                  if event.key == pygame.K_RETURN:
-                       load_puzzle() # Load a random puzzle
-                       say("Game starting. Good luck!")
-                       game_state = STATE_GAME
-
-        # --- Game State ---
-        elif game_state == STATE_GAME:
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                x, y = event.pos
-                # Check if click is within the grid area
-                if GRID_POS_X <= x < GRID_POS_X + GRID_SIZE * CELL_SIZE and \
-                   GRID_POS_Y <= y < GRID_POS_Y + GRID_SIZE * CELL_SIZE:
-                    # Calculate which cell was clicked
-                    col = (x - GRID_POS_X) // CELL_SIZE
-                    row = (y - GRID_POS_Y) // CELL_SIZE
-                    selected_cell = (row, col)
-                    print(f"Selected cell: ({row}, {col})")
-                else:
-                    selected_cell = None # Clicked outside the grid
-
-            if event.type == pygame.KEYDOWN and selected_cell:
-                row, col = selected_cell
-                # Only allow input if the cell is not part of the original puzzle
-                if original_board[row][col] == 0:
-                    # Handle number keys 1-9
-                    if pygame.K_1 <= event.key <= pygame.K_9:
-                        num = event.key - pygame.K_0 # Convert key code to integer 1-9
-                        player_board[row][col] = num
-                        print(f"Entered {num} at ({row}, {col})")
-
-                        # Check for win condition after every valid number entry
-                        if is_board_complete(player_board) and is_game_won(player_board):
-                             game_state = STATE_WIN
-                             say(f"Congratulations {player_name}! You solved the puzzle!")
-                             print("Game Won!")
-
-                    # Handle delete/backspace to clear cell
-                    elif event.key == pygame.K_BACKSPACE or event.key == pygame.K_DELETE:
-                        player_board[row][col] = 0
-                        print(f"Cleared cell ({row}, {col})")
-
-
-        # --- Win State ---
-        elif game_state == STATE_WIN:
-            # Could add a button to play again, or just display the message
-            pass # Currently just displays the win message
-
-    # --- Drawing ---
-    screen.fill(WHITE) # Background color
-
+def draw_screen(surface):
+    """Draw the whole window for the current game state."""
     if game_state == STATE_NAME_ENTRY:
-        draw_text(screen, "Enter your name:", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50, BLACK, font_medium, center=True)
+        surface.fill(WHITE) # Background color
+        draw_text(surface, "Enter your name:", SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50, BLACK, font_medium, center=True)
         # Draw input box (simple underline or rectangle)
         input_box_y = SCREEN_HEIGHT // 2
         input_box_width = 300
         input_box_x = SCREEN_WIDTH // 2 - input_box_width // 2
-        pygame.draw.line(screen, BLACK, (input_box_x, input_box_y + 5), (input_box_x + input_box_width, input_box_y + 5), 2)
-        draw_text(screen, player_name, SCREEN_WIDTH // 2, input_box_y - 30, BLACK, font_medium, center=True)
-        draw_text(screen, "(Press Enter)", SCREEN_WIDTH // 2, input_box_y + 30, DARK_GRAY, font_small, center=True)
+        pygame.draw.line(surface, BLACK, (input_box_x, input_box_y + 5), (input_box_x + input_box_width, input_box_y + 5), 2)
+        draw_text(surface, player_name, SCREEN_WIDTH // 2, input_box_y - 30, BLACK, font_medium, center=True)
+        draw_text(surface, "(Press Enter)", SCREEN_WIDTH // 2, input_box_y + 30, DARK_GRAY, font_small, center=True)
 
 
     elif game_state == STATE_RULES:
-        draw_rules(screen)
+        surface.blit(rules_background, (0, 0))
 
     elif game_state == STATE_GAME or game_state == STATE_WIN:
-        # Draw Sudoku Grid
-        draw_grid(screen, player_board, original_board, selected_cell)
+        # Draw Sudoku Grid (this also clears the window)
+        draw_grid(surface, player_board, original_board, selected_cell)
 
         # Display instructions/messages below the grid
         messages_y_start = GRID_POS_Y + GRID_SIZE * CELL_SIZE + 20
-        draw_text(screen, f"Player: {player_name}", GRID_POS_X, messages_y_start, BLACK, font_medium)
+        draw_text(surface, f"Player: {player_name}", GRID_POS_X, messages_y_start, BLACK, font_medium)
 
         if game_state == STATE_GAME:
-             draw_text(screen, "Select a cell and type a number (1-9)", GRID_POS_X, messages_y_start + 40, DARK_GRAY, font_small)
-             draw_text(screen, "Incorrect numbers are shown in Red.", GRID_POS_X, messages_y_start + 70, DARK_GRAY, font_small)
+             draw_text(surface, "Select a cell and type a number (1-9), or press H for a hint", GRID_POS_X, messages_y_start + 40, DARK_GRAY, font_small)
+             draw_text(surface, "Incorrect numbers are shown in Red.", GRID_POS_X, messages_y_start + 70, DARK_GRAY, font_small)
 
         elif game_state == STATE_WIN:
-            draw_text(screen, f"Congratulations {player_name}! You solved it!", SCREEN_WIDTH // 2, messages_y_start + 40, BLUE, font_large, center=True)
-            draw_text(screen, "Press ESC to Quit", SCREEN_WIDTH // 2, messages_y_start + 100, DARK_GRAY, font_small, center=True)
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                 running = False # Allow quitting from win screen
+            draw_text(surface, f"Congratulations {player_name}! You solved it!", SCREEN_WIDTH // 2, messages_y_start + 40, BLUE, font_large, center=True)
+            draw_text(surface, "Press ESC to Quit", SCREEN_WIDTH // 2, messages_y_start + 100, DARK_GRAY, font_small, center=True)
 
-    pygame.display.flip()
+# --- Game Variables ---
+game_state = STATE_NAME_ENTRY
+player_name = ""
+selected_cell = None # (row, col) of the currently selected cell
+dirty_cells = set() # Cells to redraw on the next frame, when the rest of the screen is unchanged
+
+original_board = None # To store the initial puzzle state
+player_board = None # SudokuBoard with the player's current state (including their inputs)
+solution_board = None # The puzzle's solution, used for hints
+
+# --- Helper to load a puzzle ---
+def load_puzzle():
+    global original_board, player_board, solution_board
+    chosen_puzzle = None
+    if os.path.exists(puzzle_bank.path):
+        try:
+            chosen_puzzle = puzzle_bank.random_puzzle(PUZZLE_DIFFICULTY)
+        except ValueError as e:
+            print(f"Warning: {e}")
+    if not chosen_puzzle and STARTER_PUZZLES.get(PUZZLE_DIFFICULTY):
+        chosen_puzzle = parse_grid(random.choice(STARTER_PUZZLES[PUZZLE_DIFFICULTY]))
+    if chosen_puzzle:
+        solution_board = solve(chosen_puzzle)
+    else:
+        chosen_puzzle, solution_board, difficulty = generate_puzzle(PUZZLE_DIFFICULTY)
+        if difficulty != PUZZLE_DIFFICULTY:
+            print(f"Warning: no {PUZZLE_DIFFICULTY} puzzle was found; this one grades as {difficulty}.")
+    original_board = [row[:] for row in chosen_puzzle] # Deep copy
+    player_board = SudokuBoard(chosen_puzzle)   # Start player board with original numbers
+
+# --- Helpers to mark what needs redrawing ---
+def select_cell(cell):
+    """Move the selection, marking the old and new cells for redrawing."""
+    global selected_cell
+    if cell != selected_cell:
+        for changed in (selected_cell, cell):
+            if changed:
+                dirty_cells.add(changed)
+        selected_cell = cell
+
+def mark_number_changed(row, col):
+    """Mark a changed cell for redrawing, with its row, column and box, whose numbers may change colour."""
+    start_row = row - row % 3
+    start_col = col - col % 3
+    for i in range(GRID_SIZE):
+        dirty_cells.add((row, i))
+        dirty_cells.add((i, col))
+        dirty_cells.add((start_row + i // 3, start_col + i % 3))
+
+# --- Helper to give a hint ---
+def give_hint():
+    """Point out a wrong number, or fill in one cell (the selected one if it is empty)."""
+    # A wrong number is the most useful thing to know about
+    for r in range(GRID_SIZE):
+        for c in range(GRID_SIZE):
+            if player_board[r][c] and player_board[r][c] != solution_board[r][c]:
+                select_cell((r, c))
+                say(f"The number at row {r + 1}, column {c + 1} is not right.")
+                return
 
-# --- Cleanup ---
-if tts_engine:
-     # pyttsx3 does its own cleanup on exit
-     pass # tts_engine.stop() might stop active speech, but runAndWait() blocks anyway
+    if selected_cell and player_board[selected_cell[0]][selected_cell[1]] == 0:
+        cell = selected_cell
+    else:
+        cell = next(((r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE) if player_board[r][c] == 0), None)
+    if cell is None:
+        return
+    r, c = cell
+    player_board.set(r, c, solution_board[r][c])
+    mark_number_changed(r, c)
+    select_cell(cell)
+    say(f"Row {r + 1}, column {c + 1} is {solution_board[r][c]}.")
 
-pygame.quit()
-sys.exit()
\ No newline at end of file
+# --- Main Game Loop ---
+def main():
+    global game_state, player_name
+    init_display()
+
+    running = True
+    redraw_all = True # Repaint the whole window rather than just the dirty cells
+    while running:
+        # --- Event Handling ---
+        # Sleep until an event arrives: nothing on screen changes without one,
+        # so an idle game uses no CPU. Then take everything else that is queued.
+        events = [pygame.event.wait()]
+        events.extend(pygame.event.get())
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEOEXPOSE:
+                redraw_all = True # The window was uncovered or restored
+
+            # --- Name Entry State ---
+            if game_state == STATE_NAME_ENTRY:
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_RETURN:
+                        if player_name.strip(): # Proceed only if name is not empty
+                            print(f"Player name entered: {player_name}")
+                            say(f"Welcome {player_name}")
+                            game_state = STATE_RULES # Go to rules state after name
+                            redraw_all = True
+                        else:
+                            say("Please enter your name.")
+                    elif event.key == pygame.K_BACKSPACE:
+                        player_name = player_name[:-1]
+                        redraw_all = True
+                    elif event.unicode: # Handle regular characters
+                        # Only add characters that are printable and not control chars
+                        if event.unicode.isalnum() or event.unicode.isspace():
+                             player_name += event.unicode
+                             redraw_all = True
+
+            # --- Rules State ---
+            elif game_state == STATE_RULES:
+                 if event.type == pygame.KEYDOWN:
+                      if event.key == pygame.K_RETURN:
+                           load_puzzle() # Generate a new puzzle
+                           say("Game starting. Good luck!")
+                           game_state = STATE_GAME
+                           redraw_all = True
+
+            # --- Game State ---
+            elif game_state == STATE_GAME:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_h:
+                    give_hint()
+                    if is_board_complete(player_board) and is_game_won(player_board):
+                        game_state = STATE_WIN
+                        redraw_all = True
+                        say(f"Congratulations {player_name}! You solved the puzzle!")
+                        print("Game Won!")
+
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    x, y = event.pos
+                    # Check if click is within the grid area
+                    if GRID_POS_X <= x < GRID_POS_X + GRID_SIZE * CELL_SIZE and \
+                       GRID_POS_Y <= y < GRID_POS_Y + GRID_SIZE * CELL_SIZE:
+                        # Calculate which cell was clicked
+                        col = (x - GRID_POS_X) // CELL_SIZE
+                        row = (y - GRID_POS_Y) // CELL_SIZE
+                        select_cell((row, col))
+                        print(f"Selected cell: ({row}, {col})")
+                    else:
+                        select_cell(None) # Clicked outside the grid
+
+                if event.type == pygame.KEYDOWN and selected_cell:
+                    row, col = selected_cell
+                    # Only allow input if the cell is not part of the original puzzle
+                    if original_board[row][col] == 0:
+                        # Handle number keys 1-9
+                        if pygame.K_1 <= event.key <= pygame.K_9:
+                            num = event.key - pygame.K_0 # Convert key code to integer 1-9
+                            player_board.set(row, col, num)
+                            mark_number_changed(row, col)
+                            print(f"Entered {num} at ({row}, {col})")
+
+                            # Check for win condition after every valid number entry
+                            if is_board_complete(player_board) and is_game_won(player_board):
+                                 game_state = STATE_WIN
+                                 redraw_all = True
+                                 say(f"Congratulations {player_name}! You solved the puzzle!")
+                                 print("Game Won!")
+
+                        # Handle delete/backspace to clear cell
+                        elif event.key == pygame.K_BACKSPACE or event.key == pygame.K_DELETE:
+                            player_board.clear(row, col)
+                            mark_number_changed(row, col)
+                            print(f"Cleared cell ({row}, {col})")
+
+
+            # --- Win State ---
+            elif game_state == STATE_WIN:
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                     running = False # Allow quitting from win screen
+
+        # --- Drawing ---
+        if redraw_all:
+            draw_screen(screen)
+            pygame.display.flip()
+            redraw_all = False
+            dirty_cells.clear()
+        elif dirty_cells:
+            # Only the changed cells are drawn and sent to the display
+            rects = [draw_cell(screen, player_board, original_board, r, c, (r, c) == selected_cell)
+                     for r, c in dirty_cells]
+            pygame.display.update(rects)
+            dirty_cells.clear()
+
+    # --- Cleanup ---
+    if speech:
+        speech.stop()
+
+    pygame.quit()
+    sys.exit()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,157 @@
+import os
+import random
+import struct
+import argparse
+import multiprocessing
+
+from sudoku_board import GRID_SIZE
+from sudoku_generator import random_solution, carve_puzzle, DIFFICULTY_CLUES
+from sudoku_grader import grade, LEVELS
+from datafile import map_file, write_atomically
+
+BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'puzzles.bank')
+
+# File layout: header, one index entry per difficulty, then the puzzles grouped by difficulty.
+# Difficulties are the levels sudoku_grader assigns, not the generator's clue targets.
+# Each puzzle is 81 cells packed two to a byte (high nibble first, 0 for empty).
+FILE_MAGIC = b'SDKB'
+FILE_VERSION = 1
+HEADER = struct.Struct('<4sIII')  # magic, version, difficulty count, puzzle count
+INDEX_ENTRY = struct.Struct('<16sII')  # difficulty name, first puzzle, puzzle count
+CELL_COUNT = GRID_SIZE * GRID_SIZE
+RECORD_SIZE = (CELL_COUNT + 1) // 2
+
+
+def pack_puzzle(board):
+    """41-byte record for a 9x9 grid"""
+    cells = [num for row in board for num in row] + [0]
+    return bytes(cells[i] << 4 | cells[i + 1] for i in range(0, CELL_COUNT, 2))
+
+
+def unpack_puzzle(record):
+    """9x9 grid from a 41-byte record"""
+    cells = []
+    for byte in record:
+        cells.append(byte >> 4)
+        cells.append(byte & 0xF)
+    return [cells[r * GRID_SIZE:(r + 1) * GRID_SIZE] for r in range(GRID_SIZE)]
+
+
+def write_bank(puzzles_by_difficulty, path=BANK_PATH):
+    """Write {difficulty: [grid, ...]} to a bank file; returns the number of puzzles"""
+    index = []
+    records = []
+    for name, puzzles in puzzles_by_difficulty.items():
+        index.append(INDEX_ENTRY.pack(name.encode('ascii'), len(records), len(puzzles)))
+        records.extend(pack_puzzle(puzzle) for puzzle in puzzles)
+
+    write_atomically(path, (HEADER.pack(FILE_MAGIC, FILE_VERSION, len(index), len(records)),
+                            b''.join(index), b''.join(records)))
+    return len(records)
+
+
+def _generate_task(seed):
+    """Carve one puzzle (cycling through the clue targets) and grade it"""
+    rng = random.Random(seed)
+    puzzle = carve_puzzle(random_solution(rng), DIFFICULTY_CLUES[LEVELS[seed % len(LEVELS)]], rng)
+    return grade(puzzle).difficulty, puzzle
+
+
+def build_bank(count, path=BANK_PATH, seed=0, workers=None, max_attempts=None):
+    """Generate and grade puzzles across a process pool until every difficulty has `count`, then write the bank.
+
+    Hard and expert puzzles are rare, so generation gives up after
+    `max_attempts` puzzles (by default 50 per puzzle wanted) and the bank
+    holds what was found. Attempt i uses seed `seed + i`, so a build is
+    reproducible. Returns the number of puzzles of each difficulty.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    max_attempts = max_attempts or count * len(LEVELS) * 50
+    puzzles = {level: [] for level in LEVELS}
+    with multiprocessing.Pool(workers) as pool:
+        for difficulty, puzzle in pool.imap(_generate_task, range(seed, seed + max_attempts), chunksize=16):
+            if len(puzzles[difficulty]) < count:
+                puzzles[difficulty].append(puzzle)
+                if all(len(found) >= count for found in puzzles.values()):
+                    break
+    write_bank(puzzles, path)
+    return {level: len(found) for level, found in puzzles.items()}
+
+
+class PuzzleBank:
+    """Puzzles stored in a bank file, memory-mapped on first use.
+
+    Opening the bank reads only the header and the small difficulty index;
+    a puzzle is unpacked from its 41 bytes when it is asked for, so picking
+    one is O(1) and memory use does not grow with the size of the bank.
+    """
+
+    def __init__(self, path=BANK_PATH):
+        self.path = path
+        self._mmap = None
+        self._levels = None  # difficulty -> (first puzzle, puzzle count)
+        self._records_start = 0
+
+    def _load(self):
+        mapped, (level_count, puzzle_count) = map_file(
+            self.path, HEADER, FILE_MAGIC, FILE_VERSION, "a puzzle bank",
+            lambda level_count, puzzle_count: level_count * INDEX_ENTRY.size + puzzle_count * RECORD_SIZE)
+        records_start = HEADER.size + level_count * INDEX_ENTRY.size
+        levels = {}
+        for i in range(level_count):
+            name, first, count = INDEX_ENTRY.unpack_from(mapped, HEADER.size + i * INDEX_ENTRY.size)
+            levels[name.rstrip(b'\0').decode('ascii')] = (first, count)
+        self._mmap = mapped
+        self._levels = levels
+        self._records_start = records_start
+
+    def difficulties(self):
+        if self._levels is None:
+            self._load()
+        return list(self._levels)
+
+    def count(self, difficulty):
+        """Number of puzzles of a difficulty"""
+        if self._levels is None:
+            self._load()
+        return self._levels.get(difficulty, (0, 0))[1]
+
+    def puzzle(self, difficulty, index):
+        """The index-th puzzle of a difficulty as a 9x9 grid"""
+        if self._levels is None:
+            self._load()
+        first, count = self._levels[difficulty]
+        if not 0 <= index < count:
+            raise IndexError(f"no puzzle {index} of difficulty {difficulty}")
+        offset = self._records_start + (first + index) * RECORD_SIZE
+        return unpack_puzzle(self._mmap[offset:offset + RECORD_SIZE])
+
+    def random_puzzle(self, difficulty, rng=random):
+        """A random puzzle of a difficulty, or None if the bank has none"""
+        count = self.count(difficulty)
+        return self.puzzle(difficulty, rng.randrange(count)) if count else None
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._levels = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a bank of sudoku puzzles.")
+    parser.add_argument('-n', '--count', type=int, default=1000, help="puzzles wanted per difficulty")
+    parser.add_argument('-o', '--output', default=BANK_PATH, help="bank file to write")
+    parser.add_argument('-s', '--seed', type=int, default=0, help="generator seed of the first puzzle")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--max-attempts', type=int, default=None,
+                        help="puzzles to generate before giving up on the rarer difficulties")
+    args = parser.parse_args()
+
+    counts = build_bank(args.count, args.output, args.seed, args.workers, args.max_attempts)
+    print(f"Wrote {sum(counts.values())} puzzles to {args.output}: "
+          + ", ".join(f"{level} {count}" for level, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import sys
+import time
+import argparse
+import multiprocessing
+
+from sudoku_board import GRID_SIZE
+from sudoku_rules import is_valid_move, is_game_won
+from sudoku_solver import parse_grid, format_grid, solve
+from percentiles import percentile
+
+INVALID = 'invalid'  # written in place of a solution for a line that is not a puzzle
+UNSOLVABLE = 'unsolvable'
+
+
+def check_solution(puzzle, solution):
+    """Whether a solution is complete, breaks no rule and keeps every clue"""
+    if not is_game_won(solution):
+        return False
+    for r in range(GRID_SIZE):
+        for c in range(GRID_SIZE):
+            if puzzle[r][c] and (puzzle[r][c] != solution[r][c] or not is_valid_move(solution, puzzle[r][c], r, c)):
+                return False
+    return True
+
+
+def solve_line(task):
+    """Solve one puzzle line; returns (output line, seconds spent solving, status)"""
+    line, engine = task
+    try:
+        puzzle = parse_grid(line)
+    except ValueError:
+        return INVALID, 0.0, INVALID
+    start = time.perf_counter()
+    solution = solve(puzzle, engine)
+    elapsed = time.perf_counter() - start
+    if solution is None:
+        return UNSOLVABLE, elapsed, UNSOLVABLE
+    if not check_solution(puzzle, solution):
+        return format_grid(solution), elapsed, 'wrong'
+    return format_grid(solution), elapsed, 'solved'
+
+
+def solve_stream(lines, output, workers=None, engine='dfs', chunksize=64):
+    """Solve puzzle lines across a process pool, writing one result line per puzzle in input order.
+
+    Returns (status counts, sorted per-puzzle solve times in seconds, elapsed seconds).
+    """
+    workers = workers or multiprocessing.cpu_count()
+    tasks = ((line, engine) for line in lines if line.strip() and not line.startswith('#'))
+    counts = {}
+    times = []
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        for text, seconds, status in pool.imap(solve_line, tasks, chunksize=chunksize):
+            if output is not None:
+                output.write(text + '\n')
+            counts[status] = counts.get(status, 0) + 1
+            if status != INVALID:
+                times.append(seconds)
+    elapsed = time.perf_counter() - start
+    times.sort()
+    return counts, times, elapsed
+
+
+def format_report(counts, times, elapsed, workers):
+    """Human-readable summary of a batch run"""
+    total = sum(counts.values())
+    ms = [t * 1000 for t in times]
+    lines = [f"Puzzles: {total} on {workers} worker(s) in {elapsed:.2f}s "
+             f"({total / elapsed if elapsed else 0:.0f} puzzles/s)",
+             "Results: " + ", ".join(f"{status} {count}" for status, count in sorted(counts.items())),
+             f"Solve time: p50 {percentile(ms, 50):.3f}ms, p90 {percentile(ms, 90):.3f}ms, "
+             f"p99 {percentile(ms, 99):.3f}ms, max {ms[-1] if ms else 0:.3f}ms"]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Solve sudoku puzzles given one per line as 81 characters ('.' or '0' for empty).")
+    parser.add_argument('input', nargs='?', default='-', help="puzzle file (default: stdin)")
+    parser.add_argument('-o', '--output', default='-', help="solution file (default: stdout)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--engine', choices=('dfs', 'dlx'), default='dfs', help="solver to use")
+    parser.add_argument('--chunksize', type=int, default=64, help="puzzles handed to a worker at a time")
+    parser.add_argument('-q', '--quiet', action='store_true', help="only print the report (benchmarking)")
+    args = parser.parse_args()
+
+    workers = args.workers or multiprocessing.cpu_count()
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='ascii')
+    if args.quiet:
+        output = None
+    else:
+        output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='ascii')
+    try:
+        counts, times, elapsed = solve_stream(source, output, workers, args.engine, args.chunksize)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not None and output is not sys.stdout:
+            output.close()
+    # The report goes to stderr so it never mixes with solutions on stdout
+    print(format_report(counts, times, elapsed, workers), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
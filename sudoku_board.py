@@ -0,0 +1,107 @@
+GRID_SIZE = 9
+BOX_SIZE = 3
+ALL_DIGITS = 0b1111111110  # bit d set for every digit 1-9
+
+
+def box_index(row, col):
+    """Index 0-8 of the 3x3 box holding (row, col), left to right, top to bottom"""
+    return row // BOX_SIZE * BOX_SIZE + col // BOX_SIZE
+
+
+class SudokuBoard:
+    """A 9x9 grid that keeps digit counts per row, column and box as cells change.
+
+    Every set() or clear() updates three counters and, when a count moves
+    between 0 and 1, the unit's digit bitmask (bit d set when digit d is
+    present). The board also tracks how many cells are filled and how many
+    surplus copies of digits exist across all rows, columns and boxes, so
+    validity, completion and win checks are lookups instead of rescans.
+
+    board[r][c] reads a cell as with a plain list of lists; change cells
+    only through set() and clear().
+    """
+
+    def __init__(self, grid=None):
+        self.cells = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
+        self.row_counts = [[0] * (GRID_SIZE + 1) for _ in range(GRID_SIZE)]
+        self.col_counts = [[0] * (GRID_SIZE + 1) for _ in range(GRID_SIZE)]
+        self.box_counts = [[0] * (GRID_SIZE + 1) for _ in range(GRID_SIZE)]
+        self.row_masks = [0] * GRID_SIZE
+        self.col_masks = [0] * GRID_SIZE
+        self.box_masks = [0] * GRID_SIZE
+        self.filled = 0
+        self.conflicts = 0  # surplus copies of digits summed over every row, column and box
+        if grid is not None:
+            for r in range(GRID_SIZE):
+                for c in range(GRID_SIZE):
+                    if grid[r][c]:
+                        self.set(r, c, grid[r][c])
+
+    def __getitem__(self, row):
+        return self.cells[row]
+
+    def to_lists(self):
+        """Plain list-of-lists copy of the grid"""
+        return [row[:] for row in self.cells]
+
+    def _add(self, counts, masks, unit, num, delta):
+        count = counts[unit][num]
+        if delta > 0:
+            if count >= 1:
+                self.conflicts += 1
+            else:
+                masks[unit] |= 1 << num
+        else:
+            if count >= 2:
+                self.conflicts -= 1
+            else:
+                masks[unit] &= ~(1 << num)
+        counts[unit][num] = count + delta
+
+    def _update(self, row, col, num, delta):
+        box = box_index(row, col)
+        self._add(self.row_counts, self.row_masks, row, num, delta)
+        self._add(self.col_counts, self.col_masks, col, num, delta)
+        self._add(self.box_counts, self.box_masks, box, num, delta)
+
+    def set(self, row, col, num):
+        """Put a digit 1-9 in a cell, replacing whatever was there"""
+        old = self.cells[row][col]
+        if old == num:
+            return
+        if old:
+            self._update(row, col, old, -1)
+        else:
+            self.filled += 1
+        self.cells[row][col] = num
+        self._update(row, col, num, 1)
+
+    def clear(self, row, col):
+        """Empty a cell"""
+        old = self.cells[row][col]
+        if old:
+            self._update(row, col, old, -1)
+            self.cells[row][col] = 0
+            self.filled -= 1
+
+    def is_valid(self, row, col):
+        """Whether the digit in a filled cell appears nowhere else in its row, column or box"""
+        num = self.cells[row][col]
+        return (self.row_counts[row][num] == 1 and self.col_counts[col][num] == 1
+                and self.box_counts[box_index(row, col)][num] == 1)
+
+    def can_place(self, num, row, col):
+        """Whether `num` could go in (row, col) without repeating a digit elsewhere in its units"""
+        own = 1 if self.cells[row][col] == num else 0
+        return (self.row_counts[row][num] == own and self.col_counts[col][num] == own
+                and self.box_counts[box_index(row, col)][num] == own)
+
+    def candidates(self, row, col):
+        """Bitmask of the digits no other cell of the row, column or box holds (for an empty cell)"""
+        return ALL_DIGITS & ~(self.row_masks[row] | self.col_masks[col] | self.box_masks[box_index(row, col)])
+
+    def is_complete(self):
+        return self.filled == GRID_SIZE * GRID_SIZE
+
+    def is_won(self):
+        return self.filled == GRID_SIZE * GRID_SIZE and self.conflicts == 0
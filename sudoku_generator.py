@@ -0,0 +1,139 @@
+import random
+from collections import namedtuple
+
+from sudoku_board import GRID_SIZE, BOX_SIZE
+from sudoku_solver import solve, count_solutions
+from sudoku_grader import grade, LEVELS
+
+# Clues to aim for at each difficulty (a level of sudoku_grader.LEVELS). Fewer clues
+# make harder puzzles more likely, but the grader decides what a puzzle really is.
+# Removal stops early when no further clue can go without losing uniqueness.
+DIFFICULTY_CLUES = {
+    'easy': 36,
+    'medium': 26,
+    'hard': 24,
+    'expert': 22,
+}
+DEFAULT_DIFFICULTY = 'medium'
+GRADE_ATTEMPTS = 12  # puzzles tried before settling for the one graded nearest the difficulty asked for
+GRADED_CLUES = 36  # clues left when carving toward a difficulty starts grading every removal
+
+# difficulty is the level the grader gave the puzzle, which may not be the one asked for
+GeneratedPuzzle = namedtuple('GeneratedPuzzle', ['puzzle', 'solution', 'difficulty'])
+
+
+def random_solution(rng=random):
+    """A random solved grid.
+
+    The three diagonal boxes share no row or column, so they are filled with
+    shuffled digits and the solver completes the rest. Shuffling the digit
+    names, the rows inside each band, the bands, the columns inside each stack
+    and the stacks then spreads the result over many more grids.
+    """
+    grid = [[0] * GRID_SIZE for _ in range(GRID_SIZE)]
+    for box in range(BOX_SIZE):
+        digits = rng.sample(range(1, GRID_SIZE + 1), GRID_SIZE)
+        for k, num in enumerate(digits):
+            grid[box * BOX_SIZE + k // BOX_SIZE][box * BOX_SIZE + k % BOX_SIZE] = num
+    grid = solve(grid)
+
+    names = [0] + rng.sample(range(1, GRID_SIZE + 1), GRID_SIZE)
+
+    def shuffled_lines():
+        bands = rng.sample(range(BOX_SIZE), BOX_SIZE)
+        return [band * BOX_SIZE + line for band in bands for line in rng.sample(range(BOX_SIZE), BOX_SIZE)]
+
+    rows = shuffled_lines()
+    cols = shuffled_lines()
+    grid = [[names[grid[r][c]] for c in cols] for r in rows]
+    if rng.random() < 0.5:
+        grid = [list(column) for column in zip(*grid)]
+    return grid
+
+
+def carve_puzzle(solution, clues, rng=random):
+    """Remove clues from a solved grid, down to about `clues`, keeping the solution unique.
+
+    Clues are removed in random order, in pairs mirrored through the centre
+    so the puzzle looks balanced, and a removal is undone whenever the
+    puzzle would gain a second solution.
+    """
+    puzzle = [row[:] for row in solution]
+    last = GRID_SIZE - 1
+    cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE) if (r, c) <= (last - r, last - c)]
+    rng.shuffle(cells)
+    remaining = GRID_SIZE * GRID_SIZE
+    for r, c in cells:
+        if remaining <= clues:
+            break
+        pair = {(r, c), (last - r, last - c)}
+        if remaining - len(pair) < clues:
+            continue
+        for pr, pc in pair:
+            puzzle[pr][pc] = 0
+        if count_solutions(puzzle, 2) == 1:
+            remaining -= len(pair)
+        else:
+            for pr, pc in pair:
+                puzzle[pr][pc] = solution[pr][pc]
+    return puzzle
+
+
+def carve_graded_puzzle(solution, difficulty, rng=random):
+    """Remove clues from a solved grid until the puzzle grades as `difficulty`.
+
+    Carves like carve_puzzle(), but once GRADED_CLUES are left every
+    removal is graded: one that makes the puzzle harder than `difficulty`
+    is undone, and carving stops at the first puzzle of that difficulty.
+    Returns (puzzle, level) with the level of the last puzzle kept, which
+    is easier than asked for when no order of removals got there.
+    """
+    wanted = LEVELS.index(difficulty)
+    puzzle = [row[:] for row in solution]
+    last = GRID_SIZE - 1
+    cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE) if (r, c) <= (last - r, last - c)]
+    rng.shuffle(cells)
+    remaining = GRID_SIZE * GRID_SIZE
+    level = LEVELS[0]
+    for r, c in cells:
+        pair = {(r, c), (last - r, last - c)}
+        for pr, pc in pair:
+            puzzle[pr][pc] = 0
+        keep = count_solutions(puzzle, 2) == 1
+        graded = keep and remaining - len(pair) <= GRADED_CLUES
+        if graded:
+            new_level = grade(puzzle).difficulty
+            keep = LEVELS.index(new_level) <= wanted
+        if keep:
+            remaining -= len(pair)
+            if graded:
+                level = new_level
+                if level == difficulty:
+                    break
+        else:
+            for pr, pc in pair:
+                puzzle[pr][pc] = solution[pr][pc]
+    return puzzle, level
+
+
+def generate_puzzle(difficulty=DEFAULT_DIFFICULTY, seed=None, attempts=GRADE_ATTEMPTS):
+    """A puzzle with exactly one solution that grades as `difficulty`, as a GeneratedPuzzle.
+
+    Each attempt carves a new solution with carve_graded_puzzle() until one
+    matches or `attempts` have been made; otherwise the one whose level is
+    nearest wins, and its difficulty says so. A seed gives the same puzzle
+    every time. Hard puzzles are rare enough that the puzzle bank is the
+    better source for them.
+    """
+    rng = random.Random(seed)
+    wanted = LEVELS.index(difficulty)
+    best = None
+    for _ in range(attempts):
+        solution = random_solution(rng)
+        puzzle, level = carve_graded_puzzle(solution, difficulty, rng)
+        distance = wanted - LEVELS.index(level)
+        if best is None or distance < best[0]:
+            best = (distance, GeneratedPuzzle(puzzle, solution, level))
+        if distance == 0:
+            break
+    return best[1]
@@ -0,0 +1,266 @@
+import sys
+import time
+import argparse
+import itertools
+import multiprocessing
+from collections import namedtuple
+
+from sudoku_board import GRID_SIZE, ALL_DIGITS
+from sudoku_solver import CELL_COUNT, UNITS, ROW_OF, COL_OF, BOX_OF, BIT_COUNT, DIGIT_OF_BIT, DIGITS_OF_MASK, parse_grid, count_solutions
+
+LEVELS = ('easy', 'medium', 'hard', 'expert')
+
+# Techniques in the order a person would try them: (name, points per use, level it implies)
+TECHNIQUES = (
+    ('hidden_single', 1, 'easy'),
+    ('naked_single', 2, 'easy'),
+    ('pointing', 10, 'medium'),
+    ('claiming', 10, 'medium'),
+    ('naked_pair', 15, 'medium'),
+    ('hidden_pair', 20, 'medium'),
+    ('naked_triple', 30, 'hard'),
+    ('hidden_triple', 40, 'hard'),
+    ('x_wing', 50, 'hard'),
+    ('swordfish', 80, 'expert'),
+)
+GUESS_POINTS = 200  # a puzzle none of the techniques can finish needs trial and error
+
+PEERS = [sorted({j for u in (ROW_OF[i], COL_OF[i], BOX_OF[i]) for j in UNITS[u]} - {i}) for i in range(CELL_COUNT)]
+ROW_INDEX = [ROW_OF[i] for i in range(CELL_COUNT)]
+COL_INDEX = [COL_OF[i] - GRID_SIZE for i in range(CELL_COUNT)]
+BOX_INDEX = [BOX_OF[i] - 2 * GRID_SIZE for i in range(CELL_COUNT)]
+ROW_UNITS = UNITS[:GRID_SIZE]
+COL_UNITS = UNITS[GRID_SIZE:2 * GRID_SIZE]
+BOX_UNITS = UNITS[2 * GRID_SIZE:]
+
+Grade = namedtuple('Grade', ['difficulty', 'score', 'techniques', 'solved'])
+
+
+class _Grid:
+    """Pencil marks of a puzzle being solved by hand: one candidate bitmask per empty cell"""
+
+    def __init__(self, board):
+        self.values = [0] * CELL_COUNT
+        self.candidates = [ALL_DIGITS] * CELL_COUNT
+        self.broken = False
+        for i, num in enumerate(num for row in board for num in row):
+            if num:
+                self.place(i, num)
+
+    def place(self, i, num):
+        if not self.candidates[i] >> num & 1:
+            self.broken = True  # the puzzle contradicts itself
+            return
+        bit = 1 << num
+        self.values[i] = num
+        self.candidates[i] = 0
+        for j in PEERS[i]:
+            self.candidates[j] &= ~bit
+
+    def eliminate(self, cells, mask):
+        """Remove digits from cells; True if any cell lost a candidate"""
+        changed = False
+        for i in cells:
+            if self.candidates[i] & mask:
+                self.candidates[i] &= ~mask
+                changed = True
+                if not self.candidates[i]:
+                    self.broken = True
+        return changed
+
+    def solved(self):
+        return all(self.values)
+
+    # --- Techniques; each returns the number of times it was applied ---
+
+    def hidden_single(self):
+        uses = 0
+        for unit in UNITS:
+            once = twice = 0
+            for i in unit:
+                mask = self.candidates[i]
+                twice |= once & mask
+                once |= mask
+            hidden = once & ~twice
+            for num in DIGITS_OF_MASK[hidden]:
+                for i in unit:
+                    if self.candidates[i] >> num & 1:
+                        self.place(i, num)
+                        uses += 1
+                        break
+        return uses
+
+    def naked_single(self):
+        uses = 0
+        for i in range(CELL_COUNT):
+            if BIT_COUNT[self.candidates[i]] == 1:
+                self.place(i, DIGIT_OF_BIT[self.candidates[i]])
+                uses += 1
+        return uses
+
+    def _locked(self, units, lines_of_cell, line_units):
+        """A digit confined to one line within a unit can go nowhere else on that line"""
+        uses = 0
+        for unit in units:
+            for num in range(1, GRID_SIZE + 1):
+                bit = 1 << num
+                cells = [i for i in unit if self.candidates[i] & bit]
+                if len(cells) < 2:
+                    continue
+                lines = {lines_of_cell[i] for i in cells}
+                if len(lines) == 1:
+                    line = line_units[lines.pop()]
+                    if self.eliminate([j for j in line if j not in unit], bit):
+                        uses += 1
+        return uses
+
+    def pointing(self):
+        return self._locked(BOX_UNITS, ROW_INDEX, ROW_UNITS) + self._locked(BOX_UNITS, COL_INDEX, COL_UNITS)
+
+    def claiming(self):
+        return self._locked(ROW_UNITS + COL_UNITS, BOX_INDEX, BOX_UNITS)
+
+    def _naked_subset(self, size):
+        """`size` cells of a unit holding only `size` digits between them own those digits"""
+        uses = 0
+        for unit in UNITS:
+            cells = [i for i in unit if 2 <= BIT_COUNT[self.candidates[i]] <= size]
+            for group in itertools.combinations(cells, size):
+                mask = 0
+                for i in group:
+                    mask |= self.candidates[i]
+                if BIT_COUNT[mask] == size and self.eliminate([j for j in unit if j not in group], mask):
+                    uses += 1
+        return uses
+
+    def _hidden_subset(self, size):
+        """`size` digits that fit in only `size` cells of a unit leave those cells no other digit"""
+        uses = 0
+        for unit in UNITS:
+            places = {}
+            for num in range(1, GRID_SIZE + 1):
+                cells = frozenset(i for i in unit if self.candidates[i] >> num & 1)
+                if 2 <= len(cells) <= size:
+                    places[num] = cells
+            for digits in itertools.combinations(places, size):
+                cells = frozenset().union(*(places[num] for num in digits))
+                if len(cells) == size:
+                    keep = sum(1 << num for num in digits)
+                    if self.eliminate(cells, ALL_DIGITS & ~keep):
+                        uses += 1
+        return uses
+
+    def _fish(self, size):
+        """A digit confined to the same `size` columns in `size` rows is cleared from the rest of those columns (and vice versa)"""
+        uses = 0
+        for base, cover, cover_of in ((ROW_UNITS, COL_UNITS, COL_INDEX), (COL_UNITS, ROW_UNITS, ROW_INDEX)):
+            for num in range(1, GRID_SIZE + 1):
+                bit = 1 << num
+                lines = {}
+                for b, unit in enumerate(base):
+                    spots = frozenset(cover_of[i] for i in unit if self.candidates[i] & bit)
+                    if 2 <= len(spots) <= size:
+                        lines[b] = spots
+                for group in itertools.combinations(lines, size):
+                    spots = frozenset().union(*(lines[b] for b in group))
+                    if len(spots) == size:
+                        members = {i for b in group for i in base[b]}
+                        others = [i for s in spots for i in cover[s] if i not in members]
+                        if self.eliminate(others, bit):
+                            uses += 1
+        return uses
+
+    def naked_pair(self):
+        return self._naked_subset(2)
+
+    def naked_triple(self):
+        return self._naked_subset(3)
+
+    def hidden_pair(self):
+        return self._hidden_subset(2)
+
+    def hidden_triple(self):
+        return self._hidden_subset(3)
+
+    def x_wing(self):
+        return self._fish(2)
+
+    def swordfish(self):
+        return self._fish(3)
+
+
+def grade(board):
+    """Rate a puzzle by the human techniques needed to solve it.
+
+    Always applies the easiest technique that makes progress, then starts
+    again from the easiest. The difficulty is the level of the hardest
+    technique used ('expert' if the techniques alone cannot finish), and the
+    score adds up points for every use, so it also separates puzzles within
+    a level. A grid with no solution has nothing to rate, so its difficulty
+    is None.
+    """
+    grid = _Grid(board)
+    used = {}
+    score = 0
+    while not grid.solved() and not grid.broken:
+        for name, points, _ in TECHNIQUES:
+            uses = getattr(grid, name)()
+            if uses:
+                used[name] = used.get(name, 0) + uses
+                score += points * uses
+                break
+        else:
+            break  # stuck
+
+    # A contradiction, or one the techniques could not reach that the solver finds
+    if grid.broken or (not grid.solved() and count_solutions(board, 1) == 0):
+        return Grade(None, score, used, False)
+    solved = grid.solved()
+    if solved:
+        levels = [level for name, _, level in TECHNIQUES if name in used]
+        difficulty = max(levels, key=LEVELS.index) if levels else LEVELS[0]
+    else:
+        difficulty = LEVELS[-1]
+        score += GUESS_POINTS
+    return Grade(difficulty, score, used, solved)
+
+
+def _grade_line(line):
+    try:
+        result = grade(parse_grid(line))
+    except ValueError:
+        return line, None
+    return line, result if result.difficulty is not None else None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rate sudoku puzzles (81 characters per line) by the solving techniques they need.")
+    parser.add_argument('input', nargs='?', default='-', help="puzzle file (default: stdin)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    workers = args.workers or multiprocessing.cpu_count()
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='ascii')
+    lines = (line.strip() for line in source if line.strip() and not line.startswith('#'))
+    counts = {level: 0 for level in LEVELS}
+    start = time.perf_counter()
+    with multiprocessing.Pool(workers) as pool:
+        for line, result in pool.imap(_grade_line, lines, chunksize=64):
+            if result is None:
+                print(f"{line} invalid")
+                continue
+            counts[result.difficulty] += 1
+            print(f"{line} {result.difficulty} {result.score}")
+    elapsed = time.perf_counter() - start
+    if source is not sys.stdin:
+        source.close()
+
+    total = sum(counts.values())
+    print(f"Rated {total} puzzles on {workers} worker(s) in {elapsed:.2f}s "
+          f"({total / elapsed if elapsed else 0:.0f} puzzles/s): "
+          + ", ".join(f"{level} {count}" for level, count in counts.items()), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+from sudoku_board import GRID_SIZE, SudokuBoard
+
+# The rules of the game, kept apart from sudoku.py so that tools, tests and worker
+# processes can check boards without loading pygame or a speech engine.
+# Each function takes a SudokuBoard or a plain 9x9 list of lists (0 for empty).
+
+
+def is_valid_move(board, num, row, col):
+    """Checks if placing 'num' at (row, col) is valid according to Sudoku rules."""
+    # A SudokuBoard keeps per-row, column and box counts, so it can answer without scanning
+    if isinstance(board, SudokuBoard):
+        return board.can_place(num, row, col)
+
+    # Check row
+    for c in range(GRID_SIZE):
+        if board[row][c] == num and c != col: # Check other cells in the row
+            return False
+
+    # Check column
+    for r in range(GRID_SIZE):
+        if board[r][col] == num and r != row: # Check other cells in the column
+            return False
+
+    # Check 3x3 box
+    start_row = row - row % 3
+    start_col = col - col % 3
+    for r in range(3):
+        for c in range(3):
+            if board[r + start_row][c + start_col] == num and (r + start_row != row or c + start_col != col):
+                 return False
+
+    return True # It's valid!
+
+def is_board_complete(board):
+    """Checks if there are any empty cells (0s) left on the board."""
+    if isinstance(board, SudokuBoard):
+        return board.is_complete()
+    for r in range(GRID_SIZE):
+        for c in range(GRID_SIZE):
+            if board[r][c] == 0:
+                return False
+    return True
+
+def is_game_won(board):
+    """Checks if the board is complete AND all numbers are valid."""
+    if isinstance(board, SudokuBoard):
+        return board.is_won() # Filled and no digit repeated in any row, column or box
+    if not is_board_complete(board):
+        return False # Not complete yet
+
+    # Check validity of every cell
+    for r in range(GRID_SIZE):
+        for c in range(GRID_SIZE):
+            num = board[r][c]
+            if num != 0 and not is_valid_move(board, num, r, c):
+                return False # Found an invalid number placement
+
+    return True # Complete and all placements are valid!
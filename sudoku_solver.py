@@ -0,0 +1,258 @@
+from sudoku_board import GRID_SIZE, ALL_DIGITS, box_index
+
+CELL_COUNT = GRID_SIZE * GRID_SIZE
+EMPTY_CHARACTERS = '.0'  # both mark an empty cell in the 81-character line format
+
+# The 27 units are numbered rows 0-8, columns 9-17, boxes 18-26; per-cell lookups spare the search any division
+ROW_OF = [i // GRID_SIZE for i in range(CELL_COUNT)]
+COL_OF = [GRID_SIZE + i % GRID_SIZE for i in range(CELL_COUNT)]
+BOX_OF = [2 * GRID_SIZE + box_index(i // GRID_SIZE, i % GRID_SIZE) for i in range(CELL_COUNT)]
+UNITS = [[i for i in range(CELL_COUNT) if u in (ROW_OF[i], COL_OF[i], BOX_OF[i])] for u in range(3 * GRID_SIZE)]
+
+BIT_COUNT = [bin(mask).count('1') for mask in range(ALL_DIGITS + 1)]
+DIGIT_OF_BIT = {1 << d: d for d in range(1, GRID_SIZE + 1)}
+DIGITS_OF_MASK = [[d for d in range(1, GRID_SIZE + 1) if mask >> d & 1] for mask in range(ALL_DIGITS + 1)]
+
+
+def parse_grid(line):
+    """9x9 list of lists from an 81-character line; '.' or '0' is an empty cell"""
+    line = line.strip()
+    if len(line) != CELL_COUNT:
+        raise ValueError(f"expected {CELL_COUNT} characters, got {len(line)}")
+    cells = [0 if ch in EMPTY_CHARACTERS else int(ch) for ch in line]
+    return [cells[r * GRID_SIZE:(r + 1) * GRID_SIZE] for r in range(GRID_SIZE)]
+
+
+def format_grid(board, empty='.'):
+    """81-character line for a 9x9 grid"""
+    return ''.join(str(num) if num else empty for row in board for num in row)
+
+
+class _Search:
+    """Bitmask backtracking over a flat 81-cell grid.
+
+    Every row, column and box keeps a bitmask of the digits placed in it,
+    so a cell's candidates are two ORs and one AND. Before every branch
+    the search fills in naked singles (cells with one candidate) and hidden
+    singles (digits with one place left in a unit), then branches on the
+    empty cell with the fewest candidates.
+    """
+
+    def __init__(self, board):
+        self.cells = [num for row in board for num in row]
+        self.units = [0] * (3 * GRID_SIZE)  # bitmask of the digits placed in each unit
+        self.consistent = True
+        for i, num in enumerate(self.cells):
+            if num:
+                bit = 1 << num
+                if (self.units[ROW_OF[i]] | self.units[COL_OF[i]] | self.units[BOX_OF[i]]) & bit:
+                    self.consistent = False  # a given repeats a digit
+                self.units[ROW_OF[i]] |= bit
+                self.units[COL_OF[i]] |= bit
+                self.units[BOX_OF[i]] |= bit
+        self.count = 0
+        self.solution = None
+
+    def _place(self, i, num):
+        bit = 1 << num
+        self.cells[i] = num
+        self.units[ROW_OF[i]] |= bit
+        self.units[COL_OF[i]] |= bit
+        self.units[BOX_OF[i]] |= bit
+
+    def _unplace(self, i):
+        bit = ~(1 << self.cells[i])
+        self.cells[i] = 0
+        self.units[ROW_OF[i]] &= bit
+        self.units[COL_OF[i]] &= bit
+        self.units[BOX_OF[i]] &= bit
+
+    def _propagate(self, empties, trail):
+        """Place every forced digit, appending the cells to trail; False on a contradiction"""
+        cells, units = self.cells, self.units
+        masks = [0] * CELL_COUNT
+        while True:
+            changed = False
+            # Naked singles; the other cells' candidates are kept for the hidden single pass
+            for i in empties:
+                if cells[i]:
+                    continue
+                mask = ALL_DIGITS & ~(units[ROW_OF[i]] | units[COL_OF[i]] | units[BOX_OF[i]])
+                if not mask:
+                    return False
+                if BIT_COUNT[mask] == 1:
+                    cells[i] = DIGIT_OF_BIT[mask]
+                    units[ROW_OF[i]] |= mask
+                    units[COL_OF[i]] |= mask
+                    units[BOX_OF[i]] |= mask
+                    trail.append(i)
+                    changed = True
+                    masks[i] = 0
+                else:
+                    masks[i] = mask
+
+            # Hidden singles. The kept masks can only be supersets of the live candidates,
+            # so a digit seen once in a unit has at most that one place left: check it is still there
+            for u, unit in enumerate(UNITS):
+                once = twice = 0
+                for i in unit:
+                    mask = masks[i]
+                    twice |= once & mask
+                    once |= mask
+                placed = units[u]
+                if (once | placed) != ALL_DIGITS:
+                    return False  # some digit has nowhere left to go in this unit
+                hidden = once & ~twice & ~placed
+                if hidden:
+                    for i in unit:
+                        bits = masks[i] & hidden
+                        if bits:
+                            if BIT_COUNT[bits] > 1 or cells[i]:
+                                return False  # two digits both need this cell
+                            if not ALL_DIGITS & ~(units[ROW_OF[i]] | units[COL_OF[i]] | units[BOX_OF[i]]) & bits:
+                                return False
+                            cells[i] = DIGIT_OF_BIT[bits]
+                            units[ROW_OF[i]] |= bits
+                            units[COL_OF[i]] |= bits
+                            units[BOX_OF[i]] |= bits
+                            trail.append(i)
+                            changed = True
+                            masks[i] = 0
+            if not changed:
+                return True
+
+    def run(self, empties, limit):
+        """Count solutions below this position, stopping once `limit` are found"""
+        trail = []
+        if self._propagate(empties, trail):
+            cells, units = self.cells, self.units
+            best = -1
+            best_mask = 0
+            best_count = GRID_SIZE + 1
+            remaining = []
+            for i in empties:
+                if cells[i]:
+                    continue
+                remaining.append(i)
+                if best_count > 2:  # singles are already placed, so two candidates is the minimum
+                    mask = ALL_DIGITS & ~(units[ROW_OF[i]] | units[COL_OF[i]] | units[BOX_OF[i]])
+                    if BIT_COUNT[mask] < best_count:
+                        best, best_mask, best_count = i, mask, BIT_COUNT[mask]
+
+            if best < 0:
+                self.count += 1
+                if self.solution is None:
+                    self.solution = cells[:]
+            else:
+                for num in DIGITS_OF_MASK[best_mask]:
+                    self._place(best, num)
+                    self.run(remaining, limit)
+                    self._unplace(best)
+                    if self.count >= limit:
+                        break
+
+        for i in trail:
+            self._unplace(i)
+
+
+def _search(board, limit):
+    search = _Search(board)
+    if search.consistent:
+        search.run([i for i, num in enumerate(search.cells) if not num], limit)
+    return search
+
+
+def solve(board, engine='dfs'):
+    """A solution of a 9x9 grid (0 for empty) as a new 9x9 grid, or None if it has none.
+
+    engine='dlx' uses the exact-cover solver instead of the bitmask search.
+    """
+    if engine == 'dlx':
+        return solve_dlx(board)
+    solution = _search(board, 1).solution
+    if solution is None:
+        return None
+    return [solution[r * GRID_SIZE:(r + 1) * GRID_SIZE] for r in range(GRID_SIZE)]
+
+
+def count_solutions(board, limit=2):
+    """Number of solutions, counting no further than `limit`"""
+    return _search(board, limit).count
+
+
+def has_unique_solution(board):
+    return count_solutions(board, 2) == 1
+
+
+# --- Algorithm X ---
+# Exact cover with the columns kept as a dict of sets rather than linked lists:
+# removing and restoring a column touches the same rows as Dancing Links does.
+
+def _constraints(r, c, num):
+    """The four exact-cover columns a digit in a cell satisfies"""
+    return (('cell', r, c), ('row', r, num), ('col', c, num), ('box', box_index(r, c), num))
+
+
+_COVER_ROWS = {(r, c, num): _constraints(r, c, num)
+               for r in range(GRID_SIZE) for c in range(GRID_SIZE) for num in range(1, GRID_SIZE + 1)}
+
+
+def _select(columns, rows, choice):
+    removed = []
+    for j in rows[choice]:
+        for i in columns[j]:
+            for k in rows[i]:
+                if k != j:
+                    columns[k].remove(i)
+        removed.append(columns.pop(j))
+    return removed
+
+
+def _deselect(columns, rows, choice, removed):
+    for j in reversed(rows[choice]):
+        columns[j] = removed.pop()
+        for i in columns[j]:
+            for k in rows[i]:
+                if k != j:
+                    columns[k].add(i)
+
+
+def _algorithm_x(columns, rows, partial, limit, found):
+    if not columns:
+        found.append(list(partial))
+        return
+    column = min(columns, key=lambda j: len(columns[j]))
+    for choice in list(columns[column]):
+        partial.append(choice)
+        removed = _select(columns, rows, choice)
+        _algorithm_x(columns, rows, partial, limit, found)
+        _deselect(columns, rows, choice, removed)
+        partial.pop()
+        if len(found) >= limit:
+            return
+
+
+def solve_dlx(board, limit=1):
+    """Solve with Knuth's Algorithm X; returns the first solution as a 9x9 grid, or None"""
+    columns = {}
+    for choice, constraint_columns in _COVER_ROWS.items():
+        for j in constraint_columns:
+            columns.setdefault(j, set()).add(choice)
+
+    for r in range(GRID_SIZE):
+        for c in range(GRID_SIZE):
+            num = board[r][c]
+            if num:
+                if any(j not in columns for j in _COVER_ROWS[(r, c, num)]):
+                    return None  # a given repeats a digit
+                _select(columns, _COVER_ROWS, (r, c, num))
+
+    found = []
+    _algorithm_x(columns, _COVER_ROWS, [], limit, found)
+    if not found:
+        return None
+    solution = [row[:] for row in board]
+    for r, c, num in found[0]:
+        solution[r][c] = num
+    return solution
+
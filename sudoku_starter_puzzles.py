@@ -0,0 +1,138 @@
+"""Puzzles the game falls back on when there is no puzzle bank.
+
+The first 30 puzzles of each difficulty from `python sudoku_bank.py -n 30`
+(seed 0), as the 81-character lines sudoku_solver.parse_grid reads.
+Hard puzzles are too rare to generate while a player waits, so a game
+without a bank picks one of these instead.
+"""
+
+STARTER_PUZZLES = {
+    'easy': (
+        '.7...384.1...5.9..8.92..1..64...95175.......49174...68..5..64.2..2.4...1.615...3.',
+        '.....13....86...4......4827.8.7....5.5.3.8.7.1....5.3.4965......7...32....21.....',
+        '....92..88.6154..3..98....5...9..84.953...162.87..1...5....82..1..5297.47..34....',
+        '85.3.......45...67..7.2....1..8......43...81......1..5....9.7..28...53.......2.98',
+        '67......49.581.......6.....1.2.....9..81.46..4.....7.3.....2.......984.15......96',
+        '..9...3..1.23...78.5319....5.6.87.29..8...4..21.93.5.7....4976.84...52.3..1...8..',
+        '.35.2...66..5.....2..9...85..98...5...........2...13..85...6..7.....2..17...4.82.',
+        '....39674..........3.7.591....2..54...6...8...59..7....974.1.3..........26397....',
+        '3..762.8..6.1....3......651.8.2.3.....6...5.....4.6.7.543......6....4.9..2.687..5',
+        '.2...6.8...7...64.46.72853...2....56.78...12.65....4...31974.68.86...9...9.8...1.',
+        '3...4..16....6.8...2...1.....3.1..5751..3..9886..5.2.....5...6...9.8....67..9...3',
+        '.....2.9.97...4....3....4.75.81....4.1.....6.4....37.93.6....4....2...36.5.3.....',
+        '.....3.8.6.72.....4...1..35....86.53.1.....7.39.72....18..4...7.....25.1.4.6.....',
+        '34..59.1...87...6...1.2.....69572..12.7...4.95..49872.....4.6...3...15...7.38..94',
+        '..6..958.8...2....4.58.........9...2.24...91.6...8.........31.4....7...5.324..8..',
+        '.86..9.255....341.......7...43.2.......8.4.......3.95...9.......247....375.3..69.',
+        '..67.4.52...381.....4.2..834.8..9....398.652....4..3.881..4.6.....562...56.1.82..',
+        '5.7...........63.119..547.2.2..13..6.........6..97..1.2.513..693.85...........1.5',
+        '6....1....782..4........53.721..5......1.3......7..914.85........2..614....8....2',
+        '....94..6.68217.4..94...371.4.9...6.8.......5.7...8.3.485...19..3.18945.7..54....',
+        '.7.52.3.....4.172...2.37.511.5....3...71435...4....1.885.21.6...163.5.....3.74.1.',
+        '53......8....5..41.....2.39..5.9..7.21.....95.7..6.3..12.9.....64..8....8......63',
+        '......68..362..71.5..6........79..5..7.4.5.9..1..28........3..6.98..613..63......',
+        '5..3.47....1......83791.......15..249.......342..69.......78439......2....24.1..8',
+        '1..49......58..2...9..5.7...5914..3..2.....7..3..2695...3.6..1...6..13......79..6',
+        '..89....515...8.72.....5...961..4..8....6....3..7..269...4.....21.8...936....31..',
+        '42.1........9.528.....3.4...6.3....9.98...37.1....9.6...2.5.....147.8........3.58',
+        '.1...567.759..6.8...6.289..2...7..595.......118..3...6..586.2...2.4..197.312...6.',
+        '.4...83.15.....89...639....47.......9..8.3..4.......32....312...94.....71.25...4.',
+        '9.415..78...8.3.5.....9.16.......6..5.6...3.1..3.......29.6.....4.3.9...68..249.5',
+    ),
+    'medium': (
+        '4...78.3.5..9....7..3.2.6...3.2...791.......695...6.8...5.9.7..7....2..3.4.13...8',
+        '...3..8.1.3...9.....487...648....5...9.....1...3....873...981.....5...3.6.7..4...',
+        '.....92.1.....7...7...8.4..25..3..1.6..5.1..4.4..7..92..3.9...5...6.....8.91.....',
+        '...8.25.6.3..6....9......2......678...72.54...857......2......7....2..1.1.49.7...',
+        '3..9....67.6.5....8...7.9.....6...3.61.....48.2...4.....7.6...4....4.5.25....8..7',
+        '..67.....5.9..2.7.2.....6...6.2.9.3....3.6....1.8.7.9...1.....8.3.6..4.7.....53..',
+        '.5..7...6....58.41...1.....58.3...1.2.3...5.8.4...5.93.....2...62.59....8...4..7.',
+        '....5.7...3.....148..7...3.....65..8..9...4..6..91.....2...8..647.....2...8.9....',
+        '...75..91....4.32.9.......5.....657..5..1..3..748.....2.......3.49.8....71..62...',
+        '.....635...5..2....78....24..9.6.....2.8.5.9.....9.4..48....27....1..8...574.....',
+        '8..4...3.7...268..3.2.9.........21..28..4..93..69.........3.9.1..157...6.2...8..4',
+        '..7...3..1..4.9.6.....76....412.5.....8.4.1.....1.752....76.....8.5.2..3..4...2..',
+        '..69..5.3....3..241...2......3.827..5.......6..756.2......4...978..5....4.2..16..',
+        '........5..1..7.8...8.6..316.752...4.........2...947.858..4.9...6.2..5..1........',
+        '3.5.......781.2........72......4..95.93...74.85..2......93........4.168.......5.9',
+        '63..2...5.724........6......1693...88.......93...8164......6........235.5...7..96',
+        '3..........24..9.5.9...68.......9.16..85.43..26.7.......72...9.1.5..82..........3',
+        '2..73..9..7...9..6..9.4.......6..87.3.......5.15..4.......7.9..9..3...5..6..98..2',
+        '..639..7.3....76...942.....2......5..48...36..7......2.....589...94....6.1..785..',
+        '..8.1..35.....27..97....4..821..9...............6..814..9....78..72.....18..6.3..',
+        '154...3..9...5.....8.9.4...4....6..5...528...6..4....1...7.5.2.....9...7..7...934',
+        '.26..8.7..1.2.......3.9...4...72.5...6.....3...4.81...3...4.7.......5.1..7.6..48.',
+        '9....8...1...6374...6....5.8.....1..5..381..7..7.....2.8....9...6397...8...8....4',
+        '........9265...4...9....6586.4.92......8.3......64.7.5826....1...7...3869........',
+        '.429.......8..52..56.......7532...9..1.....5..8...1463.......75..57..9.......261.',
+        '4.....8.6....52.7..7...4....9......3..37289..7......8....2...1..4.96....3.6.....2',
+        '1.7....4...43..29.........5...15.6..5..824..1..3.96...3.........85..29...2....7.8',
+        '....7..2.24...51..5.9..1..8.1.45....8.......4....98.3.9..5..3.2..26...97.3..1....',
+        '8.25....1.7.3..8....36.9......9....3..4...7..5....7......7.62....1..5.6.3....25.7',
+        '4...7.61..1.....45...3....9..58..3..92.1.3.57..8..24..8....7...24.....7..97.8...6',
+    ),
+    'hard': (
+        '6.........97.8..4..34.76....528.3...4...9...8...5.123....25.79..2..3.46.........5',
+        '..539.4...7.6.2.9.9....7..2..8.5.....9.....5.....7.8..7..9....8.6.4.5.3...9.261..',
+        '....73.6...5..9..7...6..84.846....5...........9....483.81..6...2..5..9...5.13....',
+        '.....692....4...3.6..23...4..4.1.7...3..2..1...1.4.5..7...69..5.5...4....185.....',
+        '.9....6.....3....846...935....2..7.....675.....5..1....548...911....4.....7....3.',
+        '8...17..3...629.....6....7.6..1..83...2.4.9...87..5..6.4....7.....754...7..39...4',
+        '71.....2....1.8.4.2......6945.21.8.6...8.5...8.7.49.1563......1.8.4.1....7.....52',
+        '...9..8.683...6..1....15..36......9...2...5...1......41..63....9..4...127.8..1...',
+        '.6......82..7.8..53...2....85...2.1..4.9.7.8..7.1...53....7...27..5.6..15......6.',
+        '...3..19..725.....4........95.4..2.7...6.5...7.6..3.54........8.....693..95..4...',
+        '...4....578...2...4...6.1...9...36.8..3...2..2.17...5...4.7...3...8...616....4...',
+        '..1.8....76.9.1.2.....6.7....5....834.......783....2....6.2.....2.6.7.19....9.5..',
+        '....687..6..49...3......54..6.32.9....8...3....1.84.5..29......7...46..9..685....',
+        '..18..4.......7...4..63.8...59...7463.......8824...19...3.68..4...5.......5..42..',
+        '.6..9..1..1.3...9....2....87....19....5...3....18....78....6....3...9.4..4..3..2.',
+        '9124.....6.....8...3.6....22....6.7....3.2....9.1....37....3.5...4.....7.....5928',
+        '3......9..14..9.......2.681..8...213....1....561...8..782.5.......9..72..3......5',
+        '6....35....8......9..2...36.897....1...5.9...3....187.81...5..2......9....73....5',
+        '.8.......23...9....19.2.68...1.479....4...8....251.3...93.8.41....6...92.......3.',
+        '67..3..41.....2..8....4...5..12...36.6..5..8.85...34..4...6....5..4.....18..9..64',
+        '.....3..1...129..89......4.4...5.1..53.....84..8.6...2.7......96..532...3..8.....',
+        '...9..5.1..71.4.8..91.5......97...3.4.......5.8...34......6.39..3.5.28..8.6..9...',
+        '2.....3.....8234...7.6....892...5.8...6...5...4.3...726....7.4...7598.....8.....1',
+        '2..8..7..135...6......3....4.126.....8.1.3.2.....485.7....8......2...349..6..9..8',
+        '6.5.491.3.3..85.6......6.....3....9....5.7....7....8.....9......6.27..3.2.146.7.9',
+        '..53....16....18......7.2.5.7...4128.........3162...7.2.1.9......35....29....26..',
+        '..5.....3..3.5..279..23..6....5...8.5.2.7.6.1.9...6....2..81..665..4.7..7.....4..',
+        '.4....9..732.....15.91........93.8.2...6.2...1.3.48........73.49.....527..4....8.',
+        '..4..3.....68274...9.46......8...95.34.....12.72...3......58.4...93426.....9..5..',
+        '28........34.9.5....1..7..6.9...318...........461...9.1..5..7....5.7.83........59',
+    ),
+    'expert': (
+        '..8...5..53....19..7...8..3...7.235....514....458.9...8..4...3..54....16..3...9..',
+        '..8.5..4..5...68..7..3..1......187.2...9.4...8.576......1..5..6..46...3..7..9.2..',
+        '......35..2..9..816...1..7...8..2713.........3749..5...3..5...924..7..3..15......',
+        '..1.972......4.....863....4.6.....815.......983.....7.7....894.....3......867.3..',
+        '...6.7..389.32.6....7.5.4......3.5.9...4.9...9.1.6......6.9.7....2.73.467..2.6...',
+        '58.7.96.13796..48.26........45....6.1.......3.3....15........19.12..37457.31.5.26',
+        '.16.8..5.9..6..4...5.2.3...12....6.7..3...5..6.5....84...9.4.6...4..2..1.6..3.94.',
+        '.3......4.1.69.5....5.83.......5.9.6.8.769.1.9.1.4.......97.8....7.38.6.8......2.',
+        '....6..75...4.56...3...7...8..1....2..68.91..4....6..7...6...1...97.4...54..1....',
+        '..16.43......1..7.6.3...51.........8..94.26..3.........35...4.7.9..4......29.31..',
+        '.5.9.2..6.3..5.....9..43..19......8...27.86...1......54..26..5.....7..6.6..5.4.2.',
+        '....6.4.8.......7...3..2...67.13..4.8..7.5..6.4..26.85...6..9...5.......4.8.1....',
+        '.9...52.....6..39....3.9..5.34...8.27.......16.8...94.9..7.3....46..2.....15...8.',
+        '.....5..83..1.6....86...41.47..32...............79..31.49...25....9.1..77..2.....',
+        '.1..4..9..49..2...6.75..1.....3....2..46.17..9....7.....8..52.6...2..38..5..6..1.',
+        '..9.6.....2..4...315..73....1...6..5.94...16.5..7...3....63..514...2..7.....5.9..',
+        '451.3............5...2...34..6.7...3..78.25..2...6.1..13...7...5............4.389',
+        '...92168...93...4..68..4...8.5..91......4......28..5.4...4..97..7...32...21697...',
+        '8.1.7.2..5..4......6.8.......6..1..415.....867..3..5.......7.6......3..7..7.2.1.5',
+        '..6..7..5......9.37.3..8.1.....25..9...7.6...4..18.....7.9..5.16.5......2..4..7..',
+        '6.7.8.53...5...62..3.6..9.8...835...............941...5.6..4.8..29...4...48.7.2.5',
+        '....9.7.38.6.........31...476...91..2.5...9.7..12...851...37.........5.66.7.2....',
+        '....4..1.......3.6...16528....52...7.72...15.5...34....65418...9.1.......8..7....',
+        '162.3..........2..7.42.1....7..12..3...7.3...8..54..7....1.45.6..9..........7.312',
+        '6..7..2..3.......9..98...1...356..8.21.....96.6..173...7...59..1.......8..8..3..4',
+        '....42..3...7...9..325..8..5......7.2...6...5.6......8..5..792..8...4...4..19....',
+        '3.4.......9..6....5....396..197.8..6.76...19.4..9.627..476....9....3..8.......4.1',
+        '..34......51.7...268........2...5.4....239....7.8...1........239...6.15......48..',
+        '.4..6..2.6....4..58.75.......3.4.8.1.........7.6.8.3.......81.44..6....8.1..3..7.',
+        '......8..35.4...168..1.3.......3.27....8.9....75.6.......6.7..379...8.24..4......',
+    ),
+}
@@ -0,0 +1,32 @@
+import os
+import random
+import sys
+
+import pytest
+
+# The modules live flat in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Letters weighted roughly like the tile bag, so random words share prefixes and hook onto each other
+WORD_LETTERS = "EEEEEEEEEEEEAAAAAAAAAIIIIIIIIIOOOOOOOONNNNNNRRRRRRTTTTTTLLLLSSSSUUUUDDDDGGGBBCCMMPPFFHHVVWWYYKJXQZ"
+
+
+def random_words(count, seed=1):
+    """A sorted list of `count` made-up words of 2-8 letters"""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        length = rng.choice([2, 2, 3, 3, 3, 4, 4, 5, 5, 6, 7, 8])
+        words.add(''.join(rng.choice(WORD_LETTERS) for _ in range(length)))
+    return sorted(words)
+
+
+@pytest.fixture(scope='session')
+def words():
+    return random_words(1500)
+
+
+@pytest.fixture(scope='session')
+def lexicon(words):
+    from scrabble_lexicon import Lexicon
+    return Lexicon.from_words(words)
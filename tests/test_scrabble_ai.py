@@ -0,0 +1,20 @@
+from scrabble_ai import MonteCarloPlayer, choose_with_leave
+from scrabble_engine import ScrabbleEngine
+
+
+def test_simulation_pool_picks_one_of_the_moves(lexicon):
+    engine = ScrabbleEngine(lexicon, seed=3)
+    engine.fill_racks()
+    moves = engine.legal_moves()
+    player = MonteCarloPlayer(time_budget=0.5, workers=1, seed=1)
+    try:
+        assert player.choose(engine, moves) in moves
+    finally:
+        player.close()
+
+
+def test_leave_policy_picks_one_of_the_moves(lexicon):
+    engine = ScrabbleEngine(lexicon, seed=3)
+    engine.fill_racks()
+    moves = engine.legal_moves()
+    assert choose_with_leave(engine, moves) in moves
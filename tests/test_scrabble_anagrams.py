@@ -0,0 +1,48 @@
+import random
+from collections import Counter
+
+from scrabble_anagrams import AnagramIndex, MAX_BLANKS, signature
+
+
+def can_make(word, rack, board_letters='', through='', min_length=2):
+    """Brute-force version of AnagramIndex.find's rule for a single word"""
+    if len(word) < min_length:
+        return False
+    for through_letter in [None] + [letter for letter in set(through) if letter in word]:
+        from_rack = Counter(word) - Counter(board_letters) - Counter(through_letter or '')
+        short = from_rack - Counter(rack.replace('*', ''))
+        if sum(from_rack.values()) >= 1 and sum(short.values()) <= min(rack.count('*'), MAX_BLANKS):
+            return True
+    return False
+
+
+def test_anagrams_groups_words_by_letters(words):
+    index = AnagramIndex(words)
+    for word in words[:100]:
+        assert sorted(index.anagrams(word)) == sorted(w for w in words if signature(w) == signature(word))
+    assert index.anagrams('QQQQQQQ') == []
+
+
+def test_find_agrees_with_a_scan(words):
+    index = AnagramIndex(words)
+    rng = random.Random(3)
+    for _ in range(40):
+        rack = ''.join(rng.choice('AEIOUNRSTLDGBCM*') for _ in range(7))
+        board_letters = ''.join(rng.choice('AEST') for _ in range(rng.randrange(4)))
+        through = ''.join(rng.choice('AEIRST') for _ in range(rng.randrange(3)))
+        expected = [word for word in words if can_make(word, rack, board_letters, through)]
+        expected.sort(key=lambda word: (-len(word), word))
+        assert index.find(rack, board_letters, through) == expected
+
+
+def test_from_lexicon_matches_the_word_list(lexicon, words):
+    index = AnagramIndex.from_lexicon(lexicon)
+    assert sum(len(group) for group in index.words) == len(words)
+
+
+def test_find_needs_a_rack_tile_besides_the_board_and_through_letters():
+    index = AnagramIndex(['CAT', 'AT'])
+    assert index.find('XYZ', 'AT', 'C') == []
+    assert index.find('XYC', 'AT', 'C') == ['CAT']
+    assert index.find('XY*', 'AT', 'C') == ['CAT']
+    assert index.find('XYT', 'A', 'C') == ['CAT', 'AT']
@@ -0,0 +1,52 @@
+import random
+
+from scrabble_board import Board, BOARD_SIZE
+
+
+def test_incremental_cross_checks_match_a_full_refresh(lexicon):
+    rng = random.Random(7)
+    board = Board(lexicon)
+    placed = []
+    for _ in range(60):
+        if placed and rng.random() < 0.3:
+            board.remove([placed.pop(rng.randrange(len(placed)))])
+        else:
+            r, c = rng.randrange(BOARD_SIZE), rng.randrange(BOARD_SIZE)
+            if board.is_occupied(r, c):
+                continue
+            board.place([(r, c, rng.choice('AEINRST'))])
+            placed.append((r, c))
+
+        fresh = board.copy()
+        fresh.refresh_all()
+        assert board.cross_checks == fresh.cross_checks
+
+
+def test_cross_check_allows_only_hooking_letters(lexicon, words):
+    word = next(word for word in words if len(word) == 3 and lexicon.back_hooks(word))
+    board = Board(lexicon)
+    board.place([(7, 5 + i, letter) for i, letter in enumerate(word)])
+    # A vertical play through the square after the word must extend it into a word
+    mask = board.cross_checks['V'][7 * BOARD_SIZE + 8]
+    assert ''.join(chr(65 + i) for i in range(26) if mask >> i & 1) == lexicon.back_hooks(word)
+
+
+def test_anchors_surround_the_tiles(lexicon):
+    def anchors():
+        return {(r, c) for r in range(BOARD_SIZE) for c in range(BOARD_SIZE) if board.is_anchor(r, c)}
+
+    board = Board(lexicon)
+    assert anchors() == {(7, 7)}
+    board.place([(7, 7, 'A'), (7, 8, 'T')])
+    assert anchors() == {(7, 6), (7, 9), (6, 7), (8, 7), (6, 8), (8, 8)}
+    board.remove([(7, 7), (7, 8)])
+    assert anchors() == {(7, 7)}
+
+
+def test_copy_is_independent(lexicon):
+    board = Board(lexicon)
+    board.place([(7, 7, 'A')])
+    copy = board.copy()
+    copy.place([(7, 8, 'T')])
+    assert not board.is_occupied(7, 8)
+    assert copy.is_occupied(7, 7)
@@ -0,0 +1,62 @@
+import pytest
+
+from scrabble_engine import ScrabbleEngine, PlacementError
+from scrabble_movegen import Move
+
+
+def snapshot(engine):
+    board = engine.board
+    return (bytes(board.squares), list(board.row_bits), list(board.col_bits),
+            {direction: list(checks) for direction, checks in board.cross_checks.items()},
+            list(engine.tile_bag),
+            {player: list(rack) for player, rack in engine.racks.items()}, dict(engine.scores),
+            engine.current_turn, engine.first_move, engine.consecutive_passes, engine.game_over)
+
+
+def test_undo_restores_every_position(lexicon):
+    engine = ScrabbleEngine(lexicon, seed=11)
+    engine.fill_racks()
+    positions = []
+    for turn in range(8):
+        positions.append(snapshot(engine))
+        moves = engine.legal_moves()
+        if moves and turn != 3:
+            engine.apply(max(moves, key=engine.score_move))
+        else:
+            engine.pass_turn()
+    while positions:
+        engine.undo()
+        assert snapshot(engine) == positions.pop()
+    assert engine.undo() is None
+
+
+def test_build_move_checks_the_rules(lexicon):
+    engine = ScrabbleEngine(lexicon, seed=1)
+    engine.racks['player'] = list('CATS')
+    with pytest.raises(PlacementError):
+        engine.build_move('CAT', 0, 0, 'H')  # misses the centre
+    with pytest.raises(PlacementError):
+        engine.build_move('DOG', 7, 6, 'H')  # tiles not on the rack
+    move = engine.build_move('CAT', 7, 6, 'H')
+    assert [tile[:3] for tile in move.tiles] == [(7, 6, 'C'), (7, 7, 'A'), (7, 8, 'T')]
+    engine.apply(move)
+    engine.racks['ai'] = list('S')
+    with pytest.raises(PlacementError):
+        engine.build_move('CAB', 7, 6, 'H')  # does not match the board
+    assert engine.build_move('CATS', 7, 6, 'H').tiles == ((7, 9, 'S', False),)
+
+
+def test_lower_case_letters_are_blanks_and_a_bare_blank_is_refused(lexicon):
+    engine = ScrabbleEngine(lexicon, seed=1)
+    engine.racks['player'] = list('CT*')
+    assert engine.build_move('CaT', 7, 6, 'H').tiles == ((7, 6, 'C', False), (7, 7, 'A', True), (7, 8, 'T', False))
+    with pytest.raises(PlacementError):
+        engine.build_move('C*T', 7, 6, 'H')
+
+
+def test_words_formed_includes_cross_words(lexicon):
+    engine = ScrabbleEngine(lexicon, seed=1)
+    engine.board.place([(7, 6, 'C'), (7, 7, 'A'), (7, 8, 'T')])
+    move = Move('AX', 8, 7, 'H', ((8, 7, 'A', False), (8, 8, 'X', False)))
+    assert engine.words_formed(move) == ['AX', 'AA', 'TX']
+    assert engine.words_formed(Move('CATS', 7, 6, 'H', ((7, 9, 'S', False),))) == ['CATS']
@@ -0,0 +1,24 @@
+import pytest
+
+from scrabble_leaves import FILE_MAGIC, FILE_VERSION, HEADER, LeaveTable, heuristic_leave_value, leave_key
+
+
+def test_leave_key_ignores_tile_order():
+    assert leave_key("RETAIN") == leave_key("NIATER")
+    assert leave_key("AB") != leave_key("ABB")
+
+
+def test_missing_table_falls_back_to_heuristic(tmp_path):
+    path = tmp_path / "leaves.bin"
+    table = LeaveTable(str(path))
+    assert table.value("QU*") == heuristic_leave_value("QU*")
+    assert table.value("*UQ") == heuristic_leave_value("QU*")
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("keep", [0, 3, HEADER.size - 1, HEADER.size + 5])
+def test_load_rejects_truncated_files(tmp_path, keep):
+    path = tmp_path / "leaves.bin"
+    path.write_bytes((HEADER.pack(FILE_MAGIC, FILE_VERSION, 1) + bytes(6))[:keep])
+    with pytest.raises(ValueError):
+        LeaveTable(str(path)).value("AB")
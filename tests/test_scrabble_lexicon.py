@@ -0,0 +1,55 @@
+import re
+import string
+
+import pytest
+
+from scrabble_lexicon import Lexicon
+
+
+def test_contains_exactly_the_words(lexicon, words):
+    assert len(lexicon) == len(words)
+    assert all(word in lexicon for word in words)
+    prefixes = {word[:i] for word in words for i in range(1, len(word))} - set(words)
+    assert not any(prefix in lexicon for prefix in prefixes)
+    assert all(lexicon.is_prefix(prefix) for prefix in prefixes)
+
+
+def test_words_lists_the_lexicon_in_order(lexicon, words):
+    assert list(lexicon.words()) == words
+
+
+def test_hooks(lexicon, words):
+    word_set = set(words)
+    for word in words[:200]:
+        assert lexicon.back_hooks(word) == ''.join(l for l in string.ascii_uppercase if word + l in word_set)
+        assert lexicon.front_hooks(word) == ''.join(l for l in string.ascii_uppercase if l + word in word_set)
+
+
+def test_save_and_load_round_trip(lexicon, words, tmp_path):
+    path = str(tmp_path / 'words.dawg')
+    lexicon.save(path)
+    loaded = Lexicon.load(path)
+    try:
+        assert len(loaded) == len(words)
+        assert all(word in loaded for word in words)
+        assert 'QQQ' not in loaded
+    finally:
+        loaded.close()
+
+
+def test_matches_agrees_with_a_scan(lexicon, words):
+    for pattern in ('*A', 'E*', '**', 'A*E', '*I*E', '***'):
+        regex = re.compile(pattern.replace('*', '.') + '$')
+        assert lexicon.matches(pattern) == [word for word in words if regex.match(word)]
+
+
+@pytest.mark.parametrize('keep', [0, 3, 20, -4])
+def test_load_rejects_truncated_files(lexicon, tmp_path, keep):
+    path = str(tmp_path / 'words.dawg')
+    lexicon.save(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    with open(path, 'wb') as f:
+        f.write(data[:keep])
+    with pytest.raises(ValueError):
+        Lexicon.load(path)
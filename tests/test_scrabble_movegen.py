@@ -0,0 +1,116 @@
+import random
+import string
+from collections import Counter
+
+from scrabble_lexicon import Lexicon
+from scrabble_board import Board, BOARD_SIZE, CENTER_SQUARE
+from scrabble_movegen import MoveGenerator, SEARCH_ORDER
+
+from conftest import random_words
+
+
+def words_through(board, tiles):
+    """Every word of two or more letters that placing `tiles` would form"""
+    new = {(r, c): letter for r, c, letter in tiles}
+
+    def at(r, c):
+        return new.get((r, c)) or board.letter(r, c).upper()
+
+    words = []
+    for row, col in new:
+        for dr, dc in ((0, 1), (1, 0)):
+            r, c = row, col
+            while r - dr >= 0 and c - dc >= 0 and at(r - dr, c - dc):
+                r, c = r - dr, c - dc
+            word = ''
+            while r < BOARD_SIZE and c < BOARD_SIZE and at(r, c):
+                word += at(r, c)
+                r, c = r + dr, c + dc
+            if len(word) > 1:
+                words.append(word)
+    return words
+
+
+def brute_force_moves(board, lexicon, words, rack):
+    """Every legal play found by trying each word at each square, as sets of (row, col, letter)"""
+    have = Counter(rack)
+    on_board = Counter(board.letter(r, c).upper() for r in range(BOARD_SIZE) for c in range(BOARD_SIZE))
+    found = set()
+    for word in words:
+        if sum((Counter(word) - have - on_board).values()) > have['*']:
+            continue
+        for direction in 'HV':
+            dr, dc = (0, 1) if direction == 'H' else (1, 0)
+            for r in range(BOARD_SIZE - dr * (len(word) - 1)):
+                for c in range(BOARD_SIZE - dc * (len(word) - 1)):
+                    # The word must not run on into tiles at either end
+                    if r - dr >= 0 and c - dc >= 0 and board.is_occupied(r - dr, c - dc):
+                        continue
+                    end_r, end_c = r + dr * len(word), c + dc * len(word)
+                    if end_r < BOARD_SIZE and end_c < BOARD_SIZE and board.is_occupied(end_r, end_c):
+                        continue
+                    tiles = []
+                    for i, letter in enumerate(word):
+                        square = board.letter(r + dr * i, c + dc * i).upper()
+                        if not square:
+                            tiles.append((r + dr * i, c + dc * i, letter))
+                        elif square != letter:
+                            break
+                    else:
+                        if not tiles:
+                            continue
+                        need = Counter(letter for _, _, letter in tiles)
+                        if sum((need - have).values()) > have['*']:
+                            continue
+                        if board.is_empty():
+                            if CENTER_SQUARE not in [(tr, tc) for tr, tc, _ in tiles]:
+                                continue
+                        elif not any(0 <= tr + nr < BOARD_SIZE and 0 <= tc + nc < BOARD_SIZE
+                                     and board.is_occupied(tr + nr, tc + nc)
+                                     for tr, tc, _ in tiles for nr, nc in ((0, 1), (1, 0), (0, -1), (-1, 0))):
+                            continue
+                        if all(formed in lexicon for formed in words_through(board, tiles)):
+                            found.add(frozenset(tiles))
+    return found
+
+
+def test_generator_finds_every_move_once():
+    # A short word list keeps the brute-force scan quick
+    words = random_words(600, seed=2)
+    lexicon = Lexicon.from_words(words)
+    rng = random.Random(5)
+    board = Board(lexicon)
+    generator = MoveGenerator(lexicon)
+    for _ in range(6):
+        rack = [rng.choice('AEIOUNRSTLDGBCM*') for _ in range(7)]
+        moves = generator.generate(board, rack)
+        assert len(set(moves)) == len(moves)
+        found = {frozenset((r, c, letter) for r, c, letter, _ in move.tiles) for move in moves}
+        assert found == brute_force_moves(board, lexicon, words, rack)
+        if not moves:
+            break
+        board.place(max(moves, key=lambda move: len(move.tiles)).tiles)
+
+
+def test_every_move_forms_words_only(lexicon):
+    moves = MoveGenerator(lexicon).generate(Board(lexicon), list('AEINRST'))
+    assert moves
+    for move in moves:
+        assert move.word in lexicon
+        assert CENTER_SQUARE in [(r, c) for r, c, _, _ in move.tiles]
+
+
+def test_one_tile_play_is_listed_once_when_every_letter_hooks():
+    # Every letter hooks after the A, so the square's cross-check allows every letter
+    lexicon = Lexicon.from_words(['A' + letter for letter in string.ascii_uppercase] + ['BA', 'BE'])
+    board = Board(lexicon)
+    board.place([(7, 7, 'A'), (6, 8, 'B')])
+    moves = MoveGenerator(lexicon).generate(board, list('EQ'))
+    counts = Counter(move.tiles for move in moves)
+    assert counts[((7, 8, 'E', False),)] == 1
+    assert max(counts.values()) == 1
+
+
+def test_search_order_alternates_directions_over_every_line():
+    assert sorted(SEARCH_ORDER) == [(direction, i) for direction in 'HV' for i in range(BOARD_SIZE)]
+    assert [direction for direction, _ in SEARCH_ORDER] == ['H', 'V'] * BOARD_SIZE
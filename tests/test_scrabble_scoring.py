@@ -0,0 +1,44 @@
+from scrabble_board import Board
+from scrabble_movegen import Move
+from scrabble_scoring import score_move, tile_value, PREMIUM_LAYOUT, BINGO_BONUS
+
+
+def horizontal(word, row, col, board=None, blanks=()):
+    """A horizontal Move placing the letters of `word` that are not already on `board`"""
+    tiles = tuple((row, col + i, letter, i in blanks) for i, letter in enumerate(word)
+                  if board is None or not board.is_occupied(row, col + i))
+    return Move(word, row, col, 'H', tiles)
+
+
+def test_premium_layout_is_symmetric():
+    assert PREMIUM_LAYOUT[7][7] == 'double_word'
+    assert PREMIUM_LAYOUT[0][0] == 'triple_word'
+    assert all(PREMIUM_LAYOUT[r][c] == PREMIUM_LAYOUT[c][r] == PREMIUM_LAYOUT[14 - r][14 - c]
+               for r in range(15) for c in range(15))
+
+
+def test_first_word_on_the_centre_star():
+    # C 3 + A 1 + T 1, doubled by the centre square
+    assert score_move(Board(), horizontal('CAT', 7, 6)) == 10
+    assert score_move(Board(), horizontal('CAT', 7, 6, blanks={0})) == 4
+
+
+def test_cross_words_and_premiums_under_new_tiles_only():
+    board = Board()
+    board.place(horizontal('CAT', 7, 6).tiles)
+    # AX under AT: AX (1 + 8 on a double letter), AA (1 + 1) and TX (1 + 16); the centre's double word is used up
+    move = Move('AX', 8, 7, 'H', ((8, 7, 'A', False), (8, 8, 'X', False)))
+    assert score_move(board, move) == 17 + 2 + 17
+    assert score_move(board, horizontal('CATS', 7, 6, board)) == 6
+
+
+def test_bingo_bonus():
+    assert score_move(Board(), horizontal('RETAINS', 7, 4)) == 7 * 2 + BINGO_BONUS
+
+
+def test_blanks_on_the_board_score_nothing():
+    assert tile_value('Q') == 10
+    assert tile_value('q') == 0
+    board = Board()
+    board.place([(7, 6, 'c'), (7, 7, 'A'), (7, 8, 'T')])
+    assert score_move(board, horizontal('CATS', 7, 6, board)) == 3
@@ -0,0 +1,25 @@
+from scrabble_lexicon import Lexicon
+from scrabble_words import WordValidator
+
+
+def test_validator_checks_the_lexicon_and_caches_answers(lexicon, words):
+    validator = WordValidator(lexicon, max_entries=4)
+    assert validator.is_word(words[0].lower())
+    assert not validator.is_word('QQQQ')
+    assert validator.is_word(words[0])
+    assert (validator.hits, validator.misses) == (1, 2)
+    for word in words[1:10]:
+        validator.is_word(word)
+    assert len(validator._cache) == 4
+
+
+def test_invalid_words_lists_the_failures(lexicon, words):
+    validator = WordValidator(lexicon)
+    assert validator.invalid_words([words[0], 'QQQQ', words[1]]) == ['QQQQ']
+
+
+def test_expand_fills_blanks_from_the_lexicon():
+    validator = WordValidator(Lexicon.from_words(['CAT', 'COT', 'CUT', 'COAT', 'DOG']))
+    assert validator.expand('c*t') == ('CAT', 'COT', 'CUT')
+    assert validator.expand('**G') == ('DOG',)
+    assert validator.expand('Q*') == ()
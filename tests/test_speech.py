@@ -0,0 +1,37 @@
+from speech import SpeechService, PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_URGENT
+
+
+def queued(speech):
+    return [text for _, _, _, text in speech._queue]
+
+
+def test_queue_is_ordered_by_priority_then_age():
+    speech = SpeechService()
+    speech.say("rules", PRIORITY_LOW)
+    speech.say("move")
+    speech.say("game over", PRIORITY_URGENT)
+    speech.say("score")
+    assert queued(speech) == ["game over", "move", "score", "rules"]
+
+
+def test_same_key_replaces_the_older_utterance():
+    speech = SpeechService()
+    speech.say("Your score is now 10.", key='score')
+    speech.say("It's your turn now.")
+    speech.say("Your score is now 24.", key='score')
+    speech.say("It's your turn now.")
+    assert queued(speech) == ["Your score is now 24.", "It's your turn now."]
+
+
+def test_a_full_queue_drops_the_oldest_of_the_least_important():
+    speech = SpeechService(max_queued=4)
+    for line in range(3):
+        speech.say(f"rule {line}", PRIORITY_LOW)
+    speech.say("I placed the word CAT for 10 points.")
+    speech.say("My score is now 10.", PRIORITY_NORMAL)
+    assert queued(speech) == ["I placed the word CAT for 10 points.", "My score is now 10.", "rule 1", "rule 2"]
+    speech.say("It's your turn now.")
+    speech.say("You played 'DOG' for 5 points.")
+    speech.say("Your score is now 5.")
+    assert queued(speech) == ["My score is now 10.", "It's your turn now.",
+                              "You played 'DOG' for 5 points.", "Your score is now 5."]
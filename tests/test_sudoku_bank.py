@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from sudoku_bank import PuzzleBank, pack_puzzle, unpack_puzzle, write_bank
+from sudoku_generator import random_solution
+
+
+def grids(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        grid = random_solution(rng)
+        for i in rng.sample(range(81), 40):
+            grid[i // 9][i % 9] = 0
+        yield grid
+
+
+def test_pack_round_trip():
+    for grid in grids(5, 1):
+        assert unpack_puzzle(pack_puzzle(grid)) == grid
+
+
+def test_bank_round_trip(tmp_path):
+    puzzles = {'easy': list(grids(3, 2)), 'hard': list(grids(2, 3))}
+    path = str(tmp_path / 'puzzles.bank')
+    assert write_bank(puzzles, path) == 5
+    bank = PuzzleBank(path)
+    try:
+        assert bank.difficulties() == ['easy', 'hard']
+        assert bank.count('hard') == 2
+        assert bank.count('expert') == 0
+        assert [bank.puzzle('easy', i) for i in range(3)] == puzzles['easy']
+        assert bank.random_puzzle('hard') in puzzles['hard']
+        assert bank.random_puzzle('expert') is None
+    finally:
+        bank.close()
+
+
+@pytest.mark.parametrize("drop", [1, 20])
+def test_load_rejects_truncated_files(tmp_path, drop):
+    path = tmp_path / 'puzzles.bank'
+    write_bank({'easy': list(grids(2, 4))}, str(path))
+    path.write_bytes(path.read_bytes()[:-drop])
+    with pytest.raises(ValueError):
+        PuzzleBank(str(path)).difficulties()
@@ -0,0 +1,42 @@
+import random
+
+from sudoku_board import SudokuBoard
+from sudoku_generator import random_solution, generate_puzzle, carve_graded_puzzle, DIFFICULTY_CLUES
+from sudoku_grader import grade, LEVELS
+from sudoku_solver import count_solutions
+
+
+def test_random_solution_is_a_won_board():
+    rng = random.Random(1)
+    for _ in range(5):
+        assert SudokuBoard(random_solution(rng)).is_won()
+
+
+def test_generated_puzzles_have_one_solution():
+    for difficulty in DIFFICULTY_CLUES:
+        puzzle, solution, level = generate_puzzle(difficulty, seed=4)
+        assert level == grade(puzzle).difficulty
+        assert count_solutions(puzzle) == 1
+        assert all(puzzle[r][c] in (0, solution[r][c]) for r in range(9) for c in range(9))
+
+
+def test_a_seed_gives_the_same_puzzle():
+    assert generate_puzzle('medium', seed=7) == generate_puzzle('medium', seed=7)
+
+
+def test_easy_puzzles_grade_as_easy():
+    for seed in range(3):
+        assert generate_puzzle('easy', seed=seed).difficulty == 'easy'
+
+
+def test_graded_carving_never_overshoots_the_difficulty():
+    rng = random.Random(2)
+    for difficulty in LEVELS:
+        puzzle, level = carve_graded_puzzle(random_solution(rng), difficulty, rng)
+        assert grade(puzzle).difficulty == level
+        assert LEVELS.index(level) <= LEVELS.index(difficulty)
+
+
+def test_medium_and_expert_puzzles_grade_as_asked():
+    for difficulty in ('medium', 'expert'):
+        assert generate_puzzle(difficulty, seed=3, attempts=40).difficulty == difficulty
@@ -0,0 +1,46 @@
+import random
+
+from sudoku_generator import random_solution, carve_puzzle
+from sudoku_grader import grade, _grade_line, LEVELS, GUESS_POINTS
+from sudoku_solver import parse_grid
+
+
+def test_one_missing_cell_is_easy():
+    solution = random_solution(random.Random(1))
+    puzzle = [row[:] for row in solution]
+    puzzle[4][4] = 0
+    result = grade(puzzle)
+    assert result.solved
+    assert result.difficulty == 'easy'
+    assert sum(result.techniques.values()) == 1
+
+
+def test_graded_puzzles_are_consistent():
+    rng = random.Random(2)
+    for clues in (36, 26, 22):
+        for _ in range(5):
+            result = grade(carve_puzzle(random_solution(rng), clues, rng))
+            assert result.difficulty in LEVELS
+            if not result.solved:
+                assert result.difficulty == 'expert'
+                assert result.score >= GUESS_POINTS
+
+
+def test_an_empty_grid_needs_guessing():
+    result = grade(parse_grid('0' * 81))
+    assert result.difficulty == 'expert'
+    assert not result.solved
+
+
+def test_grade_line_skips_malformed_lines():
+    assert _grade_line('123') == ('123', None)
+    line = '003020600900305001001806400008102900700000008006708200002609500800203009005010300'
+    assert _grade_line(line)[1].difficulty in LEVELS
+
+
+def test_grids_without_a_solution_are_invalid():
+    for line in ('1' * 81, '11' + '0' * 79, '123456780' + '0' * 8 + '9' + '0' * 63):
+        result = grade(parse_grid(line))
+        assert result.difficulty is None
+        assert not result.solved
+        assert _grade_line(line) == (line, None)
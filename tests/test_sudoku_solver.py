@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from sudoku_board import SudokuBoard
+from sudoku_solver import parse_grid, format_grid, solve, solve_dlx, count_solutions, has_unique_solution
+
+PUZZLES = [
+    '003020600900305001001806400008102900700000008006708200002609500800203009005010300',
+    '4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......',
+    '8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..',
+]
+
+
+def random_puzzles(count, clues, seed=0):
+    """Puzzles with a unique solution made by emptying cells of a shuffled solved grid"""
+    rng = random.Random(seed)
+    digits = rng.sample(range(1, 10), 9)
+    solution = [[digits[(r * 3 + r // 3 + c) % 9] for c in range(9)] for r in range(9)]
+    while count:
+        puzzle = [row[:] for row in solution]
+        for i in rng.sample(range(81), 81 - clues):
+            puzzle[i // 9][i % 9] = 0
+        if has_unique_solution(puzzle):
+            count -= 1
+            yield puzzle, solution
+
+
+@pytest.mark.parametrize('line', PUZZLES)
+def test_search_and_algorithm_x_agree(line):
+    puzzle = parse_grid(line)
+    solution = solve(puzzle)
+    assert count_solutions(puzzle) == 1
+    assert solve_dlx(puzzle) == solution
+    assert solve(puzzle, engine='dlx') == solution
+    assert SudokuBoard(solution).is_won()
+    assert all(solution[r][c] == num for r, row in enumerate(puzzle) for c, num in enumerate(row) if num)
+
+
+def test_random_puzzles_solve_to_their_solution():
+    for puzzle, solution in random_puzzles(10, 34):
+        assert solve(puzzle) == solution
+        assert solve_dlx(puzzle) == solution
+
+
+def test_count_solutions():
+    assert count_solutions(parse_grid('0' * 81), 5) == 5
+    puzzle, solution = next(random_puzzles(1, 34, seed=1))
+    assert count_solutions(solution) == 1
+    puzzle[0] = [0] * 9
+    for row in puzzle[1:3]:
+        row[:] = [0] * 9
+    assert count_solutions(puzzle) == 2  # the top band's rows can swap
+
+
+def test_contradictions_have_no_solution():
+    repeated = '11' + '0' * 79
+    assert solve(parse_grid(repeated)) is None
+    assert solve_dlx(parse_grid(repeated)) is None
+    # Only 9 fits the top right cell, but column 9 already has one
+    hidden = '123456780' + '0' * 8 + '9' + '0' * 63
+    assert solve(parse_grid(hidden)) is None
+    assert solve_dlx(parse_grid(hidden)) is None
+    assert count_solutions(parse_grid(hidden)) == 0
+
+
+def test_parse_and_format_round_trip():
+    line = PUZZLES[1]
+    assert format_grid(parse_grid(line)) == line
+    assert parse_grid(line.replace('.', '0')) == parse_grid(line)
+    with pytest.raises(ValueError):
+        parse_grid(line[:-1])
@@ -0,0 +1,13 @@
+from sudoku_grader import grade, LEVELS
+from sudoku_solver import parse_grid, count_solutions
+from sudoku_starter_puzzles import STARTER_PUZZLES
+
+
+def test_starter_puzzles_grade_as_their_difficulty():
+    assert list(STARTER_PUZZLES) == list(LEVELS)
+    for difficulty, lines in STARTER_PUZZLES.items():
+        assert lines
+        for line in lines:
+            puzzle = parse_grid(line)
+            assert count_solutions(puzzle) == 1
+            assert grade(puzzle).difficulty == difficulty